@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import time
+import click
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATABASE = os.path.join(ROOT, "benchmarks", "data", "bench.db")
+DEFAULT_RESULTS = os.path.join(ROOT, "benchmarks", "results")
+
+
+def load_app(database):
+    """
+    Imports the app pointed at the benchmark database. The configuration is
+    read when main is imported, so the environment has to be set first.
+    """
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.abspath(database)
+    os.environ["JOB_WORKER_THREADS"] = "0"  # no background jobs competing for the DB
+    os.environ.pop("DATABASE_REPLICA_URL", None)
+    sys.path.insert(0, ROOT)
+    from main import app
+
+    return app
+
+
+@click.group()
+def cli():
+    """Synthetic data generation and route benchmarks (python -m benchmarks ...)."""
+
+
+@cli.command("generate")
+@click.option("--database", default=DEFAULT_DATABASE, show_default=True)
+@click.option("--faculties", default=10, show_default=True)
+@click.option("--cycles", default=4, show_default=True, help="Grant cycles per faculty.")
+@click.option("--researchers", default=2000, show_default=True)
+@click.option("--reviewers", default=200, show_default=True)
+@click.option("--proposals", default=50000, show_default=True)
+@click.option("--reports", default=2, show_default=True, help="Progress reports per awarded proposal.")
+@click.option("--notifications", default=500000, show_default=True)
+@click.option("--seed", default=1, show_default=True)
+@click.option("--force", is_flag=True, help="Replace an existing database file.")
+def generate_command(
+    database, faculties, cycles, researchers, reviewers, proposals, reports, notifications, seed, force
+):
+    """Create a new SQLite database filled with synthetic data."""
+    if os.path.exists(database):
+        if not force:
+            raise click.ClickException(f"{database} exists; pass --force to replace it")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(database + suffix):
+                os.remove(database + suffix)
+    os.makedirs(os.path.dirname(os.path.abspath(database)), exist_ok=True)
+
+    app = load_app(database)
+    from flask_migrate import upgrade
+    from models import db
+    from benchmarks.generate import generate
+
+    started = time.perf_counter()
+    with app.app_context():
+        db.create_all()
+        upgrade(directory=os.path.join(ROOT, "migrations"))
+        generate(
+            faculties=faculties,
+            cycles_per_faculty=cycles,
+            researchers=researchers,
+            reviewers=reviewers,
+            proposals=proposals,
+            reports_per_award=reports,
+            notifications=notifications,
+            seed=seed,
+            progress=lambda table, rows: click.echo(f"  {table}: {rows} rows"),
+        )
+    click.echo(f"Generated {database} in {time.perf_counter() - started:.1f}s.")
+
+
+@cli.command("run")
+@click.option("--database", default=DEFAULT_DATABASE, show_default=True)
+@click.option("--iterations", default=20, show_default=True, help="Requests per route.")
+@click.option("--role", "roles", multiple=True, help="Only these roles (repeatable).")
+@click.option("--output", default=DEFAULT_RESULTS, show_default=True, help="Results folder.")
+def run_command(database, iterations, roles, output):
+    """Time every role's key routes and save the results as JSON."""
+    if not os.path.exists(database):
+        raise click.ClickException(f"{database} not found; run `python -m benchmarks generate` first")
+    app = load_app(database)
+    from benchmarks.workload import run_workload
+
+    click.echo(f"{'route':<55} {'p50':>8} {'p95':>8} {'p99':>8} {'queries':>8}")
+
+    def progress(route, r):
+        failed = f"  {r['errors']} errors" if r["errors"] else ""
+        click.echo(
+            f"{route:<55} {r['p50_ms']:>6.1f}ms {r['p95_ms']:>6.1f}ms "
+            f"{r['p99_ms']:>6.1f}ms {r['queries']:>8.1f}{failed}"
+        )
+
+    results = run_workload(app, iterations=iterations, roles=roles, progress=progress)
+    os.makedirs(output, exist_ok=True)
+    path = os.path.join(
+        output, f"{time.strftime('%Y%m%d-%H%M%S')}-{results['commit'] or 'nogit'}.json"
+    )
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    click.echo(f"Saved {path}")
+
+
+@cli.command("compare")
+@click.argument("before", type=click.File())
+@click.argument("after", type=click.File())
+def compare_command(before, after):
+    """Compare p95 latency and query counts of two saved runs."""
+    from benchmarks.workload import compare_results
+
+    before, after = json.load(before), json.load(after)
+    click.echo(f"{before['commit']} -> {after['commit']}")
+    click.echo(f"{'route':<55} {'p95 before':>11} {'p95 after':>10} {'change':>8} {'queries':>12}")
+    for route, p95_before, p95_after, q_before, q_after in compare_results(before, after):
+        change = (p95_after - p95_before) / p95_before * 100 if p95_before else 0.0
+        click.echo(
+            f"{route:<55} {p95_before:>9.1f}ms {p95_after:>8.1f}ms {change:>+7.0f}% "
+            f"{q_before:>5.1f} -> {q_after:<5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    cli()
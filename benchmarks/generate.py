@@ -0,0 +1,305 @@
+import random
+from datetime import date, datetime, timedelta
+from sqlalchemy import insert, select, func
+from models import (
+    db,
+    User,
+    Admin,
+    Researcher,
+    Reviewer,
+    HOD,
+    Faculty,
+    ResearchArea,
+    GrantCycle,
+    Proposal,
+    ProposalVersion,
+    ProgressReport,
+    Deadline,
+    Notification,
+    Budget,
+    Grant,
+    bcrypt,
+)
+from services.ledger import rebuild_budget_ledger
+from services.notifications import recount_unread
+from services.search import rebuild_search_index
+from services.stats import rebuild_dashboard_stats
+
+
+# ==========================================
+# SYNTHETIC DATA GENERATOR
+# ==========================================
+# Fills an empty database with a university-sized data set. Rows are built as
+# plain dicts with explicit primary keys (so children can reference parents
+# without reading ids back) and written with executemany INSERTs in batches.
+# Bulk INSERTs skip the ORM flush listeners, so the derived tables (budget
+# ledger, unread counters, dashboard counters, search index) are rebuilt at
+# the end. The same seed and sizes always produce the same rows. Dates are
+# relative to `today`, so there are always open cycles and due deadlines.
+# Every generated account's password is BENCH_PASSWORD.
+BENCH_PASSWORD = "bench"
+BATCH_SIZE = 5000
+
+FACULTIES = ["FCI", "FOE", "FCM", "FOM", "FAC", "FCA", "FIST", "FET", "FOB", "FOL"]
+AREAS = [
+    "Artificial Intelligence",
+    "Cyber Security",
+    "Data Science",
+    "Software Engineering",
+    "Bioinformatics",
+    "Telecommunications",
+    "Renewable Energy",
+    "Financial Technology",
+    "Human-Computer Interaction",
+    "Media Law",
+]
+WORDS = (
+    "adaptive scalable secure distributed sustainable low-cost intelligent "
+    "framework model analysis platform sensing network learning system "
+    "monitoring optimisation evaluation design prototype study"
+).split()
+NAMES = (
+    "Aisyah Ahmad Tan Lim Wong Kumar Ravi Priya Siti Nur Hafiz Farah Chong Lee "
+    "Daniel Mei Ling Arjun Zainal Yusof Amir Chen Lakshmi Hassan Ong"
+).split()
+
+# (status, weight): roughly how proposals spread across the workflow
+STATUSES = [
+    ("Draft", 8),
+    ("Submitted", 10),
+    ("Under Review", 8),
+    ("Failed Screening", 6),
+    ("Passed Screening", 10),
+    ("Return for Reassignment", 2),
+    ("Pending HOD Approval", 8),
+    ("Rejected", 8),
+    ("Pending Grant", 5),
+    ("Approved", 25),
+    ("Completed", 6),
+    ("Terminated", 2),
+    ("Withdrawn", 2),
+]
+REVIEWED = {
+    "Passed Screening",
+    "Pending HOD Approval",
+    "Rejected",
+    "Pending Grant",
+    "Approved",
+    "Completed",
+    "Terminated",
+}
+AWARDED = {"Approved", "Completed", "Terminated"}
+
+
+def _batched(session, model, rows):
+    for start in range(0, len(rows), BATCH_SIZE):
+        session.execute(insert(model), rows[start : start + BATCH_SIZE])
+    return len(rows)
+
+
+def _title(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 7))).capitalize()
+
+
+def _person(rng):
+    return f"{rng.choice(NAMES)} {rng.choice(NAMES)}"
+
+
+def generate(
+    session=None,
+    faculties=10,
+    cycles_per_faculty=4,
+    researchers=2000,
+    reviewers=200,
+    proposals=50000,
+    reports_per_award=2,
+    notifications=500000,
+    seed=1,
+    today=None,
+    progress=None,
+):
+    """
+    Inserts the synthetic data set into an empty database and commits.
+    Returns {table name: rows inserted}.
+    """
+    session = session or db.session
+    if session.execute(select(func.count()).select_from(User)).scalar():
+        raise ValueError("The target database already has users; use an empty database")
+    rng = random.Random(seed)
+    today = today or date.today()
+    now = datetime.combine(today, datetime.min.time()) + timedelta(hours=9)
+    password = bcrypt.generate_password_hash(BENCH_PASSWORD).decode("utf-8")
+    counts = {}
+
+    def report(table, rows):
+        counts[table] = rows
+        if progress:
+            progress(table, rows)
+
+    # --- System data ---
+    faculty_names = [
+        FACULTIES[i] if i < len(FACULTIES) else f"F{i + 1:02d}" for i in range(faculties)
+    ]
+    report("faculty_list", _batched(session, Faculty, [dict(name=n) for n in faculty_names]))
+    report("research_area_list", _batched(session, ResearchArea, [dict(name=n) for n in AREAS]))
+
+    # --- Users: one admin and one HOD per faculty, shared reviewers, researchers ---
+    users, admins, hods, reviewer_rows, researcher_rows = [], [], [], [], []
+
+    def add_user(mmu_id, role, faculty):
+        users.append(
+            dict(
+                mmu_id=mmu_id,
+                name=_person(rng),
+                email=f"{mmu_id.lower()}@bench.mmu.edu.my",
+                password=password,
+                faculty=faculty,
+                user_role=role,
+            )
+        )
+
+    for i, faculty in enumerate(faculty_names):
+        add_user(f"BA{i + 1:06d}", "Admin", faculty)
+        admins.append(dict(admin_id=i + 1, mmu_id=f"BA{i + 1:06d}"))
+        add_user(f"BH{i + 1:06d}", "HOD", faculty)
+        hods.append(dict(hod_id=i + 1, mmu_id=f"BH{i + 1:06d}"))
+    for i in range(reviewers):
+        add_user(f"BV{i + 1:06d}", "Reviewer", rng.choice(faculty_names))
+        reviewer_rows.append(dict(reviewer_id=i + 1, mmu_id=f"BV{i + 1:06d}"))
+    for i in range(researchers):
+        add_user(f"BR{i + 1:06d}", "Researcher", rng.choice(faculty_names))
+        researcher_rows.append(dict(researcher_id=i + 1, mmu_id=f"BR{i + 1:06d}"))
+    report("user", _batched(session, User, users))
+    report("admin", _batched(session, Admin, admins))
+    report("hod", _batched(session, HOD, hods))
+    report("reviewer", _batched(session, Reviewer, reviewer_rows))
+    report("researcher", _batched(session, Researcher, researcher_rows))
+
+    # --- Grant cycles: the newest of each faculty is open ---
+    cycles = []
+    for f, faculty in enumerate(faculty_names):
+        for n in range(cycles_per_faculty):
+            age = cycles_per_faculty - 1 - n  # 0 = current cycle
+            start = today - timedelta(days=180 * age + 30)
+            cycles.append(
+                dict(
+                    cycle_id=len(cycles) + 1,
+                    cycle_name=f"{faculty} Research Grant {today.year - age}",
+                    faculty=faculty,
+                    start_date=start,
+                    end_date=start + timedelta(days=90 if age else 60),
+                    is_open=age == 0,
+                    admin_id=f + 1,
+                )
+            )
+    report("grant_cycle", _batched(session, GrantCycle, cycles))
+
+    # --- Proposals and everything hanging off them ---
+    statuses, weights = zip(*STATUSES)
+    rows, versions, grants, deadlines, reports = [], [], [], [], []
+    for proposal_id in range(1, proposals + 1):
+        cycle = rng.choice(cycles)
+        status = rng.choices(statuses, weights)[0]
+        budget = float(rng.randrange(5000, 200000, 500))
+        submitted = cycle["start_date"] + timedelta(days=rng.randint(0, 59))
+        scored = status in REVIEWED and not (status == "Passed Screening" and rng.random() < 0.5)
+        rows.append(
+            dict(
+                proposal_id=proposal_id,
+                title=_title(rng),
+                research_area=rng.choice(AREAS),
+                requested_budget=budget,
+                status=status,
+                submission_date=submitted,
+                document_file=None if status == "Draft" else f"bench-{proposal_id}.pdf",
+                review_score=rng.randint(40, 100) if scored else None,
+                review_feedback="Generated review feedback." if scored else None,
+                researcher_id=rng.randint(1, researchers),
+                cycle_id=cycle["cycle_id"],
+                assigned_reviewer_id=(
+                    rng.randint(1, reviewers) if status not in ("Draft", "Submitted") else None
+                ),
+                assigned_hod_id=(
+                    faculty_names.index(cycle["faculty"]) + 1 if status in REVIEWED else None
+                ),
+            )
+        )
+        if status != "Draft":
+            versions.append(
+                dict(
+                    proposal_id=proposal_id,
+                    version_number=1,
+                    document_file=f"bench-{proposal_id}.pdf",
+                    title_snapshot=rows[-1]["title"],
+                    research_area_snapshot=rows[-1]["research_area"],
+                    budget_snapshot=budget,
+                    upload_date=datetime.combine(submitted, datetime.min.time()),
+                    version_note="Initial submission",
+                )
+            )
+        if status in AWARDED:
+            awarded = datetime.combine(submitted, datetime.min.time()) + timedelta(days=30)
+            grants.append(dict(grant_amount=budget, award_date=awarded, proposal_id=proposal_id))
+            deadlines.append(
+                dict(
+                    proposal_id=proposal_id,
+                    deadline_type="Final Submission",
+                    due_date=today + timedelta(days=rng.randint(-30, 365)),
+                )
+            )
+            for n in range(reports_per_award):
+                reports.append(
+                    dict(
+                        proposal_id=proposal_id,
+                        title=f"Progress Report {n + 1}",
+                        content="Generated progress update.",
+                        financial_usage=round(budget * rng.uniform(0.05, 0.4), 2),
+                        status=rng.choice(["Submitted", "Validated", "Requires Revision"]),
+                        submission_date=awarded + timedelta(days=60 * (n + 1)),
+                    )
+                )
+    report("proposal", _batched(session, Proposal, rows))
+    report("proposal_version", _batched(session, ProposalVersion, versions))
+    report("grant", _batched(session, Grant, grants))
+    report("deadline", _batched(session, Deadline, deadlines))
+    report("progress_report", _batched(session, ProgressReport, reports))
+
+    # Enough funding for every grant, added by the admins over time
+    awarded_total = sum(g["grant_amount"] for g in grants)
+    budgets = [
+        dict(
+            amount=round(awarded_total * 1.5 / len(admins), 2),
+            description=f"Annual research allocation ({admin['mmu_id']})",
+            created_at=now - timedelta(days=365),
+            admin_id=admin["mmu_id"],
+        )
+        for admin in admins
+    ]
+    report("budget", _batched(session, Budget, budgets))
+
+    # --- Notifications, mostly read, spread over the last year ---
+    mmu_ids = [u["mmu_id"] for u in users]
+    written = 0
+    while written < notifications:
+        batch = [
+            dict(
+                recipient_id=rng.choice(mmu_ids),
+                sender_id=None,
+                message=f"Proposal '{_title(rng)}' was updated.",
+                link=None,
+                is_read=rng.random() < 0.8,
+                timestamp=now - timedelta(minutes=rng.randint(0, 525600)),
+            )
+            for _ in range(min(BATCH_SIZE, notifications - written))
+        ]
+        session.execute(insert(Notification), batch)
+        written += len(batch)
+    report("notification", written)
+
+    # --- Derived tables the ORM listeners would normally maintain ---
+    rebuild_budget_ledger(session)
+    recount_unread(session)
+    rebuild_dashboard_stats(session)
+    rebuild_search_index(session)
+    session.commit()
+    return counts
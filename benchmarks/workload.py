@@ -0,0 +1,193 @@
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import time
+from sqlalchemy import select, func
+from models import db, User, Admin, Researcher, Reviewer, HOD, GrantCycle, Proposal
+from services.profiling import query_stats, reset_query_stats
+
+
+# ==========================================
+# SCRIPTED WORKLOAD
+# ==========================================
+# Replays every role's key pages through the Flask test client, signed in as
+# the busiest user of that role (the most proposals, so the heaviest pages).
+# Each route is requested once to warm caches, then `iterations` times;
+# latency percentiles come from the client's wall-clock time and query counts
+# from services/profiling.py. Placeholders like {cycle_id} are filled from
+# the chosen users' data.
+ROUTES = {
+    "Admin": [
+        "/admin/dashboard",
+        "/admin/users",
+        "/admin/users?search=tan",
+        "/admin/proposals",
+        "/admin/proposals?search=secure",
+        "/admin/proposals/cycle/{cycle_id}",
+        "/admin/proposals/view/{proposal_id}",
+        "/admin/budget",
+        "/admin/system_data",
+        "/notifications",
+    ],
+    "HOD": [
+        "/hod/dashboard",
+        "/hod/proposals",
+        "/hod/proposals/view/{hod_proposal_id}",
+        "/hod/grant_allocation",
+        "/hod/grant_budget",
+        "/hod/assigned_research",
+        "/notifications",
+    ],
+    "Reviewer": [
+        "/reviewer/dashboard",
+        "/reviewer/proposals",
+        "/reviewer/proposals?search=model",
+        "/reviewer/evaluation_list",
+        "/notifications",
+    ],
+    "Researcher": [
+        "/researcher/dashboard",
+        "/researcher/my_proposals",
+        "/researcher/apply",
+        "/researcher/profile",
+        "/notifications",
+    ],
+}
+
+
+def _busiest(column):
+    return db.session.execute(
+        select(column).where(column != None).group_by(column).order_by(func.count().desc())
+    ).scalars().first()
+
+
+def pick_actors():
+    """({role: mmu_id}, {placeholder: value}) for the users the workload signs in as."""
+    researcher = db.session.get(Researcher, _busiest(Proposal.researcher_id))
+    reviewer = db.session.get(Reviewer, _busiest(Proposal.assigned_reviewer_id))
+    hod = db.session.get(HOD, _busiest(Proposal.assigned_hod_id))
+    cycle = db.session.get(GrantCycle, _busiest(Proposal.cycle_id))
+    admin = db.session.execute(
+        select(Admin).join(User, User.mmu_id == Admin.mmu_id).where(User.faculty == cycle.faculty)
+    ).scalars().first() or db.session.execute(select(Admin)).scalars().first()
+
+    def first_proposal(*criteria):
+        return db.session.execute(
+            select(Proposal.proposal_id).where(*criteria).order_by(Proposal.proposal_id)
+        ).scalar()
+
+    actors = {
+        "Admin": admin.mmu_id,
+        "HOD": hod.mmu_id,
+        "Reviewer": reviewer.mmu_id,
+        "Researcher": researcher.mmu_id,
+    }
+    params = dict(
+        cycle_id=cycle.cycle_id,
+        proposal_id=first_proposal(Proposal.cycle_id == cycle.cycle_id, Proposal.status != "Draft"),
+        hod_proposal_id=first_proposal(Proposal.assigned_hod_id == hod.hod_id),
+    )
+    return actors, params
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def dataset_counts():
+    tables = ["user", "grant_cycle", "proposal", "progress_report", "notification"]
+    return {
+        name: db.session.execute(select(func.count()).select_from(db.metadata.tables[name])).scalar()
+        for name in tables
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_workload(app, iterations=20, roles=None, progress=None):
+    """
+    Runs the workload against `app`'s database. Returns a JSON-serialisable
+    dict with the environment, data set size and per-route results.
+    """
+    with app.app_context():
+        actors, params = pick_actors()
+        dataset = dataset_counts()
+        db.session.remove()
+
+    client = app.test_client()
+    results = {}
+    for role, routes in ROUTES.items():
+        if roles and role not in roles:
+            continue
+        with client.session_transaction() as cookie:
+            cookie.clear()
+            cookie["user_id"] = actors[role]
+            cookie["role"] = role
+        for route in routes:
+            url = route.format(**params)
+            client.get(url)  # warm-up
+            reset_query_stats()
+            timings, errors = [], 0
+            for _ in range(iterations):
+                started = time.perf_counter()
+                response = client.get(url)
+                timings.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    errors += 1
+            timings.sort()
+            endpoints = query_stats()
+            requests = sum(row["requests"] for row in endpoints) or 1
+            results[f"{role} {route}"] = dict(
+                url=url,
+                endpoint=endpoints[0]["endpoint"] if endpoints else None,
+                p50_ms=percentile(timings, 50) * 1000,
+                p95_ms=percentile(timings, 95) * 1000,
+                p99_ms=percentile(timings, 99) * 1000,
+                mean_ms=statistics.fmean(timings) * 1000,
+                queries=sum(row["queries"] for row in endpoints) / requests,
+                db_ms=sum(row["db_ms"] for row in endpoints) / requests,
+                errors=errors,
+            )
+            if progress:
+                progress(f"{role} {route}", results[f"{role} {route}"])
+
+    return dict(
+        commit=git_commit(),
+        created=time.strftime("%Y-%m-%dT%H:%M:%S"),
+        python=platform.python_version(),
+        sqlite=sqlite3.sqlite_version,
+        database=app.config["SQLALCHEMY_DATABASE_URI"].split("@")[-1],
+        iterations=iterations,
+        dataset=dataset,
+        routes=results,
+    )
+
+
+def compare_results(before, after):
+    """Rows of (route, p95 before, p95 after, queries before, queries after) for shared routes."""
+    return [
+        (
+            route,
+            before["routes"][route]["p95_ms"],
+            result["p95_ms"],
+            before["routes"][route]["queries"],
+            result["queries"],
+        )
+        for route, result in after["routes"].items()
+        if route in before["routes"]
+    ]
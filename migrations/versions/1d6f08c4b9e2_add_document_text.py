@@ -0,0 +1,52 @@
+"""add extracted document text and its search table
+
+Revision ID: 1d6f08c4b9e2
+Revises: e5a93b7c2d48
+Create Date: 2026-10-17 14:05:12.640927
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1d6f08c4b9e2'
+down_revision = 'e5a93b7c2d48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('document_text'):
+        op.create_table(
+            'document_text',
+            sa.Column('doc_id', sa.Integer(), nullable=False),
+            sa.Column('filename', sa.String(length=100), nullable=False),
+            sa.Column('content_hash', sa.String(length=64), nullable=True),
+            sa.Column('file_size', sa.Integer(), nullable=True),
+            sa.Column('file_mtime', sa.Float(), nullable=True),
+            sa.Column('status', sa.String(length=20), nullable=False),
+            sa.Column('error', sa.String(length=255), nullable=True),
+            sa.Column('text', sa.Text(), nullable=True),
+            sa.Column('extracted_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('doc_id'),
+            sa.UniqueConstraint('filename'),
+        )
+    op.create_index(
+        'ix_document_text_hash', 'document_text', ['content_hash'], if_not_exists=True
+    )
+
+    # Text itself is filled by `flask extract-documents`; FTS5 is SQLite-only
+    if bind.dialect.name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS document_search USING fts5("
+            "body, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS document_search")
+    op.drop_index('ix_document_text_hash', table_name='document_text')
+    op.drop_table('document_text')
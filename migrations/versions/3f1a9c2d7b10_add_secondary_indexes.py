@@ -0,0 +1,64 @@
+"""add secondary indexes for dashboard and list queries
+
+Revision ID: 3f1a9c2d7b10
+Revises: 5e0c2a7d9b14
+Create Date: 2026-10-17 09:12:41.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1a9c2d7b10'
+down_revision = '5e0c2a7d9b14'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns) - kept in sync with __table_args__ in models.py
+INDEXES = [
+    ("ix_user_role_faculty", "user", ["user_role", "faculty"]),
+    ("ix_admin_mmu_id", "admin", ["mmu_id"]),
+    ("ix_researcher_mmu_id", "researcher", ["mmu_id"]),
+    ("ix_reviewer_mmu_id", "reviewer", ["mmu_id"]),
+    ("ix_hod_mmu_id", "hod", ["mmu_id"]),
+    ("ix_grant_cycle_open_end_date", "grant_cycle", ["is_open", "end_date"]),
+    ("ix_grant_cycle_faculty_start_date", "grant_cycle", ["faculty", "start_date"]),
+    ("ix_proposal_hod_status", "proposal", ["assigned_hod_id", "status"]),
+    ("ix_proposal_reviewer_status", "proposal", ["assigned_reviewer_id", "status"]),
+    ("ix_proposal_researcher_status", "proposal", ["researcher_id", "status"]),
+    ("ix_proposal_cycle_status", "proposal", ["cycle_id", "status"]),
+    ("ix_proposal_status_submission_date", "proposal", ["status", "submission_date"]),
+    ("ix_proposal_submission_date", "proposal", ["submission_date"]),
+    (
+        "ix_proposal_version_proposal_number",
+        "proposal_version",
+        ["proposal_id", "version_number"],
+    ),
+    (
+        "ix_progress_report_proposal_date",
+        "progress_report",
+        ["proposal_id", "submission_date"],
+    ),
+    ("ix_deadline_proposal_type", "deadline", ["proposal_id", "deadline_type"]),
+    (
+        "ix_notification_recipient_read_time",
+        "notification",
+        ["recipient_id", "is_read", "timestamp"],
+    ),
+    ("ix_budget_created_at", "budget", ["created_at"]),
+    ("ix_grant_proposal", "grant", ["proposal_id"]),
+    ("ix_grant_award_date", "grant", ["award_date"]),
+]
+
+
+def upgrade():
+    # Databases created through db.create_all() already carry these indexes
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False, if_not_exists=True)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
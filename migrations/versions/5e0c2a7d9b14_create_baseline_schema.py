@@ -0,0 +1,177 @@
+"""create the baseline schema
+
+Revision ID: 5e0c2a7d9b14
+Revises:
+Create Date: 2026-10-17 08:30:12.407715
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0c2a7d9b14'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+# The tables as db.create_all() built them before migrations were added, so
+# `flask db upgrade` can build a database from nothing (SQLite or
+# PostgreSQL). Databases created by the old create_all() already have them
+# and skip this step.
+def _tables():
+    return [
+        (
+            'user',
+            sa.Column('mmu_id', sa.String(length=15), nullable=False),
+            sa.Column('name', sa.String(length=150), nullable=False),
+            sa.Column('email', sa.String(length=100), nullable=False),
+            sa.Column('password', sa.String(length=100), nullable=False),
+            sa.Column('faculty', sa.String(length=100), nullable=False),
+            sa.Column('user_role', sa.String(length=25), nullable=False),
+            sa.Column('profile_image', sa.String(length=20), nullable=False),
+            sa.Column('phone_number', sa.String(length=20), nullable=True),
+            sa.PrimaryKeyConstraint('mmu_id'),
+            sa.UniqueConstraint('email'),
+        ),
+        (
+            'faculty_list',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('name'),
+        ),
+        (
+            'research_area_list',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('name', sa.String(length=100), nullable=False),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('name'),
+        ),
+        *[
+            (
+                table,
+                sa.Column(f'{table}_id', sa.Integer(), nullable=False),
+                sa.Column('mmu_id', sa.String(length=15), nullable=False),
+                sa.ForeignKeyConstraint(['mmu_id'], ['user.mmu_id']),
+                sa.PrimaryKeyConstraint(f'{table}_id'),
+            )
+            for table in ('admin', 'researcher', 'reviewer', 'hod')
+        ],
+        (
+            'budget',
+            sa.Column('budget_id', sa.Integer(), nullable=False),
+            sa.Column('amount', sa.Float(), nullable=False),
+            sa.Column('description', sa.String(length=255), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('admin_id', sa.String(length=50), nullable=False),
+            sa.ForeignKeyConstraint(['admin_id'], ['user.mmu_id']),
+            sa.PrimaryKeyConstraint('budget_id'),
+        ),
+        (
+            'notification',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('recipient_id', sa.String(length=15), nullable=False),
+            sa.Column('sender_id', sa.String(length=15), nullable=True),
+            sa.Column('message', sa.String(length=255), nullable=False),
+            sa.Column('link', sa.String(length=255), nullable=True),
+            sa.Column('is_read', sa.Boolean(), nullable=True),
+            sa.Column('timestamp', sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(['recipient_id'], ['user.mmu_id']),
+            sa.ForeignKeyConstraint(['sender_id'], ['user.mmu_id']),
+            sa.PrimaryKeyConstraint('id'),
+        ),
+        (
+            'grant_cycle',
+            sa.Column('cycle_id', sa.Integer(), nullable=False),
+            sa.Column('cycle_name', sa.String(length=50), nullable=False),
+            sa.Column('faculty', sa.String(length=100), nullable=False),
+            sa.Column('start_date', sa.Date(), nullable=False),
+            sa.Column('end_date', sa.Date(), nullable=False),
+            sa.Column('is_open', sa.Boolean(), nullable=False),
+            sa.Column('admin_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['admin_id'], ['admin.admin_id']),
+            sa.PrimaryKeyConstraint('cycle_id'),
+        ),
+        (
+            'proposal',
+            sa.Column('proposal_id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=255), nullable=False),
+            sa.Column('research_area', sa.String(length=100), nullable=False),
+            sa.Column('requested_budget', sa.Float(), nullable=False),
+            sa.Column('status', sa.String(length=30), nullable=False),
+            sa.Column('submission_date', sa.Date(), nullable=True),
+            sa.Column('document_file', sa.String(length=100), nullable=True),
+            sa.Column('review_score', sa.Integer(), nullable=True),
+            sa.Column('review_feedback', sa.Text(), nullable=True),
+            sa.Column('review_draft', sa.Text(), nullable=True),
+            sa.Column('researcher_id', sa.Integer(), nullable=False),
+            sa.Column('cycle_id', sa.Integer(), nullable=False),
+            sa.Column('assigned_reviewer_id', sa.Integer(), nullable=True),
+            sa.Column('assigned_hod_id', sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(['assigned_hod_id'], ['hod.hod_id']),
+            sa.ForeignKeyConstraint(['assigned_reviewer_id'], ['reviewer.reviewer_id']),
+            sa.ForeignKeyConstraint(['cycle_id'], ['grant_cycle.cycle_id']),
+            sa.ForeignKeyConstraint(['researcher_id'], ['researcher.researcher_id']),
+            sa.PrimaryKeyConstraint('proposal_id'),
+        ),
+        (
+            'deadline',
+            sa.Column('deadline_id', sa.Integer(), nullable=False),
+            sa.Column('proposal_id', sa.Integer(), nullable=False),
+            sa.Column('deadline_type', sa.String(length=30), nullable=False),
+            sa.Column('due_date', sa.Date(), nullable=False),
+            sa.ForeignKeyConstraint(['proposal_id'], ['proposal.proposal_id']),
+            sa.PrimaryKeyConstraint('deadline_id'),
+        ),
+        (
+            'grant',
+            sa.Column('grant_id', sa.Integer(), nullable=False),
+            sa.Column('grant_amount', sa.Float(), nullable=False),
+            sa.Column('award_date', sa.DateTime(), nullable=True),
+            sa.Column('proposal_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['proposal_id'], ['proposal.proposal_id']),
+            sa.PrimaryKeyConstraint('grant_id'),
+        ),
+        (
+            'progress_report',
+            sa.Column('report_id', sa.Integer(), nullable=False),
+            sa.Column('proposal_id', sa.Integer(), nullable=False),
+            sa.Column('title', sa.String(length=200), nullable=False),
+            sa.Column('content', sa.Text(), nullable=False),
+            sa.Column('financial_usage', sa.Float(), nullable=False),
+            sa.Column('document_file', sa.String(length=100), nullable=True),
+            sa.Column('status', sa.String(length=50), nullable=True),
+            sa.Column('submission_date', sa.DateTime(), nullable=True),
+            sa.Column('hod_feedback', sa.Text(), nullable=True),
+            sa.ForeignKeyConstraint(['proposal_id'], ['proposal.proposal_id']),
+            sa.PrimaryKeyConstraint('report_id'),
+        ),
+        (
+            'proposal_version',
+            sa.Column('version_id', sa.Integer(), nullable=False),
+            sa.Column('proposal_id', sa.Integer(), nullable=False),
+            sa.Column('version_number', sa.Integer(), nullable=False),
+            sa.Column('document_file', sa.String(length=100), nullable=False),
+            sa.Column('title_snapshot', sa.String(length=255), nullable=False),
+            sa.Column('research_area_snapshot', sa.String(length=100), nullable=False),
+            sa.Column('budget_snapshot', sa.Float(), nullable=False),
+            sa.Column('upload_date', sa.DateTime(), nullable=True),
+            sa.Column('version_note', sa.String(length=255), nullable=True),
+            sa.ForeignKeyConstraint(['proposal_id'], ['proposal.proposal_id']),
+            sa.PrimaryKeyConstraint('version_id'),
+        ),
+    ]
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    for name, *elements in _tables():
+        if not inspector.has_table(name):
+            op.create_table(name, *elements)
+
+
+def downgrade():
+    for name, *_ in reversed(_tables()):
+        op.drop_table(name)
@@ -0,0 +1,58 @@
+"""add reference-counted document blobs
+
+Revision ID: 6a2c5e81f0d3
+Revises: 1d6f08c4b9e2
+Create Date: 2026-10-17 14:52:37.215480
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a2c5e81f0d3'
+down_revision = '1d6f08c4b9e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if sa.inspect(bind).has_table('document_blob'):
+        return
+
+    op.create_table(
+        'document_blob',
+        sa.Column('filename', sa.String(length=100), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=True),
+        sa.Column('size', sa.Integer(), nullable=True),
+        sa.Column('ref_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('filename'),
+    )
+    op.create_index(
+        'ix_document_blob_content_hash', 'document_blob', ['content_hash']
+    )
+
+    # Existing uploads keep their random names; count who references them
+    op.execute(
+        """
+        INSERT INTO document_blob (filename, ref_count)
+        SELECT filename, COUNT(*) FROM (
+            SELECT document_file AS filename FROM proposal
+                WHERE document_file IS NOT NULL
+            UNION ALL
+            SELECT document_file FROM proposal_version
+                WHERE document_file IS NOT NULL
+            UNION ALL
+            SELECT document_file FROM progress_report
+                WHERE document_file IS NOT NULL
+        ) AS refs
+        GROUP BY filename
+        """
+    )
+
+
+def downgrade():
+    op.drop_index('ix_document_blob_content_hash', table_name='document_blob')
+    op.drop_table('document_blob')
@@ -0,0 +1,48 @@
+"""add budget ledger running totals
+
+Revision ID: 8b2e4d6f1a37
+Revises: 3f1a9c2d7b10
+Create Date: 2026-10-17 10:41:05.552310
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6f1a37'
+down_revision = '3f1a9c2d7b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('budget_ledger'):
+        op.create_table(
+            'budget_ledger',
+            sa.Column('ledger_id', sa.Integer(), nullable=False),
+            sa.Column('total_funds_in', sa.Float(), nullable=False),
+            sa.Column('total_grants_out', sa.Float(), nullable=False),
+            sa.Column('total_approved_requested', sa.Float(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('ledger_id'),
+        )
+
+    # Seed the single ledger row from the existing data
+    op.execute("DELETE FROM budget_ledger")
+    op.execute(
+        """
+        INSERT INTO budget_ledger
+            (ledger_id, total_funds_in, total_grants_out, total_approved_requested)
+        SELECT 1,
+            (SELECT COALESCE(SUM(amount), 0) FROM budget),
+            (SELECT COALESCE(SUM(grant_amount), 0) FROM "grant"),
+            (SELECT COALESCE(SUM(requested_budget), 0) FROM proposal
+                WHERE status = 'Approved')
+        """
+    )
+
+
+def downgrade():
+    op.drop_table('budget_ledger')
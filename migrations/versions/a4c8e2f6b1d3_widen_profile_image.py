@@ -0,0 +1,35 @@
+"""widen user.profile_image for hashed and longer-extension picture names
+
+Revision ID: a4c8e2f6b1d3
+Revises: f3b9d1c7a2e6
+Create Date: 2026-10-17 21:05:12.418230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4c8e2f6b1d3'
+down_revision = 'f3b9d1c7a2e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite does not enforce VARCHAR lengths; server databases do
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+
+    op.alter_column(
+        'user', 'profile_image', type_=sa.String(100), existing_type=sa.String(20)
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+
+    op.alter_column(
+        'user', 'profile_image', type_=sa.String(20), existing_type=sa.String(100)
+    )
@@ -0,0 +1,47 @@
+"""add deadline reminder log for the batch sweep
+
+Revision ID: b7d3f5a9e1c4
+Revises: 9c4e7a1b2d58
+Create Date: 2026-10-17 17:21:45.119034
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3f5a9e1c4'
+down_revision = '9c4e7a1b2d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing = {ix['name'] for ix in inspector.get_indexes('deadline')}
+    if 'ix_deadline_type_due_date' not in existing:
+        op.create_index(
+            'ix_deadline_type_due_date', 'deadline', ['deadline_type', 'due_date']
+        )
+
+    if inspector.has_table('deadline_reminder'):
+        return
+    op.create_table(
+        'deadline_reminder',
+        sa.Column('reminder_id', sa.Integer(), nullable=False),
+        sa.Column('proposal_id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('reminder_date', sa.Date(), nullable=False),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['proposal_id'], ['proposal.proposal_id']),
+        sa.PrimaryKeyConstraint('reminder_id'),
+        sa.UniqueConstraint(
+            'proposal_id', 'kind', 'reminder_date', name='uq_deadline_reminder'
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table('deadline_reminder')
+    op.drop_index('ix_deadline_type_due_date', table_name='deadline')
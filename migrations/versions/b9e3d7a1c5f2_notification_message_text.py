@@ -0,0 +1,45 @@
+"""store notification messages as text
+
+Revision ID: b9e3d7a1c5f2
+Revises: a4c8e2f6b1d3
+Create Date: 2026-10-17 21:14:40.176552
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b9e3d7a1c5f2'
+down_revision = 'a4c8e2f6b1d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Messages quote proposal titles and free-text reasons, which can run past
+    # 255 characters; SQLite never enforced the limit, server databases do
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+
+    op.alter_column(
+        'notification',
+        'message',
+        type_=sa.Text(),
+        existing_type=sa.String(255),
+        existing_nullable=False,
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+
+    op.alter_column(
+        'notification',
+        'message',
+        type_=sa.String(255),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        postgresql_using='left(message, 255)',
+    )
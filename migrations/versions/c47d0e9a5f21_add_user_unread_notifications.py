@@ -0,0 +1,45 @@
+"""add denormalized unread notification counter to user
+
+Revision ID: c47d0e9a5f21
+Revises: 8b2e4d6f1a37
+Create Date: 2026-10-17 11:58:27.903614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47d0e9a5f21'
+down_revision = '8b2e4d6f1a37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    columns = [c['name'] for c in sa.inspect(op.get_bind()).get_columns('user')]
+    if 'unread_notifications' not in columns:
+        with op.batch_alter_table('user', schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column(
+                    'unread_notifications',
+                    sa.Integer(),
+                    nullable=False,
+                    server_default='0',
+                )
+            )
+
+    op.execute(
+        """
+        UPDATE "user" SET unread_notifications = (
+            SELECT COUNT(*) FROM notification
+            WHERE notification.recipient_id = "user".mmu_id
+              AND notification.is_read = false
+        )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('user', schema=None) as batch_op:
+        batch_op.drop_column('unread_notifications')
@@ -0,0 +1,83 @@
+"""use exact NUMERIC money columns and timezone-aware timestamps
+
+Revision ID: d2a8c6e4f7b9
+Revises: b7d3f5a9e1c4
+Create Date: 2026-10-17 18:40:03.552917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a8c6e4f7b9'
+down_revision = 'b7d3f5a9e1c4'
+branch_labels = None
+depends_on = None
+
+
+MONEY_COLUMNS = [
+    ('proposal', 'requested_budget'),
+    ('proposal_version', 'budget_snapshot'),
+    ('progress_report', 'financial_usage'),
+    ('budget', 'amount'),
+    ('grant', 'grant_amount'),
+    ('budget_ledger', 'total_funds_in'),
+    ('budget_ledger', 'total_grants_out'),
+    ('budget_ledger', 'total_approved_requested'),
+]
+
+TIMESTAMP_COLUMNS = [
+    ('proposal_version', 'upload_date'),
+    ('progress_report', 'submission_date'),
+    ('deadline_reminder', 'sent_at'),
+    ('notification', 'timestamp'),
+    ('budget', 'created_at'),
+    ('grant', 'award_date'),
+    ('budget_ledger', 'updated_at'),
+    ('document_text', 'extracted_at'),
+    ('document_blob', 'created_at'),
+    ('job', 'run_at'),
+    ('job', 'locked_at'),
+    ('job', 'created_at'),
+    ('job', 'finished_at'),
+]
+
+
+def upgrade():
+    # SQLite stores both the same way whatever the declared type, so only
+    # server databases (e.g. PostgreSQL built before this revision) change
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column, type_=sa.Numeric(12, 2), existing_type=sa.Float()
+        )
+    # Existing naive values were written in Malaysia time
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            postgresql_using=f'"{column}" AT TIME ZONE \'Asia/Kuala_Lumpur\'',
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        return
+
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            postgresql_using=f'"{column}" AT TIME ZONE \'Asia/Kuala_Lumpur\'',
+        )
+    for table, column in MONEY_COLUMNS:
+        op.alter_column(
+            table, column, type_=sa.Float(), existing_type=sa.Numeric(12, 2)
+        )
@@ -0,0 +1,59 @@
+"""add FTS5 full-text search tables for proposals, users and cycles
+
+Revision ID: e5a93b7c2d48
+Revises: c47d0e9a5f21
+Create Date: 2026-10-17 13:20:44.118305
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a93b7c2d48'
+down_revision = 'c47d0e9a5f21'
+branch_labels = None
+depends_on = None
+
+
+FTS_OPTIONS = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+
+SEARCH_TABLES = {
+    'proposal_search': (
+        "title, research_area, researcher_name",
+        "rowid, title, research_area, researcher_name",
+        """
+        SELECT p.proposal_id, p.title, p.research_area, u.name FROM proposal p
+        LEFT JOIN researcher r ON r.researcher_id = p.researcher_id
+        LEFT JOIN "user" u ON u.mmu_id = r.mmu_id
+        """,
+    ),
+    'user_search': (
+        "mmu_id UNINDEXED, name, email",
+        "mmu_id, name, email",
+        'SELECT u.mmu_id, u.name, u.email FROM "user" u',
+    ),
+    'grant_cycle_search': (
+        "cycle_name",
+        "rowid, cycle_name",
+        "SELECT c.cycle_id, c.cycle_name FROM grant_cycle c",
+    ),
+}
+
+
+def upgrade():
+    # FTS5 is SQLite-only; other backends search with ilike instead
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for name, (columns, insert_columns, source) in SEARCH_TABLES.items():
+        op.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({columns}, {FTS_OPTIONS})"
+        )
+        op.execute(f"DELETE FROM {name}")
+        op.execute(f"INSERT INTO {name} ({insert_columns}) {source}")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for name in SEARCH_TABLES:
+        op.execute(f"DROP TABLE IF EXISTS {name}")
@@ -0,0 +1,37 @@
+"""add precomputed dashboard statistics
+
+Revision ID: f3b9d1c7a2e6
+Revises: d2a8c6e4f7b9
+Create Date: 2026-10-17 19:26:50.730614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b9d1c7a2e6'
+down_revision = 'd2a8c6e4f7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if sa.inspect(bind).has_table('dashboard_stat'):
+        return
+
+    # Counters are seeded from the data the first time a dashboard is opened
+    # (or by `flask --app main rebuild-dashboard-stats`)
+    op.create_table(
+        'dashboard_stat',
+        sa.Column('scope', sa.String(length=20), nullable=False),
+        sa.Column('scope_id', sa.String(length=100), nullable=False),
+        sa.Column('metric', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('scope', 'scope_id', 'metric'),
+    )
+
+
+def downgrade():
+    op.drop_table('dashboard_stat')
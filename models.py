@@ -1,8 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from datetime import datetime, timedelta, timezone
+from services.replica import RoutingSession
 
-db = SQLAlchemy()
+# Sessions can route reporting reads to a replica (services/replica.py)
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 bcrypt = Bcrypt()
 
 
@@ -14,6 +16,18 @@ def malaysia_now():
     return datetime.now(timezone(timedelta(hours=8)))
 
 
+# ==========================================
+# COLUMN TYPES
+# ==========================================
+# Money is stored as an exact NUMERIC(12, 2) (PostgreSQL keeps it exact; SQLite
+# stores it as a number). Values still come back as float, which the existing
+# budget arithmetic and templates expect.
+Money = db.Numeric(12, 2, asdecimal=False)
+# Timestamps keep their UTC offset (timestamptz on PostgreSQL). SQLite has no
+# timezone storage and returns them as naive Malaysia time, as before.
+Timestamp = db.DateTime(timezone=True)
+
+
 # --- USER TABLE ---
 class User(db.Model):
     __tablename__ = "user"
@@ -23,8 +37,14 @@ class User(db.Model):
     password = db.Column(db.String(100), nullable=False)
     faculty = db.Column(db.String(100), nullable=False)
     user_role = db.Column(db.String(25), nullable=False)
-    profile_image = db.Column(db.String(20), nullable=False, default="default.jpg")
+    profile_image = db.Column(db.String(100), nullable=False, default="default.jpg")
     phone_number = db.Column(db.String(20), nullable=True)
+    # Denormalized count of unread notifications (see services/notifications.py)
+    unread_notifications = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+
+    __table_args__ = (db.Index("ix_user_role_faculty", "user_role", "faculty"),)
 
     # Relationships
     admin_profile = db.relationship(
@@ -51,26 +71,34 @@ class User(db.Model):
 class Admin(db.Model):
     __tablename__ = "admin"
     admin_id = db.Column(db.Integer, primary_key=True)
-    mmu_id = db.Column(db.String(15), db.ForeignKey("user.mmu_id"), nullable=False)
+    mmu_id = db.Column(
+        db.String(15), db.ForeignKey("user.mmu_id"), nullable=False, index=True
+    )
 
 
 class Researcher(db.Model):
     __tablename__ = "researcher"
     researcher_id = db.Column(db.Integer, primary_key=True)
-    mmu_id = db.Column(db.String(15), db.ForeignKey("user.mmu_id"), nullable=False)
+    mmu_id = db.Column(
+        db.String(15), db.ForeignKey("user.mmu_id"), nullable=False, index=True
+    )
     proposals = db.relationship("Proposal", backref="researcher", lazy=True)
 
 
 class Reviewer(db.Model):
     __tablename__ = "reviewer"
     reviewer_id = db.Column(db.Integer, primary_key=True)
-    mmu_id = db.Column(db.String(15), db.ForeignKey("user.mmu_id"), nullable=False)
+    mmu_id = db.Column(
+        db.String(15), db.ForeignKey("user.mmu_id"), nullable=False, index=True
+    )
 
 
 class HOD(db.Model):
     __tablename__ = "hod"
     hod_id = db.Column(db.Integer, primary_key=True)
-    mmu_id = db.Column(db.String(15), db.ForeignKey("user.mmu_id"), nullable=False)
+    mmu_id = db.Column(
+        db.String(15), db.ForeignKey("user.mmu_id"), nullable=False, index=True
+    )
 
 
 # --- SYSTEM DATA ---
@@ -98,13 +126,18 @@ class GrantCycle(db.Model):
     admin_id = db.Column(db.Integer, db.ForeignKey("admin.admin_id"), nullable=False)
     proposals = db.relationship("Proposal", backref="cycle", lazy=True)
 
+    __table_args__ = (
+        db.Index("ix_grant_cycle_open_end_date", "is_open", "end_date"),
+        db.Index("ix_grant_cycle_faculty_start_date", "faculty", "start_date"),
+    )
+
 
 class Proposal(db.Model):
     __tablename__ = "proposal"
     proposal_id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
     research_area = db.Column(db.String(100), nullable=False, default="General")
-    requested_budget = db.Column(db.Float, nullable=False)
+    requested_budget = db.Column(Money, nullable=False)
     status = db.Column(db.String(30), nullable=False, default="Draft")
     submission_date = db.Column(db.Date, default=malaysia_now)
     document_file = db.Column(db.String(100), nullable=True)
@@ -129,6 +162,16 @@ class Proposal(db.Model):
         "Deadline", backref="proposal", cascade="all, delete-orphan"
     )
 
+    # Every list/dashboard route filters on one owner column plus status
+    __table_args__ = (
+        db.Index("ix_proposal_hod_status", "assigned_hod_id", "status"),
+        db.Index("ix_proposal_reviewer_status", "assigned_reviewer_id", "status"),
+        db.Index("ix_proposal_researcher_status", "researcher_id", "status"),
+        db.Index("ix_proposal_cycle_status", "cycle_id", "status"),
+        db.Index("ix_proposal_status_submission_date", "status", "submission_date"),
+        db.Index("ix_proposal_submission_date", "submission_date"),
+    )
+
 
 class ProposalVersion(db.Model):
     __tablename__ = "proposal_version"
@@ -140,14 +183,20 @@ class ProposalVersion(db.Model):
     document_file = db.Column(db.String(100), nullable=False)
     title_snapshot = db.Column(db.String(255), nullable=False)
     research_area_snapshot = db.Column(db.String(100), nullable=False)
-    budget_snapshot = db.Column(db.Float, nullable=False)
-    upload_date = db.Column(db.DateTime, default=malaysia_now)
+    budget_snapshot = db.Column(Money, nullable=False)
+    upload_date = db.Column(Timestamp, default=malaysia_now)
     version_note = db.Column(db.String(255), nullable=True)
     proposal = db.relationship(
         "Proposal",
         backref=db.backref("versions", lazy=True, cascade="all, delete-orphan"),
     )
 
+    __table_args__ = (
+        db.Index(
+            "ix_proposal_version_proposal_number", "proposal_id", "version_number"
+        ),
+    )
+
 
 class ProgressReport(db.Model):
     __tablename__ = "progress_report"
@@ -157,14 +206,18 @@ class ProgressReport(db.Model):
     )
     title = db.Column(db.String(200), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    financial_usage = db.Column(db.Float, nullable=False)
+    financial_usage = db.Column(Money, nullable=False)
     document_file = db.Column(db.String(100), nullable=True)
     status = db.Column(db.String(50), default="Submitted")
-    submission_date = db.Column(db.DateTime, default=malaysia_now)
+    submission_date = db.Column(Timestamp, default=malaysia_now)
     hod_feedback = db.Column(db.Text, nullable=True)
 
     proposal = db.relationship("Proposal", backref="reports")
 
+    __table_args__ = (
+        db.Index("ix_progress_report_proposal_date", "proposal_id", "submission_date"),
+    )
+
 
 class Deadline(db.Model):
     __tablename__ = "deadline"
@@ -175,6 +228,40 @@ class Deadline(db.Model):
     deadline_type = db.Column(db.String(30), nullable=False)
     due_date = db.Column(db.Date, nullable=False)
 
+    __table_args__ = (
+        db.Index("ix_deadline_proposal_type", "proposal_id", "deadline_type"),
+        db.Index("ix_deadline_type_due_date", "deadline_type", "due_date"),
+    )
+
+
+class DeadlineReminder(db.Model):
+    """
+    One reminder sent by the deadline sweep (services/deadlines.py).
+    The unique (proposal_id, kind, reminder_date) key is what stops a reminder
+    being sent twice: kind "due_soon" is keyed by the day it was sent (one a
+    day), "overdue" by the due date it refers to (once per deadline).
+    """
+
+    __tablename__ = "deadline_reminder"
+    reminder_id = db.Column(db.Integer, primary_key=True)
+    proposal_id = db.Column(
+        db.Integer, db.ForeignKey("proposal.proposal_id"), nullable=False
+    )
+    kind = db.Column(db.String(20), nullable=False)
+    reminder_date = db.Column(db.Date, nullable=False)
+    sent_at = db.Column(Timestamp, default=malaysia_now)
+
+    proposal = db.relationship(
+        "Proposal",
+        backref=db.backref("deadline_reminders", cascade="all, delete-orphan"),
+    )
+
+    __table_args__ = (
+        db.UniqueConstraint(
+            "proposal_id", "kind", "reminder_date", name="uq_deadline_reminder"
+        ),
+    )
+
 
 class Notification(db.Model):
     __tablename__ = "notification"
@@ -183,10 +270,10 @@ class Notification(db.Model):
         db.String(15), db.ForeignKey("user.mmu_id"), nullable=False
     )
     sender_id = db.Column(db.String(15), db.ForeignKey("user.mmu_id"), nullable=True)
-    message = db.Column(db.String(255), nullable=False)
+    message = db.Column(db.Text, nullable=False)
     link = db.Column(db.String(255), nullable=True)
     is_read = db.Column(db.Boolean, default=False)
-    timestamp = db.Column(db.DateTime, default=malaysia_now)
+    timestamp = db.Column(Timestamp, default=malaysia_now)
 
     recipient = db.relationship(
         "User", foreign_keys=[recipient_id], backref="notifications_received"
@@ -195,23 +282,34 @@ class Notification(db.Model):
         "User", foreign_keys=[sender_id], backref="notifications_sent"
     )
 
+    __table_args__ = (
+        db.Index(
+            "ix_notification_recipient_read_time",
+            "recipient_id",
+            "is_read",
+            "timestamp",
+        ),
+    )
+
 
 class Budget(db.Model):
     __tablename__ = "budget"
     budget_id = db.Column(db.Integer, primary_key=True)
-    amount = db.Column(db.Float, nullable=False)
+    amount = db.Column(Money, nullable=False)
     description = db.Column(db.String(255), nullable=False)
-    created_at = db.Column(db.DateTime, default=malaysia_now)
+    created_at = db.Column(Timestamp, default=malaysia_now)
 
     admin_id = db.Column(db.String(50), db.ForeignKey("user.mmu_id"), nullable=False)
     admin = db.relationship("User", backref="budgets_added")
 
+    __table_args__ = (db.Index("ix_budget_created_at", "created_at"),)
+
 
 class Grant(db.Model):
     __tablename__ = "grant"
     grant_id = db.Column(db.Integer, primary_key=True)
-    grant_amount = db.Column(db.Float, nullable=False)
-    award_date = db.Column(db.DateTime, default=malaysia_now)
+    grant_amount = db.Column(Money, nullable=False)
+    award_date = db.Column(Timestamp, default=malaysia_now)
 
     proposal_id = db.Column(
         db.Integer, db.ForeignKey("proposal.proposal_id"), nullable=False
@@ -219,3 +317,106 @@ class Grant(db.Model):
     proposal = db.relationship(
         "Proposal", backref=db.backref("grant_award", uselist=False)
     )
+
+    __table_args__ = (
+        db.Index("ix_grant_proposal", "proposal_id"),
+        db.Index("ix_grant_award_date", "award_date"),
+    )
+
+
+class BudgetLedger(db.Model):
+    """
+    Single-row running totals for the system budget.
+    Maintained by services/ledger.py whenever Budget, Grant or Proposal rows change.
+    """
+
+    __tablename__ = "budget_ledger"
+    ledger_id = db.Column(db.Integer, primary_key=True)
+    total_funds_in = db.Column(Money, nullable=False, default=0.0)
+    total_grants_out = db.Column(Money, nullable=False, default=0.0)
+    total_approved_requested = db.Column(Money, nullable=False, default=0.0)
+    updated_at = db.Column(Timestamp, default=malaysia_now, onupdate=malaysia_now)
+
+
+class DocumentText(db.Model):
+    """
+    Plain text extracted from an uploaded proposal / progress report file.
+    Filled in the background by services/extraction.py and indexed for search.
+    """
+
+    __tablename__ = "document_text"
+    doc_id = db.Column(db.Integer, primary_key=True)
+    filename = db.Column(db.String(100), unique=True, nullable=False)
+    # sha256 of the file contents the text was extracted from
+    content_hash = db.Column(db.String(64), nullable=True)
+    file_size = db.Column(db.Integer, nullable=True)
+    file_mtime = db.Column(db.Float, nullable=True)
+    # ok | empty | unsupported | unavailable | missing | error
+    status = db.Column(db.String(20), nullable=False, default="ok")
+    error = db.Column(db.String(255), nullable=True)
+    text = db.Column(db.Text, nullable=True)
+    extracted_at = db.Column(Timestamp, default=malaysia_now, onupdate=malaysia_now)
+
+    __table_args__ = (db.Index("ix_document_text_hash", "content_hash"),)
+
+
+class DocumentBlob(db.Model):
+    """
+    One stored document file in static/proposal_docs.
+    New uploads are named by their sha256, so identical files share a blob;
+    ref_count tracks how many Proposal / ProposalVersion / ProgressReport rows
+    point at it (maintained by services/storage.py).
+    """
+
+    __tablename__ = "document_blob"
+    filename = db.Column(db.String(100), primary_key=True)
+    # Null for files uploaded before content addressing
+    content_hash = db.Column(db.String(64), nullable=True, index=True)
+    size = db.Column(db.Integer, nullable=True)
+    ref_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    created_at = db.Column(Timestamp, default=malaysia_now)
+
+
+class Job(db.Model):
+    """
+    A unit of background work (services/jobs.py). Rows are claimed by worker
+    threads in this process or by `flask --app main run-worker` processes.
+    """
+
+    __tablename__ = "job"
+    job_id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)
+    # JSON keyword arguments for the handler
+    payload = db.Column(db.Text, nullable=False, default="{}")
+    # Optional de-duplication key: only one queued / running job per key
+    key = db.Column(db.String(100), nullable=True)
+    # queued | running | done | failed
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    run_at = db.Column(Timestamp, nullable=False, default=malaysia_now)
+    locked_by = db.Column(db.String(100), nullable=True)
+    locked_at = db.Column(Timestamp, nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(Timestamp, default=malaysia_now)
+    finished_at = db.Column(Timestamp, nullable=True)
+
+    __table_args__ = (
+        db.Index("ix_job_status_run_at", "status", "run_at"),
+        db.Index("ix_job_key", "key"),
+    )
+
+
+class DashboardStat(db.Model):
+    """
+    Precomputed dashboard counter, e.g. ("reviewer", "3", "status:Passed Screening").
+    Scopes: global, faculty, hod, reviewer, researcher. Kept in step with the
+    Proposal / Grant / GrantCycle tables by services/stats.py.
+    """
+
+    __tablename__ = "dashboard_stat"
+    scope = db.Column(db.String(20), primary_key=True)
+    # Faculty name or hod / reviewer / researcher id ("" for global)
+    scope_id = db.Column(db.String(100), primary_key=True)
+    metric = db.Column(db.String(50), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
@@ -1,4 +1,4 @@
-from flask import Blueprint, render_template, redirect, url_for, request, session, flash
+from flask import Blueprint, render_template, redirect, url_for, request, session, flash, current_app
 from sqlalchemy import func
 from datetime import datetime, timedelta
 from models import (
@@ -17,10 +17,22 @@ from models import (
     ResearchArea,
 )
 from utils import get_myt_date, send_notification, update_user_profile
+from services.ledger import get_budget_ledger
+from services.queries import with_listing_options
+from services.pagination import paginate_listing
+from services.search import search_filter, search_rank
+from services.replica import read_replica
+from services.stats import dashboard_stats, StatusHistogram
+from services.profiling import query_stats, reset_query_stats
+from services.imports import read_upload, import_users
+from services.uploads import UploadRejected
 
 # Define the Blueprint for Admin-related routes
 admin_bp = Blueprint("admin", __name__)
 
+# Roles an admin may create accounts for from the bulk upload page
+BULK_ROLES = ["Researcher", "Reviewer", "HOD"]
+
 # ==============================================================================
 # 1. AUTHENTICATION
 # ==============================================================================
@@ -59,6 +71,7 @@ def admin_login():
 
 
 @admin_bp.route("/admin/dashboard")
+@read_replica
 def admin_dashboard():
     """
     Displays the Admin Dashboard with key statistics and upcoming deadlines.
@@ -70,17 +83,14 @@ def admin_dashboard():
     user = User.query.get(session["user_id"])
 
     # --- 1. Budget Statistics ---
-    try:
-        # Sum of all funds added to the system
-        total_fund_capacity = db.session.query(func.sum(Budget.amount)).scalar() or 0
-    except:
-        total_fund_capacity = 0
-
-    # Calculate utilized funds (Sum of approved grants)
-    awarded_proposals = Proposal.query.filter_by(status="Approved").all()
-    funds_utilized = (
-        sum(p.requested_budget for p in awarded_proposals) if awarded_proposals else 0
-    )
+    # Running totals are kept by the budget ledger, so this is a single-row read
+    ledger = get_budget_ledger()
+
+    # Sum of all funds added to the system
+    total_fund_capacity = ledger.total_funds_in
+
+    # Calculate utilized funds (Sum of requested budgets for approved proposals)
+    funds_utilized = ledger.total_approved_requested
 
     # Calculate utilization percentage for the progress bar
     funds_utilized_percent = 0
@@ -104,7 +114,8 @@ def admin_dashboard():
 
     # --- 3. Recent Activity ---
     recent_proposals = (
-        Proposal.query.filter(Proposal.status != "Draft")
+        with_listing_options(Proposal.query)
+        .filter(Proposal.status != "Draft")
         .order_by(Proposal.submission_date.desc())
         .limit(5)
         .all()
@@ -125,15 +136,17 @@ def admin_dashboard():
         "Pending Grant",  # With HOD (Allocation)
     ]
 
+    # Precomputed counters (services/stats.py), read in one query
+    counters = dashboard_stats("global")
+    statuses = StatusHistogram.from_counters(counters)
+
     # Aggregate statistics dictionary
     stats = {
         "open_cycles": active_cycles_count,
-        "total_cycles": GrantCycle.query.count(),
-        "new_proposals": Proposal.query.filter_by(status="Submitted").count(),
-        "under_review": Proposal.query.filter(
-            Proposal.status.in_(under_review_statuses)
-        ).count(),
-        "awarded": Proposal.query.filter_by(status="Approved").count(),
+        "total_cycles": counters["cycles"],
+        "new_proposals": statuses.count("Submitted"),
+        "under_review": statuses.count(*under_review_statuses),
+        "awarded": statuses.count("Approved"),
     }
 
     return render_template(
@@ -189,20 +202,21 @@ def admin_user_management():
     filter_faculty = request.args.get("faculty", "")
 
     # Pagination setup
-    page = request.args.get("page", 1, type=int)
     per_page = 8
 
     # Build the database query dynamically based on filters
     query = User.query
+    order = []
     if search_query:
-        query = query.filter(User.name.ilike(f"%{search_query}%"))
+        query = query.filter(search_filter(User, search_query))
+        order = search_rank(User, search_query)
     if filter_role:
         query = query.filter_by(user_role=filter_role)
     if filter_faculty:
         query = query.filter_by(faculty=filter_faculty)
 
     # Execute query with pagination
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    pagination = paginate_listing(query, order, per_page=per_page)
 
     return render_template(
         "admin_user_management.html",
@@ -269,6 +283,65 @@ def admin_create_user():
     )
 
 
+@admin_bp.route("/admin/users/bulk", methods=["GET", "POST"])
+def admin_bulk_create_users():
+    """
+    Creates many users from one uploaded CSV or JSON file (mmu_id, name,
+    email, faculty, role, password). All rows are checked together against
+    existing MMU IDs and emails, and the page lists what happened to each
+    row. Clients that ask for application/json get that report as JSON
+    instead, with status 400 when no row was usable.
+    """
+    if session.get("role") != "Admin":
+        return redirect(url_for("admin.admin_login"))
+
+    wants_json = request.accept_mimetypes.best == "application/json"
+    result = None
+    if request.method == "POST":
+        upload = request.files.get("users_file")
+        try:
+            if not upload or not upload.filename:
+                raise UploadRejected("Choose a CSV or JSON file to upload.")
+            records = read_upload(upload)["users"]
+            if not records:
+                raise UploadRejected("The file has no user rows (it needs an mmu_id column).")
+        except UploadRejected as e:
+            if wants_json:
+                return {"error": str(e)}, 400
+            flash(f"Error: {e}", "error")
+            return redirect(url_for("admin.admin_bulk_create_users"))
+
+        # Same choices as the single-user form: no Admin accounts, known faculties
+        result = import_users(
+            records,
+            role=request.form.get("role") or None,
+            default_password=request.form.get("default_password") or None,
+            roles=BULK_ROLES,
+            faculties={f.name for f in Faculty.query.all()},
+        )
+        if wants_json:
+            report = {
+                "created": result.created,
+                "summary": result.summary(),
+                "rows": [
+                    dict(line=line, mmu_id=mmu_id, status=status, message=message)
+                    for line, mmu_id, status, message in result.rows
+                ],
+            }
+            return report, 400 if result.count("invalid") == len(result.rows) else 200
+        flash(
+            f"Bulk upload finished: {result.summary()}.",
+            "success" if result.created else "info",
+        )
+
+    return render_template(
+        "admin_bulk_create_users.html",
+        user=User.query.get(session["user_id"]),
+        roles=BULK_ROLES,
+        result=result,
+    )
+
+
 @admin_bp.route("/admin/users/edit/<string:user_id>", methods=["GET", "POST"])
 def admin_edit_user(user_id):
     """
@@ -343,22 +416,31 @@ def admin_proposal_management():
 
     search_query = request.args.get("search", "")
     filter_faculty = request.args.get("faculty", "")
-    page = request.args.get("page", 1, type=int)
     per_page = 6
 
     query = GrantCycle.query
+    order = [GrantCycle.start_date.desc()]
     if search_query:
-        query = query.filter(GrantCycle.cycle_name.ilike(f"%{search_query}%"))
+        query = query.filter(search_filter(GrantCycle, search_query))
+        order = search_rank(GrantCycle, search_query) + order
     if filter_faculty:
         query = query.filter(GrantCycle.faculty == filter_faculty)
 
-    pagination = query.order_by(GrantCycle.start_date.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    pagination = paginate_listing(query, order, per_page=per_page)
+
+    # Submitted (non-draft) proposal count per cycle on this page, in one query
+    cycle_ids = [c.cycle_id for c in pagination.items]
+    proposal_counts = dict(
+        db.session.query(Proposal.cycle_id, func.count(Proposal.proposal_id))
+        .filter(Proposal.cycle_id.in_(cycle_ids), Proposal.status != "Draft")
+        .group_by(Proposal.cycle_id)
+        .all()
     )
 
     return render_template(
         "admin_proposal_management.html",
         cycles=pagination.items,
+        proposal_counts=proposal_counts,
         pagination=pagination,
         user=User.query.get(session["user_id"]),
         faculties=Faculty.query.all(),
@@ -424,17 +506,16 @@ def admin_view_cycle_proposals(cycle_id):
     filter_area = request.args.get("area", "")
     filter_status = request.args.get("status", "")
     sort_option = request.args.get("sort", "newest")
-    page = request.args.get("page", 1, type=int)
     per_page = 8
 
     # 2. BASE QUERY (Exclude Drafts - Admins should not see unfinished work)
-    query = Proposal.query.filter(
+    query = with_listing_options(Proposal.query).filter(
         Proposal.cycle_id == cycle.cycle_id, Proposal.status != "Draft"
     )
 
     # 3. APPLY FILTERS
     if search_proposal:
-        query = query.filter(Proposal.title.ilike(f"%{search_proposal}%"))
+        query = query.filter(search_filter(Proposal, search_proposal))
 
     if filter_area and filter_area != "all":
         query = query.filter(Proposal.research_area == filter_area)
@@ -444,17 +525,19 @@ def admin_view_cycle_proposals(cycle_id):
 
     # 4. APPLY SORTING
     if sort_option == "oldest":
-        query = query.order_by(Proposal.proposal_id.asc())
+        order = [Proposal.proposal_id.asc()]
     elif sort_option == "title_asc":
-        query = query.order_by(Proposal.title.asc())
+        order = [Proposal.title.asc()]
     elif sort_option == "status_asc":
-        query = query.order_by(Proposal.status.asc())
+        order = [Proposal.status.asc()]
+    elif sort_option == "relevance" and search_proposal:
+        order = search_rank(Proposal, search_proposal)
     else:
         # Default: Newest (Highest ID first)
-        query = query.order_by(Proposal.proposal_id.desc())
+        order = [Proposal.proposal_id.desc()]
 
     # Execute Pagination
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    pagination = paginate_listing(query, order, per_page=per_page)
 
     return render_template(
         "admin_cycle_proposals.html",
@@ -619,9 +702,8 @@ def admin_set_final_deadline(proposal_id):
 
             dl.due_date = datetime.strptime(final_date, "%Y-%m-%d").date()
             db.session.add(dl)
-            db.session.commit()
 
-            # Notify Researcher
+            # Notify Researcher (committed together with the deadline)
             msg = f"Project Update: Final submission deadline set for '{proposal.title}' to {final_date}."
             link = url_for("researcher.researcher_my_proposals")
             send_notification(
@@ -630,6 +712,7 @@ def admin_set_final_deadline(proposal_id):
                 link,
                 sender_id=session["user_id"],
             )
+            db.session.commit()
             flash("Final Submission Deadline Set!", "success")
             return redirect(
                 url_for("admin.admin_view_proposal", proposal_id=proposal.proposal_id)
@@ -646,6 +729,7 @@ def admin_set_final_deadline(proposal_id):
 
 
 @admin_bp.route("/admin/budget", methods=["GET", "POST"])
+@read_replica
 def admin_budget_tracking():
     """
     Manages System Budget (Adding funds and viewing usage).
@@ -675,19 +759,19 @@ def admin_budget_tracking():
         return redirect(url_for("admin.admin_budget_tracking"))
 
     # --- CALCULATE FINANCIALS ---
-    total_budget_in = db.session.query(func.sum(Budget.amount)).scalar() or 0.0
-    total_grants_out = db.session.query(func.sum(Grant.grant_amount)).scalar() or 0.0
+    ledger = get_budget_ledger()
+    total_budget_in = ledger.total_funds_in
+    total_grants_out = ledger.total_grants_out
     current_balance = total_budget_in - total_grants_out
 
     # Get transaction history
     budget_history = Budget.query.order_by(Budget.created_at.desc()).all()
 
     # --- PAGINATION FOR AWARDED GRANTS ---
-    page = request.args.get("page", 1, type=int)
     per_page = 6
 
-    active_grants = Grant.query.order_by(Grant.award_date.desc()).paginate(
-        page=page, per_page=per_page, error_out=False
+    active_grants = paginate_listing(
+        with_listing_options(Grant.query), [Grant.award_date.desc()], per_page=per_page
     )
 
     return render_template(
@@ -809,3 +893,25 @@ def admin_edit_system_data():
     db.session.commit()
     flash("Item updated.", "success")
     return redirect(url_for("admin.admin_system_data"))
+
+
+@admin_bp.route("/admin/query-stats", methods=["GET", "POST"])
+def admin_query_stats():
+    """
+    Shows how many queries each page runs and how long they take (collected
+    by services/profiling.py in this server process). POST clears the numbers.
+    """
+    if session.get("role") != "Admin":
+        return redirect(url_for("admin.admin_login"))
+
+    if request.method == "POST":
+        reset_query_stats()
+        flash("Query statistics cleared.", "success")
+        return redirect(url_for("admin.admin_query_stats"))
+
+    return render_template(
+        "admin_query_stats.html",
+        endpoints=query_stats(),
+        slow_query_ms=current_app.config["SLOW_QUERY_MS"],
+        user=User.query.get(session["user_id"]),
+    )
@@ -1,5 +1,7 @@
 from flask import Blueprint, render_template, redirect, url_for, session, flash
 from models import db, Notification, User
+from services.notifications import mark_all_read
+from services.queries import with_listing_options
 
 auth_bp = Blueprint("auth", __name__)
 
@@ -27,7 +29,8 @@ def view_notifications():
     user_id = session["user_id"]
     # Get notifications sorted by newest first
     notifs = (
-        Notification.query.filter_by(recipient_id=user_id)
+        with_listing_options(Notification.query)
+        .filter_by(recipient_id=user_id)
         .order_by(Notification.timestamp.desc())
         .all()
     )
@@ -65,12 +68,7 @@ def mark_all_notifications_read():
     if "user_id" not in session:
         return redirect(url_for("auth.main_login"))
     
-    user_id = session["user_id"]
-    unread = Notification.query.filter_by(recipient_id=user_id, is_read=False).all()
-    
-    for n in unread:
-        n.is_read = True
-    
+    mark_all_read(User.query.get(session["user_id"]))
     db.session.commit()
     flash("All notifications marked as read.", "success")
     return redirect(url_for("auth.view_notifications"))
\ No newline at end of file
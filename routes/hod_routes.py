@@ -1,5 +1,4 @@
 from flask import Blueprint, render_template, redirect, url_for, request, session, flash
-from sqlalchemy import func
 from models import (
     db,
     User,
@@ -7,11 +6,17 @@ from models import (
     Proposal,
     Grant,
     Researcher,
-    Budget,
     ProgressReport,
     Faculty,
 )
 from utils import update_user_profile, send_notification
+from services.ledger import get_budget_ledger
+from services.queries import with_listing_options
+from services.pagination import paginate_listing
+from services.search import search_filter, search_rank
+from services.replica import read_replica
+from services.stats import dashboard_stats, StatusHistogram
+from services.spending import spending_summary
 
 hod_bp = Blueprint("hod", __name__)
 
@@ -47,14 +52,11 @@ def hod_dashboard():
     user = User.query.get(session["user_id"])
     current_hod = HOD.query.filter_by(mmu_id=user.mmu_id).first()
 
-    pending_approvals = Proposal.query.filter_by(
-        assigned_hod_id=current_hod.hod_id, status="Pending HOD Approval"
-    ).count()
+    statuses = StatusHistogram.from_counters(dashboard_stats("hod", current_hod.hod_id))
 
-    assigned_research_count = Proposal.query.filter(
-        Proposal.assigned_hod_id == current_hod.hod_id,
-        Proposal.status.in_(["Approved", "Completed", "Terminated"]),
-    ).count()
+    pending_approvals = statuses.count("Pending HOD Approval")
+
+    assigned_research_count = statuses.count("Approved", "Completed", "Terminated")
 
     return render_template(
         "hod_dashboard.html",
@@ -92,21 +94,23 @@ def hod_assigned_proposals():
     current_hod = HOD.query.filter_by(mmu_id=session["user_id"]).first()
     search_query = request.args.get("search", "")
     filter_faculty = request.args.get("faculty", "")
-    page = request.args.get("page", 1, type=int)
     per_page = 8
     query = (
-        Proposal.query.filter(
+        with_listing_options(Proposal.query)
+        .filter(
             Proposal.assigned_hod_id == current_hod.hod_id,
             ~Proposal.status.in_(["Approved", "Completed", "Terminated"]),
         )
         .join(Researcher)
         .join(User)
     )
+    order = []
     if search_query:
-        query = query.filter(Proposal.title.ilike(f"%{search_query}%"))
+        query = query.filter(search_filter(Proposal, search_query))
+        order = search_rank(Proposal, search_query)
     if filter_faculty:
         query = query.filter(User.faculty == filter_faculty)
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    pagination = paginate_listing(query, order, per_page=per_page)
     return render_template(
         "hod_assigned_proposals.html",
         proposals=pagination.items,
@@ -204,7 +208,6 @@ def hod_grant_allocation():
     current_hod = HOD.query.filter_by(mmu_id=user.mmu_id).first()
     
     # --- GET FILTERS ---
-    page = request.args.get("page", 1, type=int)
     search_query = request.args.get("search", "")
     filter_status = request.args.get("status", "")
     sort_option = request.args.get("sort", "newest")
@@ -212,14 +215,14 @@ def hod_grant_allocation():
 
     # --- BASE QUERY ---
     # Only show proposals relevant to Grant Allocation (Pending Grant or Approved)
-    query = Proposal.query.filter(
+    query = with_listing_options(Proposal.query).filter(
         Proposal.assigned_hod_id == current_hod.hod_id,
         Proposal.status.in_(["Pending Grant", "Approved"]),
     )
 
     # --- APPLY SEARCH ---
     if search_query:
-        query = query.filter(Proposal.title.ilike(f"%{search_query}%"))
+        query = query.filter(search_filter(Proposal, search_query))
 
     # --- APPLY STATUS FILTER ---
     if filter_status and filter_status != "all":
@@ -227,20 +230,21 @@ def hod_grant_allocation():
 
     # --- APPLY SORTING ---
     if sort_option == "oldest":
-        query = query.order_by(Proposal.proposal_id.asc())
+        order = [Proposal.proposal_id.asc()]
     elif sort_option == "title_asc":
-        query = query.order_by(Proposal.title.asc())
+        order = [Proposal.title.asc()]
+    elif sort_option == "relevance" and search_query:
+        order = search_rank(Proposal, search_query)
     else:
         # Default: Newest First
-        query = query.order_by(Proposal.proposal_id.desc())
+        order = [Proposal.proposal_id.desc()]
 
     # --- EXECUTE PAGINATION ---
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    pagination = paginate_listing(query, order, per_page=per_page)
 
     # --- CALCULATE BUDGET TOTALS (Global, not just per page) ---
-    total_budget_in = db.session.query(func.sum(Budget.amount)).scalar() or 0.0
-    total_grants_out = db.session.query(func.sum(Grant.grant_amount)).scalar() or 0.0
-    remaining_balance = total_budget_in - total_grants_out
+    ledger = get_budget_ledger()
+    remaining_balance = ledger.total_funds_in - ledger.total_grants_out
 
     return render_template(
         "hod_grant_allocation.html",
@@ -280,9 +284,7 @@ def hod_update_grant():
 
     if proposal.status == "Pending Grant":
         proposal.status = "Approved"
-    db.session.commit()
 
-    flash(f"Grant allocated successfully: RM {new_amount:,.2f}", "success")
     send_notification(
         proposal.researcher.user_info.mmu_id,
         f"Update: Your proposal '{proposal.title}' has been APPROVED.",
@@ -296,10 +298,15 @@ def hod_update_grant():
         msg = f"Action Required: Proposal '{proposal.title}' is fully APPROVED. Please set the Final Deadline."
         link = url_for("admin.admin_view_proposal", proposal_id=proposal.proposal_id)
         send_notification(admin.mmu_id, msg, link, sender_id=user.mmu_id)
+
+    # Grant, status and both notifications are written in one transaction
+    db.session.commit()
+    flash(f"Grant allocated successfully: RM {new_amount:,.2f}", "success")
     return redirect(url_for("hod.hod_grant_allocation"))
 
 
 @hod_bp.route("/hod/grant_budget")
+@read_replica
 def hod_grant_budget():
     """
     Provides an overview of budget utilization for all grants under this HOD.
@@ -310,45 +317,32 @@ def hod_grant_budget():
     
     user = User.query.get(session["user_id"])
     current_hod = HOD.query.filter_by(mmu_id=user.mmu_id).first()
-    total_budget_in = db.session.query(func.sum(Budget.amount)).scalar() or 0.0
-    total_grants_out = db.session.query(func.sum(Grant.grant_amount)).scalar() or 0.0
+    ledger = get_budget_ledger()
+    total_budget_in = ledger.total_funds_in
+    total_grants_out = ledger.total_grants_out
     remaining_balance = total_budget_in - total_grants_out
     search_query = request.args.get("search", "")
     filter_faculty = request.args.get("faculty", "")
-    page = request.args.get("page", 1, type=int)
     per_page = 8
     query = (
-        Proposal.query.join(Grant)
+        with_listing_options(Proposal.query)
+        .join(Grant)
         .filter(Proposal.assigned_hod_id == current_hod.hod_id)
         .join(Researcher)
         .join(User)
     )
 
+    order = []
     if search_query:
-        query = query.filter(Proposal.title.ilike(f"%{search_query}%"))
+        query = query.filter(search_filter(Proposal, search_query))
+        order = search_rank(Proposal, search_query)
     if filter_faculty:
         query = query.filter(User.faculty == filter_faculty)
     
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
-    proposal_data = []
-
-    for p in pagination.items:
-        spent = (
-            db.session.query(func.sum(ProgressReport.financial_usage))
-            .filter_by(proposal_id=p.proposal_id)
-            .scalar()
-            or 0.0
-        )
-        grant_amount = p.grant_award.grant_amount
-        proposal_data.append(
-            {
-                "proposal": p,
-                "spent": spent,
-                "grant_amount": grant_amount,
-                "balance": grant_amount - spent,
-                "utilization": (spent / grant_amount * 100) if grant_amount > 0 else 0,
-            }
-        )
+    pagination = paginate_listing(query, order, per_page=per_page)
+
+    # Spending for every proposal on the page in one grouped query
+    proposal_data = list(spending_summary(pagination.items).values())
     return render_template(
         "hod_grant_budget.html",
         user=user,
@@ -372,24 +366,26 @@ def hod_assigned_research():
     
     user = User.query.get(session["user_id"])
     current_hod = HOD.query.filter_by(mmu_id=user.mmu_id).first()
-    page = request.args.get("page", 1, type=int)
     search_query = request.args.get("search", "")
     filter_faculty = request.args.get("faculty", "")
     per_page = 8
     query = (
-        Proposal.query.filter(
+        with_listing_options(Proposal.query)
+        .filter(
             Proposal.assigned_hod_id == current_hod.hod_id,
             Proposal.status.in_(["Approved", "Completed", "Terminated"]),
         )
         .join(Researcher)
         .join(User)
     )
+    order = []
     if search_query:
-        query = query.filter(Proposal.title.ilike(f"%{search_query}%"))
+        query = query.filter(search_filter(Proposal, search_query))
+        order = search_rank(Proposal, search_query)
     if filter_faculty:
         query = query.filter(User.faculty == filter_faculty)
     
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    pagination = paginate_listing(query, order, per_page=per_page)
     return render_template(
         "hod_assigned_research.html",
         proposals=pagination.items,
@@ -0,0 +1,191 @@
+import os
+import re
+from flask import (
+    Blueprint,
+    current_app,
+    request,
+    session,
+    send_file,
+    url_for,
+    redirect,
+    abort,
+)
+from sqlalchemy import select, union
+from models import db, User, Proposal, ProposalVersion, ProgressReport
+from services.images import AVATAR_SIZES, avatar_variant
+from services.storage import content_hash_of
+from services.extraction import file_digest
+
+media_bp = Blueprint("media", __name__)
+
+# ==========================================
+# FILE SERVING
+# ==========================================
+# Uploaded documents and profile pictures are served from here rather than
+# /static so that access rules apply and caches can be told the truth:
+# - strong ETags from file content, so revalidation is a cheap 304
+# - Range / If-Range support for large PDFs (send_file conditional mode)
+# - files whose name can never be reused for other content (content-hash
+#   documents, random-named pictures and their thumbnails) are "immutable";
+#   anything else (e.g. the shared default.jpg) is revalidated every time
+# Responses are private because every file sits behind a login.
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+# save_picture names every upload secrets.token_hex(8) + extension
+UPLOADED_PICTURE = re.compile(r"^[0-9a-f]{16}\.[a-z0-9]+$")
+
+_etags = {}
+
+
+def _content_etag(path):
+    """sha256 of a file, cached per (size, mtime) so each version is hashed once."""
+    stat = os.stat(path)
+    cached = _etags.get(path)
+    if cached and cached[0] == (stat.st_size, stat.st_mtime):
+        return cached[1]
+    digest = file_digest(path)
+    _etags[path] = ((stat.st_size, stat.st_mtime), digest)
+    return digest
+
+
+def _send(folder, filename, etag=None, immutable=False):
+    path = os.path.join(folder, filename)
+    if os.path.basename(filename) != filename or not os.path.isfile(path):
+        abort(404)
+    response = send_file(
+        path,
+        conditional=True,
+        etag=etag or _content_etag(path),
+        max_age=IMMUTABLE_MAX_AGE if immutable else 0,
+    )
+    response.cache_control.public = False
+    response.cache_control.private = True
+    if immutable:
+        response.cache_control.immutable = True
+    else:
+        response.cache_control.no_cache = True
+    return response
+
+
+def _require_login():
+    if "user_id" not in session:
+        abort(403)
+
+
+def can_view_document(filename):
+    """
+    Same rules as the pages that link to the file: the owning researcher, the
+    assigned reviewer, the assigned HOD or an HOD / Admin of the cycle's faculty.
+    Admins cannot see drafts. Files nothing references are never served.
+    """
+    proposal_ids = union(
+        select(Proposal.proposal_id).where(Proposal.document_file == filename),
+        select(ProposalVersion.proposal_id).where(ProposalVersion.document_file == filename),
+        select(ProgressReport.proposal_id).where(ProgressReport.document_file == filename),
+    )
+    proposals = Proposal.query.filter(Proposal.proposal_id.in_(proposal_ids)).all()
+    if not proposals:
+        return False
+
+    role = session.get("role")
+    user = db.session.get(User, session["user_id"])
+    for proposal in proposals:
+        if role == "Admin":
+            if proposal.status != "Draft" and proposal.cycle.faculty == user.faculty:
+                return True
+        elif role == "HOD":
+            hod = user.hod_profile
+            if hod and (
+                proposal.assigned_hod_id == hod.hod_id
+                or proposal.cycle.faculty == user.faculty
+            ):
+                return True
+        elif role == "Reviewer":
+            reviewer = user.reviewer_profile
+            if reviewer and proposal.assigned_reviewer_id == reviewer.reviewer_id:
+                return True
+        elif role == "Researcher":
+            researcher = user.researcher_profile
+            if researcher and proposal.researcher_id == researcher.researcher_id:
+                return True
+    return False
+
+
+# Serves an uploaded proposal / version / progress report document
+@media_bp.route("/media/documents/<filename>")
+def document(filename):
+    _require_login()
+    if not can_view_document(filename):
+        abort(403)
+    # Content-addressed names are their own strong ETag and never change
+    content_hash = content_hash_of(filename)
+    return _send(
+        current_app.config["UPLOAD_FOLDER_DOCS"],
+        filename,
+        etag=content_hash,
+        immutable=content_hash is not None,
+    )
+
+
+# Serves an original profile picture
+@media_bp.route("/media/pictures/<filename>")
+def picture(filename):
+    _require_login()
+    # Every upload gets a fresh random name, so such a name never changes content
+    immutable = UPLOADED_PICTURE.match(filename) is not None
+    return _send(current_app.config["UPLOAD_FOLDER"], filename, immutable=immutable)
+
+
+# Serves a profile picture as a square thumbnail, building it on first request
+@media_bp.route("/media/avatar/<int:size>/<filename>")
+def avatar(size, filename):
+    _require_login()
+    if size not in AVATAR_SIZES:
+        abort(404)
+    immutable = UPLOADED_PICTURE.match(filename) is not None
+    variant = avatar_variant(filename, size)
+    if variant:
+        return _send(os.path.dirname(variant), os.path.basename(variant), immutable=immutable)
+    # No Pillow or unreadable picture: fall back to the original upload
+    return _send(current_app.config["UPLOAD_FOLDER"], filename, immutable=immutable)
+
+
+# Template helper: {{ avatar_url(user.profile_image, 64) }}
+@media_bp.app_template_global()
+def avatar_url(filename, size=64):
+    return url_for("media.avatar", size=size, filename=filename or "default.jpg")
+
+
+# ==========================================
+# STATIC ASSETS
+# ==========================================
+PROTECTED_STATIC = {"proposal_docs/": "media.document", "profile_pics/": "media.picture"}
+
+
+@media_bp.before_app_request
+def redirect_protected_static():
+    """Old /static links to uploads go through the checked endpoints instead."""
+    if request.endpoint == "static":
+        filename = request.view_args.get("filename", "")
+        for prefix, endpoint in PROTECTED_STATIC.items():
+            if filename.startswith(prefix):
+                return redirect(url_for(endpoint, filename=filename[len(prefix) :]))
+
+
+@media_bp.app_url_defaults
+def version_static_urls(endpoint, values):
+    # style.css?v=<mtime>: the URL changes whenever the file does, so the
+    # response below can be cached for a year
+    if endpoint == "static" and "filename" in values and "v" not in values:
+        path = os.path.join(current_app.static_folder, values["filename"])
+        if os.path.isfile(path):
+            values["v"] = int(os.stat(path).st_mtime)
+
+
+@media_bp.after_app_request
+def cache_versioned_static(response):
+    if request.endpoint == "static" and "v" in request.args and response.status_code in (200, 304):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+    return response
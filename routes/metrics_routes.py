@@ -0,0 +1,22 @@
+import hmac
+from flask import Blueprint, Response, current_app, request, abort
+from services.metrics import registry
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/metrics")
+def metrics():
+    """
+    Prometheus scrape endpoint. Scrapers must send METRICS_TOKEN as
+    "Authorization: Bearer <token>"; without a token configured the endpoint
+    does not exist, since it reveals per-page traffic.
+    """
+    token = current_app.config.get("METRICS_TOKEN")
+    if not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get("Authorization", ""), f"Bearer {token}"):
+        abort(401)
+    return Response(
+        registry.exposition(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -13,8 +13,11 @@ from models import (
     Deadline,
     Faculty,
     ResearchArea,
-    Notification,
 )
+from services.spending import proposal_spending
+from services.pagination import paginate_listing
+from services.uploads import UploadRejected
+from services.stats import dashboard_stats, StatusHistogram
 from utils import (
     get_myt_date,
     get_myt_time,
@@ -52,25 +55,17 @@ def researcher_dashboard():
     user = User.query.get(session["user_id"])
     researcher = Researcher.query.filter_by(mmu_id=user.mmu_id).first()
 
-    approved_count = Proposal.query.filter_by(
-        researcher_id=researcher.researcher_id, status="Approved"
-    ).count()
+    # Precomputed counters (services/stats.py), read in one query
+    counters = dashboard_stats("researcher", researcher.researcher_id)
+    statuses = StatusHistogram.from_counters(counters)
 
     # Collect statistics for dashboard widgets
     stats = {
-        "my_proposals": Proposal.query.filter_by(
-            researcher_id=researcher.researcher_id
-            ).count(),
-        "approved": approved_count,
-        "active_grants": Grant.query.join(Proposal)
-            .filter(Proposal.researcher_id == researcher.researcher_id)
-            .count(),
-        "unread_notifs": Notification.query.filter_by(
-            recipient_id=user.mmu_id, is_read=False
-        ).count(),
-        "drafts": Proposal.query.filter_by(
-            researcher_id=researcher.researcher_id, status="Draft"
-        ).count(),
+        "my_proposals": statuses.count(),
+        "approved": statuses.count("Approved"),
+        "active_grants": counters["grants"],
+        "unread_notifs": user.unread_notifications,
+        "drafts": statuses.count("Draft"),
     }
 
     # Fetch top 5 open grant cycles
@@ -166,7 +161,11 @@ def researcher_submit_form(cycle_id):
 
         if file and file.filename != "":
             if allowed_file(file.filename):
-                doc_filename = save_document(file)
+                try:
+                    doc_filename = save_document(file)
+                except UploadRejected as e:
+                    flash(f"Error: {e}", "error")
+                    return redirect(request.url)
             else:
                 flash(
                     "Error: Invalid file format. Only PDF and DOCX are allowed.",
@@ -178,7 +177,8 @@ def researcher_submit_form(cycle_id):
         if proposal:
             has_changed = any(
                 [
-                    doc_filename is not None,
+                    # Identical re-uploads resolve to the same stored file
+                    doc_filename not in (None, proposal.document_file),
                     proposal.title != request.form.get("title"),
                     proposal.research_area != request.form.get("research_area"),
                     proposal.requested_budget != float(request.form.get("budget", 0)),
@@ -227,8 +227,6 @@ def researcher_submit_form(cycle_id):
             )
             db.session.add(new_version)
 
-        db.session.commit()
-        
         # Notify Admin on final submission
         if current_status == "Submitted":
             admin = User.query.filter_by(user_role="Admin").first()
@@ -242,6 +240,8 @@ def researcher_submit_form(cycle_id):
                     ),
                     session["user_id"],
                 )
+
+        db.session.commit()
         flash(f"Proposal {current_status.lower()}ed successfully!", "success")
         return redirect(url_for("researcher.researcher_my_proposals"))
 
@@ -313,7 +313,6 @@ def researcher_my_proposals():
     # --- 1. Get Query Parameters ---
     sort_option = request.args.get("sort", "newest")
     status_filter = request.args.get("status", "")
-    page = request.args.get("page", 1, type=int)
     per_page = 8
 
     # --- 2. Build Query ---
@@ -324,21 +323,21 @@ def researcher_my_proposals():
 
     # Sort logic
     if sort_option == "oldest":
-        query = query.order_by(Proposal.proposal_id)
+        order = [Proposal.proposal_id.asc()]
     elif sort_option == "title_asc":
-        query = query.order_by(Proposal.title.asc())
+        order = [Proposal.title.asc()]
     elif sort_option == "status_asc":
-        query = query.order_by(Proposal.status.asc())
+        order = [Proposal.status.asc()]
     else:
-        query = query.order_by(Proposal.proposal_id.desc())
+        order = [Proposal.proposal_id.desc()]
 
     # --- 3. Execute Pagination ---
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    pagination = paginate_listing(query, order, per_page=per_page)
     proposals = pagination.items
 
     stats = {
-        "my_proposals": Proposal.query.filter_by(
-            researcher_id=researcher.researcher_id
+        "my_proposals": StatusHistogram.from_counters(
+            dashboard_stats("researcher", researcher.researcher_id)
         ).count(),
         "pending_reports": 0,
     }
@@ -363,8 +362,7 @@ def researcher_withdraw_proposal(proposal_id):
     user = User.query.get(session["user_id"])
     
     proposal.status = "Withdrawn"
-    db.session.commit()
-    
+
     # Notify Admin
     admin = User.query.filter_by(user_role="Admin").first()
     if admin:
@@ -373,6 +371,7 @@ def researcher_withdraw_proposal(proposal_id):
         send_notification(
             recipient_id=admin.mmu_id, message=msg, link=link, sender_id=user.mmu_id
         )
+    db.session.commit()
     flash("Proposal withdrawn successfully.", "success")
     return redirect(url_for("researcher.researcher_my_proposals"))
 
@@ -395,6 +394,9 @@ def researcher_update_progress(proposal_id):
     if final_deadline and final_deadline.due_date < get_myt_date():
         deadline_passed = True
 
+    # Grant limit and usage so far (aggregated in SQL, not by loading every report)
+    spending = proposal_spending(proposal)
+
     if request.method == "POST":
         if deadline_passed:
             flash(
@@ -407,16 +409,10 @@ def researcher_update_progress(proposal_id):
                 )
             )
         
-        # Calculate budget usage
-        budget_limit = proposal.requested_budget
-        if proposal.grant_award:
-            budget_limit = proposal.grant_award.grant_amount
-        totalused = sum(r.financial_usage for r in proposal.reports)
-
         new_usage_str = request.form.get("financial_usage")
         new_usage = float(new_usage_str) if new_usage_str else 0.0
 
-        remaining_balance = budget_limit - totalused
+        remaining_balance = spending["balance"]
         if new_usage > remaining_balance:
             flash(
                 f"Error: Financial usage exceeds remaining budget of RM{remaining_balance:.2f}. If you need more funds, please contact the HOD.",
@@ -436,7 +432,11 @@ def researcher_update_progress(proposal_id):
         financial_usage = request.form.get("financial_usage")
         
         if file and allowed_file(file.filename):
-            filename = save_document(file)
+            try:
+                filename = save_document(file)
+            except UploadRejected as e:
+                flash(f"Error: {e}", "error")
+                return redirect(request.url)
             new_report = ProgressReport(
                 proposal_id=proposal.proposal_id,
                 title=report_title,
@@ -447,8 +447,7 @@ def researcher_update_progress(proposal_id):
                 status="Submitted",
             )
             db.session.add(new_report)
-            db.session.commit()
-            
+
             # Notify HOD
             if proposal.assigned_hod_id:
                 hod = HOD.query.get(proposal.assigned_hod_id)
@@ -459,6 +458,7 @@ def researcher_update_progress(proposal_id):
                 send_notification(
                     hod.user_info.mmu_id, msg, link, sender_id=user.mmu_id
                 )
+            db.session.commit()
             flash("Progress report submitted successfully.", "success")
             return redirect(url_for("researcher.researcher_my_proposals"))
         else:
@@ -469,6 +469,7 @@ def researcher_update_progress(proposal_id):
         user=user,
         deadline_passed=deadline_passed,
         final_deadline=final_deadline,
+        spending=spending,
     )
 
 
@@ -488,5 +489,6 @@ def researcher_request_extension(proposal_id):
         msg = f"Extension Request: {user.name} requests time for '{proposal.title}'. Reason: {reason}"
         link = url_for("admin.admin_view_proposal", proposal_id=proposal.proposal_id)
         send_notification(admin.mmu_id, msg, link, sender_id=session["user_id"])
+        db.session.commit()
     flash("Extension request sent to Admin successfully.", "success")
     return redirect(url_for("researcher.researcher_my_proposals"))
\ No newline at end of file
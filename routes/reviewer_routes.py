@@ -15,6 +15,11 @@ from utils import (
     send_notification,
     get_myt_date,
 )
+from services.queries import with_listing_options
+from services.pagination import paginate_listing
+from services.search import search_filter, search_rank
+from services.replica import read_replica
+from services.stats import dashboard_stats, StatusHistogram
 from datetime import date
 
 reviewer_bp = Blueprint("reviewer", __name__)
@@ -46,17 +51,14 @@ def reviewer_dashboard():
     reviewer_profile = Reviewer.query.filter_by(mmu_id=user.mmu_id).first()
     stats = {"pending_screenings": 0, "pending_reviews": 0}
     if reviewer_profile:
+        counters = dashboard_stats("reviewer", reviewer_profile.reviewer_id)
+        statuses = StatusHistogram.from_counters(counters)
         # Count proposals waiting for initial screening
-        stats["pending_screenings"] = Proposal.query.filter(
-            Proposal.assigned_reviewer_id == reviewer_profile.reviewer_id,
-            Proposal.status.in_(["Submitted", "Under Review", "Under Screening"]),
-        ).count()
+        stats["pending_screenings"] = statuses.count(
+            "Submitted", "Under Review", "Under Screening"
+        )
         # Count proposals passed screening but not yet scored
-        stats["pending_reviews"] = Proposal.query.filter(
-            Proposal.assigned_reviewer_id == reviewer_profile.reviewer_id,
-            Proposal.status == "Passed Screening",
-            Proposal.review_score == None,
-        ).count()
+        stats["pending_reviews"] = counters["unscored"]
     return render_template("reviewer_dashboard.html", stats=stats, user=user)
 
 
@@ -74,6 +76,7 @@ def reviewer_profile():
 
 # Lists all assigned proposals (pending screening & history)
 @reviewer_bp.route("/reviewer/proposals")
+@read_replica
 def reviewer_view_proposals():
     if session.get("role") != "Reviewer":
         return redirect(url_for("reviewer.reviewer_login"))
@@ -88,24 +91,23 @@ def reviewer_view_proposals():
     filter_area = request.args.get("area", "")
     filter_status = request.args.get("status", "")
     sort_option = request.args.get("sort", "newest")
-    page = request.args.get("page", 1, type=int)
     per_page = 7
 
     # Base Queries
-    pending_query = Proposal.query.filter(
+    pending_query = with_listing_options(Proposal.query).filter(
         Proposal.assigned_reviewer_id == reviewer_profile.reviewer_id,
         Proposal.status.in_(["Submitted", "Under Review", "Under Screening"]),
     )
 
-    history_query = Proposal.query.filter(
+    history_query = with_listing_options(Proposal.query).filter(
         Proposal.assigned_reviewer_id == reviewer_profile.reviewer_id,
         ~Proposal.status.in_(["Submitted", "Under Review", "Under Screening"]),
     )
 
     # Apply Filters
     if search_query:
-        pending_query = pending_query.filter(Proposal.title.ilike(f"%{search_query}%"))
-        history_query = history_query.filter(Proposal.title.ilike(f"%{search_query}%"))
+        pending_query = pending_query.filter(search_filter(Proposal, search_query))
+        history_query = history_query.filter(search_filter(Proposal, search_query))
 
     if filter_area and filter_area != "all":
         pending_query = pending_query.filter(Proposal.research_area == filter_area)
@@ -117,23 +119,19 @@ def reviewer_view_proposals():
 
     # Apply Sorting
     if sort_option == "oldest":
-        pending_query = pending_query.order_by(Proposal.proposal_id.asc())
-        history_query = history_query.order_by(Proposal.proposal_id.asc())
+        order = [Proposal.proposal_id.asc()]
     elif sort_option == "title_asc":
-        pending_query = pending_query.order_by(Proposal.title.asc())
-        history_query = history_query.order_by(Proposal.title.asc())
+        order = [Proposal.title.asc()]
     elif sort_option == "status_asc":
-        pending_query = pending_query.order_by(Proposal.status.asc())
-        history_query = history_query.order_by(Proposal.status.asc())
+        order = [Proposal.status.asc()]
+    elif sort_option == "relevance" and search_query:
+        order = search_rank(Proposal, search_query)
     else:
-        pending_query = pending_query.order_by(Proposal.proposal_id.desc())
-        history_query = history_query.order_by(Proposal.proposal_id.desc())
+        order = [Proposal.proposal_id.desc()]
 
     # Execute queries
-    pending_proposals = pending_query.all()
-    history_pagination = history_query.paginate(
-        page=page, per_page=per_page, error_out=False
-    )
+    pending_proposals = pending_query.order_by(*order).all()
+    history_pagination = paginate_listing(history_query, order, per_page=per_page)
 
     return render_template(
         "reviewer_proposals.html",
@@ -234,36 +232,35 @@ def reviewer_screen_proposal(proposal_id):
 
 # Lists proposals ready for scoring (Passed Screening) and history
 @reviewer_bp.route("/reviewer/evaluation_list")
+@read_replica
 def reviewer_evaluation_list():
     if session.get("role") != "Reviewer":
         return redirect(url_for("reviewer.reviewer_login"))
     user = User.query.get(session["user_id"])
     reviewer_profile = Reviewer.query.filter_by(mmu_id=user.mmu_id).first()
 
-    # Pagination & Filters
-    page = request.args.get("page", 1, type=int) 
-    history_page = request.args.get("history_page", 1, type=int) 
+    # Filters
     search_query = request.args.get("search", "")
     filter_area = request.args.get("area", "")
     sort_option = request.args.get("sort", "newest")
 
     # Pending Query
-    query_pending = Proposal.query.filter(
+    query_pending = with_listing_options(Proposal.query).filter(
         Proposal.assigned_reviewer_id == reviewer_profile.reviewer_id,
         Proposal.status == "Passed Screening",
         Proposal.review_score == None,
     )
 
     # History Query
-    query_history = Proposal.query.filter(
+    query_history = with_listing_options(Proposal.query).filter(
         Proposal.assigned_reviewer_id == reviewer_profile.reviewer_id,
         Proposal.review_score != None,
     )
 
     # Filters
     if search_query:
-        query_pending = query_pending.filter(Proposal.title.ilike(f"%{search_query}%"))
-        query_history = query_history.filter(Proposal.title.ilike(f"%{search_query}%"))
+        query_pending = query_pending.filter(search_filter(Proposal, search_query))
+        query_history = query_history.filter(search_filter(Proposal, search_query))
 
     if filter_area and filter_area != "all":
         query_pending = query_pending.filter(Proposal.research_area == filter_area)
@@ -271,19 +268,22 @@ def reviewer_evaluation_list():
 
     # Sorting
     if sort_option == "oldest":
-        query_pending = query_pending.order_by(Proposal.proposal_id.asc())
-        query_history = query_history.order_by(Proposal.proposal_id.asc())
+        order = [Proposal.proposal_id.asc()]
     elif sort_option == "title_asc":
-        query_pending = query_pending.order_by(Proposal.title.asc())
-        query_history = query_history.order_by(Proposal.title.asc())
+        order = [Proposal.title.asc()]
+    elif sort_option == "relevance" and search_query:
+        order = search_rank(Proposal, search_query)
     else:
-        query_pending = query_pending.order_by(Proposal.proposal_id.desc())
-        query_history = query_history.order_by(Proposal.proposal_id.desc())
-
-    # Pagination execution
-    pagination = query_pending.paginate(page=page, per_page=8, error_out=False)
-    history_pagination = query_history.paginate(
-        page=history_page, per_page=8, error_out=False
+        order = [Proposal.proposal_id.desc()]
+
+    # Pagination execution (the two lists page independently)
+    pagination = paginate_listing(query_pending, order, per_page=8)
+    history_pagination = paginate_listing(
+        query_history,
+        order,
+        per_page=8,
+        page_param="history_page",
+        cursor_param="history_cursor",
     )
 
     return render_template(
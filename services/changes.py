@@ -0,0 +1,61 @@
+from sqlalchemy import event
+from sqlalchemy.orm.attributes import get_history
+
+
+# ==========================================
+# FLUSH CHANGE HELPERS
+# ==========================================
+# Used by the before_flush listeners that keep denormalized totals in step with
+# the rows they summarize. Inside before_flush nothing has been written yet, so
+# attribute history describes exactly what the coming flush will change.
+
+
+def _keep_old_value(target, value, oldvalue, initiator):
+    return value
+
+
+def track_old_values(*attributes):
+    """
+    Makes the ORM load an attribute's previous value before it is overwritten,
+    even when the instance was expired by an earlier commit.
+    Without this, history on an unloaded column only shows the new value.
+    """
+    for attribute in attributes:
+        event.listen(attribute, "set", _keep_old_value, active_history=True)
+
+
+def old_value(obj, attr):
+    """Returns the value an attribute had before the pending change."""
+    history = get_history(obj, attr)
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(obj, attr)
+
+
+def pending_changes(session, model):
+    """
+    Yields (obj, kind) for every instance of `model` the coming flush will write,
+    where kind is 'new', 'dirty' or 'deleted'.
+    """
+    for obj in session.new:
+        if isinstance(obj, model):
+            yield obj, "new"
+    for obj in session.dirty:
+        if isinstance(obj, model) and session.is_modified(obj):
+            yield obj, "dirty"
+    for obj in session.deleted:
+        if isinstance(obj, model):
+            yield obj, "deleted"
+
+
+def contribution_delta(obj, kind, value_of):
+    """
+    Difference an object makes to a running total across the coming flush.
+    `value_of(get)` computes the object's contribution, reading attributes via
+    `get(attr)`, so the same function is evaluated against old and new values.
+    """
+    new = value_of(lambda attr: getattr(obj, attr)) if kind != "deleted" else 0
+    old = value_of(lambda attr: old_value(obj, attr)) if kind != "new" else 0
+    return (new or 0) - (old or 0)
@@ -0,0 +1,278 @@
+import os
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+import multiprocessing
+import threading
+from datetime import timedelta, timezone
+from sqlalchemy import create_engine, event, exc, inspect, text, select, insert, func, MetaData, Table
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.types import DateTime
+
+
+# ==========================================
+# DATABASE SELECTION
+# ==========================================
+def database_url(url):
+    """Normalises a configured database URL (e.g. Heroku-style postgres://)."""
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://") :]
+    return url
+
+
+def upsert(session, model):
+    """
+    An INSERT for `model` in the session's dialect, which adds
+    on_conflict_do_update() / on_conflict_do_nothing(). Both SQLite and
+    PostgreSQL resolve the conflict atomically, so two transactions creating
+    the same row at once cannot fail each other with an IntegrityError.
+    """
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
+
+
+def sync_sqlite_copy(source_engine, target_engine):
+    """
+    Refreshes an SQLite replica file from the primary with SQLite's online
+    backup API (consistent even while the primary is being written).
+    """
+    source = source_engine.raw_connection()
+    target = target_engine.raw_connection()
+    try:
+        source.driver_connection.backup(target.driver_connection)
+    finally:
+        target.close()
+        source.close()
+
+
+# ==========================================
+# CONNECTION PROFILE
+# ==========================================
+# Applied to every engine through event hooks:
+# - SQLite connections get the SQLITE_PRAGMAS from the config. WAL lets
+#   readers keep reading while one writer commits, and busy_timeout makes a
+#   second writer wait for the lock instead of failing with
+#   "database is locked".
+# - Pooled connections remember the process that opened them, so a pool
+#   inherited through fork (gunicorn --preload, multiprocessing) opens fresh
+#   connections in the child instead of sharing file handles with the parent.
+def configure_engine(engine, pragmas=None):
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connection_record.info["pid"] = os.getpid()
+        if engine.dialect.name == "sqlite" and pragmas:
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        if connection_record.info.get("pid") != os.getpid():
+            connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+            raise exc.DisconnectionError(
+                "Connection belongs to another process; reconnecting"
+            )
+
+    return engine
+
+
+def engine_options(url, pool_size=10, max_overflow=20, pool_timeout=30):
+    """
+    create_engine() keyword arguments for `url`. File databases get a
+    QueuePool shared by the server's threads; in-memory SQLite keeps
+    SQLAlchemy's per-thread default.
+    """
+    if url.startswith("sqlite") and (url.endswith(":memory:") or url == "sqlite://"):
+        return {}
+    return dict(pool_size=pool_size, max_overflow=max_overflow, pool_timeout=pool_timeout)
+
+
+# ==========================================
+# CONCURRENCY STRESS TEST
+# ==========================================
+# Copies a database to a temp file and hammers it from several processes
+# (like gunicorn workers), each with writer and reader threads. Every
+# operation is timed; lock errors and workers that barely progressed are
+# what the production profile is meant to eliminate.
+STRESS_TABLE = "stress_probe"
+
+
+def _stress_worker(url, options, pragmas, role, seconds, index):
+    engine = configure_engine(create_engine(url, **options), pragmas)
+    latencies, errors, stop_at = [], 0, time.monotonic() + seconds
+    while time.monotonic() < stop_at:
+        started = time.monotonic()
+        try:
+            with engine.begin() as conn:
+                if role == "writer":
+                    conn.execute(
+                        text(f"INSERT INTO {STRESS_TABLE} (worker, payload) VALUES (:w, :p)"),
+                        {"w": f"{role}-{index}", "p": "x" * 200},
+                    )
+                    conn.execute(
+                        text(f"UPDATE {STRESS_TABLE} SET payload = :p WHERE id = 1"),
+                        {"p": str(started)},
+                    )
+                else:
+                    conn.execute(text(f"SELECT COUNT(*), MAX(id) FROM {STRESS_TABLE}")).one()
+                    conn.execute(text("SELECT COUNT(*) FROM proposal")).one()
+        except exc.OperationalError:
+            errors += 1
+        latencies.append(time.monotonic() - started)
+    engine.dispose()
+    return role, latencies, errors
+
+
+def _stress_process(args):
+    url, options, pragmas, writers, readers, seconds, process = args
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda role=role, n=n: results.append(
+                _stress_worker(url, options, pragmas, role, seconds, f"{process}.{n}")
+            )
+        )
+        for role, count in (("writer", writers), ("reader", readers))
+        for n in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def stress_test(source_path, pragmas, processes=4, writers=2, readers=2, seconds=10):
+    """
+    Runs the workload against a copy of `source_path` with the given pragmas
+    (None for SQLite defaults). Returns a summary dict per role.
+    """
+    folder = tempfile.mkdtemp(prefix="rgms-stress-")
+    try:
+        path = os.path.join(folder, "stress.db")
+        # The backup API also picks up changes still in the source's WAL file
+        source, target = sqlite3.connect(source_path), sqlite3.connect(path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        url = "sqlite:///" + path
+        setup = configure_engine(create_engine(url), pragmas)
+        with setup.begin() as conn:
+            conn.execute(
+                text(
+                    f"CREATE TABLE {STRESS_TABLE} (id INTEGER PRIMARY KEY, "
+                    "worker TEXT, payload TEXT)"
+                )
+            )
+            conn.execute(text(f"INSERT INTO {STRESS_TABLE} (worker) VALUES ('seed')"))
+        setup.dispose()
+
+        jobs = [
+            (url, engine_options(url), pragmas, writers, readers, seconds, p)
+            for p in range(processes)
+        ]
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            runs = [r for batch in pool.map(_stress_process, jobs) for r in batch]
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    summary = {}
+    for role in ("writer", "reader"):
+        mine = [r for r in runs if r[0] == role]
+        latencies = sorted(l for _, ls, _ in mine for l in ls)
+        if not latencies:
+            continue
+        summary[role] = dict(
+            operations=len(latencies),
+            per_second=len(latencies) / seconds,
+            errors=sum(e for _, _, e in mine),
+            # Fewest operations any single thread finished: ~0 means starved
+            slowest_thread=min(len(ls) for _, ls, _ in mine),
+            p50_ms=statistics.median(latencies) * 1000,
+            p99_ms=latencies[int(len(latencies) * 0.99) - 1] * 1000,
+            max_ms=latencies[-1] * 1000,
+        )
+    return summary
+
+
+# ==========================================
+# DATA COPY (e.g. SQLite -> PostgreSQL)
+# ==========================================
+# Creates the schema on the target and streams every table across in primary
+# key batches, parents before children, so memory use stays flat however
+# large the source is. The source's Alembic revision is copied too, so
+# `flask db upgrade` keeps working against the new database.
+MYT = timezone(timedelta(hours=8))
+
+
+def _localize(table):
+    """Columns whose naive SQLite values are Malaysia time and need an offset."""
+    return [
+        c.name for c in table.columns
+        if isinstance(c.type, DateTime) and c.type.timezone
+    ]
+
+
+def _reset_sequences(conn, tables):
+    # Rows were inserted with explicit ids; move each serial sequence past them
+    preparer = conn.dialect.identifier_preparer
+    for table in tables:
+        pk = list(table.primary_key.columns)
+        if len(pk) != 1 or not pk[0].autoincrement or pk[0].type.python_type is not int:
+            continue
+        conn.execute(
+            text(
+                "SELECT setval(pg_get_serial_sequence(:table, :column), "
+                f"COALESCE((SELECT MAX({preparer.quote(pk[0].name)}) "
+                f"FROM {preparer.format_table(table)}), 0) + 1, false)"
+            ),
+            {"table": preparer.format_table(table), "column": pk[0].name},
+        )
+
+
+def copy_database(source_engine, target_url, metadata, batch_size=1000, progress=None):
+    """
+    Copies every table in `metadata` (plus alembic_version) from
+    `source_engine` into the database at `target_url`, whose tables must be
+    empty. Returns {table name: rows copied}.
+    """
+    target_engine = create_engine(database_url(target_url))
+    metadata.create_all(target_engine)
+    tables = list(metadata.sorted_tables)
+    if inspect(source_engine).has_table("alembic_version"):
+        tables.append(Table("alembic_version", MetaData(), autoload_with=source_engine))
+        tables[-1].create(target_engine, checkfirst=True)
+
+    counts = {}
+    try:
+        with source_engine.connect() as src, target_engine.begin() as dst:
+            for table in tables:
+                if dst.execute(select(func.count()).select_from(table)).scalar():
+                    raise ValueError(f"Target table '{table.name}' is not empty")
+                localize = _localize(table)
+                result = src.execution_options(yield_per=batch_size).execute(
+                    select(table).order_by(*table.primary_key.columns)
+                )
+                copied = 0
+                for batch in result.partitions():
+                    rows = [dict(row._mapping) for row in batch]
+                    for row in rows:
+                        for name in localize:
+                            value = row[name]
+                            if value is not None and value.tzinfo is None:
+                                row[name] = value.replace(tzinfo=MYT)
+                    dst.execute(insert(table), rows)
+                    copied += len(rows)
+                    if progress:
+                        progress(table.name, copied)
+                counts[table.name] = copied
+            if target_engine.dialect.name == "postgresql":
+                _reset_sequences(dst, metadata.sorted_tables)
+    finally:
+        target_engine.dispose()
+    return counts
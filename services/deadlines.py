@@ -0,0 +1,104 @@
+from datetime import timedelta
+from flask import url_for
+from sqlalchemy import select, insert, case, and_
+from models import db, Proposal, Deadline, DeadlineReminder, Researcher, malaysia_now
+from services.notifications import stage_notifications
+from services.jobs import job_handler
+
+
+# ==========================================
+# DEADLINE REMINDER SWEEP
+# ==========================================
+# Runs periodically as a background job and reminds researchers about Final
+# Submission deadlines of Approved proposals: once a day in the last
+# REMINDER_WINDOW_DAYS days, and once when the deadline has passed. One query
+# (using ix_deadline_type_due_date) finds every reminder that is due and has
+# not been sent; reminders and notifications are then inserted in bulk.
+# Deadlines that passed more than REMINDER_WINDOW_DAYS ago are left alone, so
+# the first sweep after deployment (with an empty reminder log) does not send
+# an overdue notice for every old proposal.
+REMINDER_WINDOW_DAYS = 7
+SWEEP_INTERVAL = timedelta(hours=1)
+
+
+def due_reminders(today):
+    """Rows (proposal_id, title, cycle_id, mmu_id, due_date, kind, reminder_date) not yet sent."""
+    overdue = Deadline.due_date < today
+    kind = case((overdue, "overdue"), else_="due_soon")
+    reminder_date = case((overdue, Deadline.due_date), else_=today)
+    return db.session.execute(
+        select(
+            Proposal.proposal_id,
+            Proposal.title,
+            Proposal.cycle_id,
+            Researcher.mmu_id,
+            Deadline.due_date,
+            kind.label("kind"),
+            reminder_date.label("reminder_date"),
+        )
+        .join(Deadline, Deadline.proposal_id == Proposal.proposal_id)
+        .join(Researcher, Researcher.researcher_id == Proposal.researcher_id)
+        .outerjoin(
+            DeadlineReminder,
+            and_(
+                DeadlineReminder.proposal_id == Proposal.proposal_id,
+                DeadlineReminder.kind == kind,
+                DeadlineReminder.reminder_date == reminder_date,
+            ),
+        )
+        .where(
+            Deadline.deadline_type == "Final Submission",
+            Deadline.due_date.between(
+                today - timedelta(days=REMINDER_WINDOW_DAYS),
+                today + timedelta(days=REMINDER_WINDOW_DAYS),
+            ),
+            Proposal.status == "Approved",
+            DeadlineReminder.reminder_id == None,
+        )
+        .order_by(Deadline.due_date, Proposal.proposal_id)
+    ).all()
+
+
+def sweep_deadlines(today=None):
+    """
+    Stages every due reminder in the current transaction (the caller commits).
+    Needs a request context for the notification links. Returns the number sent.
+    """
+    today = today or malaysia_now().date()
+    reminders, notifications, seen = [], [], set()
+    for row in due_reminders(today):
+        key = (row.proposal_id, row.kind, row.reminder_date)
+        if key in seen:
+            continue  # duplicate Final Submission rows for one proposal
+        seen.add(key)
+        if row.kind == "overdue":
+            msg = f"URGENT: Final submission for '{row.title}' is OVERDUE (Due: {row.due_date})."
+        else:
+            days_left = (row.due_date - today).days
+            msg = f"Reminder: Final submission for '{row.title}' is due in {days_left} days."
+        reminders.append(
+            dict(proposal_id=row.proposal_id, kind=row.kind, reminder_date=row.reminder_date)
+        )
+        notifications.append(
+            dict(
+                recipient_id=row.mmu_id,
+                # No sender: shown as "System Message"
+                sender_id=None,
+                message=msg,
+                link=url_for(
+                    "researcher.researcher_submit_form",
+                    cycle_id=row.cycle_id,
+                    proposal_id=row.proposal_id,
+                ),
+            )
+        )
+
+    if reminders:
+        db.session.execute(insert(DeadlineReminder), reminders)
+        stage_notifications(notifications)
+    return len(reminders)
+
+
+@job_handler("deadline_sweep", every=SWEEP_INTERVAL)
+def deadline_sweep_job():
+    sweep_deadlines()
@@ -0,0 +1,186 @@
+import hashlib
+import os
+import zipfile
+from collections import Counter
+from xml.etree import ElementTree
+from flask import current_app
+from sqlalchemy import select, union
+from models import db, Proposal, ProposalVersion, ProgressReport, DocumentText
+from services.database import upsert
+from services.jobs import job_handler
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional: PDFs are recorded as "unavailable" until it is installed
+    PdfReader = None
+
+
+# ==========================================
+# DOCUMENT TEXT EXTRACTION
+# ==========================================
+# Uploaded proposal and progress report files are read once in the background
+# and their plain text stored in DocumentText (which the search index mirrors).
+# Work is keyed by filename and content hash, so a file is only re-read when
+# its contents change, and an identical re-upload reuses the earlier text.
+MAX_TEXT_CHARS = 500_000
+MAX_DOCX_XML_BYTES = 50 * 1024 * 1024
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Statuses worth another attempt even though the file is unchanged
+RETRY_STATUSES = {"unavailable", "missing"}
+
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _docx_text(path):
+    # A .docx is a zip; the body text is in word/document.xml
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo("word/document.xml")
+        if info.file_size > MAX_DOCX_XML_BYTES:
+            raise ValueError("document.xml is too large to index")
+        parts = []
+        with archive.open(info) as xml:
+            for _, element in ElementTree.iterparse(xml):
+                if element.tag == WORD_NS + "t":
+                    parts.append(element.text or "")
+                elif element.tag == WORD_NS + "tab":
+                    parts.append("\t")
+                elif element.tag in (WORD_NS + "br", WORD_NS + "cr"):
+                    parts.append("\n")
+                elif element.tag == WORD_NS + "p":
+                    parts.append("\n")
+                    element.clear()
+        return "".join(parts)
+
+
+def _pdf_text(path):
+    pages, length = [], 0
+    for page in PdfReader(path).pages:
+        text = page.extract_text() or ""
+        pages.append(text)
+        length += len(text)
+        if length >= MAX_TEXT_CHARS:
+            break
+    return "\n".join(pages)
+
+
+EXTRACTORS = {".docx": _docx_text, ".pdf": _pdf_text}
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_text(path):
+    """Returns (status, text, error) for one file."""
+    ext = os.path.splitext(path)[1].lower()
+    extractor = EXTRACTORS.get(ext)
+    if extractor is None:
+        return "unsupported", None, f"No text extractor for '{ext}' files"
+    if ext == ".pdf" and PdfReader is None:
+        return "unavailable", None, "pypdf is not installed"
+    try:
+        text = extractor(path).strip()[:MAX_TEXT_CHARS]
+    except Exception as e:  # corrupt or unreadable upload
+        return "error", None, str(e)[:255]
+    return ("ok" if text else "empty"), text or None, None
+
+
+def process_document(filename, record=None):
+    """
+    Brings the DocumentText row for one uploaded file up to date.
+    Pass the existing row (if any) as `record` to save a lookup in bulk runs.
+    Returns the resulting status, or "skipped" when nothing had changed.
+    """
+    if record is None:
+        record = DocumentText.query.filter_by(filename=filename).first()
+    if record is None:
+        # Another worker may be creating the same row; whichever insert loses
+        # does nothing, and both continue with the row that won
+        db.session.execute(
+            upsert(db.session, DocumentText)
+            .values(filename=filename)
+            .on_conflict_do_nothing(index_elements=[DocumentText.filename])
+        )
+        record = DocumentText.query.filter_by(filename=filename).one()
+
+    path = os.path.join(current_app.config["UPLOAD_FOLDER_DOCS"], filename)
+    if not os.path.isfile(path):
+        record.status, record.text, record.error = "missing", None, None
+        return "missing"
+
+    stat = os.stat(path)
+    retry = record.status in RETRY_STATUSES
+    if (
+        not retry
+        and record.file_size == stat.st_size
+        and record.file_mtime == stat.st_mtime
+    ):
+        return "skipped"
+
+    digest = file_digest(path)
+    record.file_size, record.file_mtime = stat.st_size, stat.st_mtime
+    if not retry and record.content_hash == digest:
+        return "skipped"
+
+    # Same bytes already extracted under another name (e.g. a re-upload)
+    twin = DocumentText.query.filter(
+        DocumentText.content_hash == digest,
+        DocumentText.filename != filename,
+        DocumentText.status.in_(["ok", "empty"]),
+    ).first()
+    if twin:
+        status, text, error = twin.status, twin.text, None
+    else:
+        status, text, error = extract_text(path)
+
+    record.content_hash = digest
+    record.status, record.text, record.error = status, text, error
+    return status
+
+
+# ==========================================
+# BULK / BACKLOG
+# ==========================================
+def referenced_documents():
+    """Every document filename referenced by a proposal, version or report."""
+    files = union(
+        select(Proposal.document_file).where(Proposal.document_file != None),
+        select(ProposalVersion.document_file),
+        select(ProgressReport.document_file).where(ProgressReport.document_file != None),
+    )
+    return sorted(db.session.execute(files).scalars())
+
+
+def extract_documents(filenames, batch_size=50):
+    """
+    Processes files in batches, committing after each, so a long run over the
+    backlog can be interrupted and resumed without redoing finished work.
+    Returns a Counter of resulting statuses.
+    """
+    counts = Counter()
+    for start in range(0, len(filenames), batch_size):
+        batch = filenames[start : start + batch_size]
+        records = {
+            r.filename: r
+            for r in DocumentText.query.filter(DocumentText.filename.in_(batch))
+        }
+        for filename in batch:
+            counts[process_document(filename, records.get(filename))] += 1
+        db.session.commit()
+    return counts
+
+
+# ==========================================
+# BACKGROUND JOB
+# ==========================================
+# save_document queues a job per upload, so the request that uploaded the
+# file never waits on extraction. Jobs are keyed by filename: re-uploading
+# the same bytes while one is pending does not queue another.
+@job_handler("extract_document")
+def extract_document_job(filename):
+    process_document(filename)
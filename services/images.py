@@ -0,0 +1,114 @@
+import os
+import tempfile
+from flask import current_app
+from services.uploads import UploadRejected, place_upload, FILE_MODE
+from services.jobs import job_handler
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # optional: without Pillow pictures are stored and served as uploaded
+    Image = None
+
+
+# ==========================================
+# PROFILE PICTURE PROCESSING
+# ==========================================
+# Uploads are normalized to at most MAX_PICTURE_SIDE pixels on the long edge.
+# Pages show small fixed-size avatars, so each picture also gets square
+# thumbnails (AVATAR_SIZES) generated on first request and cached on disk
+# under profile_pics/thumbs. Everything here degrades to the original file
+# when Pillow is not installed.
+MAX_PICTURE_SIDE = 1024
+AVATAR_SIZES = (64, 256)
+THUMB_DIR = "thumbs"
+JPEG_QUALITY = 85
+
+
+def pillow_available():
+    return Image is not None
+
+
+def _variant_format():
+    return ("WEBP", ".webp") if features.check("webp") else ("JPEG", ".jpg")
+
+
+def _save_atomic(image, path, fmt, **options):
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".img-")
+    os.chmod(temp_path, FILE_MODE)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            image.save(out, fmt, **options)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def store_picture(temp_path, folder, stem, ext):
+    """
+    Moves a received picture upload into `folder` as `stem` + extension,
+    downscaled and re-encoded when Pillow is available. Returns the filename.
+    """
+    if not pillow_available():
+        place_upload(temp_path, os.path.join(folder, stem + ext))
+        return stem + ext
+
+    try:
+        with Image.open(temp_path) as image:
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((MAX_PICTURE_SIDE, MAX_PICTURE_SIDE))
+            # Keep transparency as PNG, everything else becomes a JPEG
+            has_alpha = image.mode in ("RGBA", "LA") or (
+                image.mode == "P" and "transparency" in image.info
+            )
+            if has_alpha:
+                fmt, out_ext, options = "PNG", ".png", {"optimize": True}
+                image = image.convert("RGBA")
+            else:
+                fmt, out_ext = "JPEG", ".jpg"
+                options = {"quality": JPEG_QUALITY, "optimize": True}
+                image = image.convert("RGB")
+            filename = stem + out_ext
+            _save_atomic(image, os.path.join(folder, filename), fmt, **options)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        raise UploadRejected("The picture could not be read. Please upload a JPG or PNG image.")
+    finally:
+        os.remove(temp_path)
+    return filename
+
+
+def avatar_variant(filename, size):
+    """
+    Path of the cached `size`px square thumbnail of a profile picture,
+    generating it on first use. Returns None when no variant can be made
+    (no Pillow, or the picture is missing / unreadable).
+    """
+    if not pillow_available() or os.path.basename(filename) != filename:
+        return None
+    folder = current_app.config["UPLOAD_FOLDER"]
+    source = os.path.join(folder, filename)
+    fmt, ext = _variant_format()
+    stem = os.path.splitext(filename)[0]
+    path = os.path.join(folder, THUMB_DIR, f"{stem}-{size}{ext}")
+    if os.path.exists(path):
+        return path
+    if not os.path.isfile(source):
+        return None
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with Image.open(source) as image:
+            image = ImageOps.exif_transpose(image)
+            thumb = ImageOps.fit(image.convert("RGB"), (size, size), Image.LANCZOS)
+            _save_atomic(thumb, path, fmt, quality=JPEG_QUALITY)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        current_app.logger.warning("Could not build %spx avatar for %s", size, filename)
+        return None
+    return path
+
+
+@job_handler("build_avatars")
+def build_avatars(filename):
+    """Pre-builds every avatar size for a new picture (queued by save_picture)."""
+    for size in AVATAR_SIZES:
+        avatar_variant(filename, size)
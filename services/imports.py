@@ -0,0 +1,341 @@
+import csv
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+import bcrypt as bcrypt_lib
+from flask import current_app
+from sqlalchemy import select, insert, func
+from sqlalchemy.exc import IntegrityError
+from models import db, User, Admin, Researcher, Reviewer, HOD, Faculty, ResearchArea
+from services.search import index_rows
+from services.uploads import UploadRejected
+
+
+# ==========================================
+# BULK USER / SYSTEM DATA IMPORT
+# ==========================================
+# Onboards many accounts at once: existing MMU IDs and emails are found with
+# set-based IN queries (not one lookup per user), passwords are bcrypt-hashed
+# in a thread pool (bcrypt releases the GIL while it hashes, so threads run in
+# parallel without forking the web server), and users plus their role rows are
+# written with executemany INSERTs, committed one batch at a time. A batch that
+# still hits a unique constraint (an account saved meanwhile) is rolled back
+# and retried row by row, so only the conflicting rows fail. Bulk INSERTs skip
+# the ORM flush listeners, so the search index is refreshed explicitly.
+ROLE_MODELS = {"Admin": Admin, "HOD": HOD, "Researcher": Researcher, "Reviewer": Reviewer}
+USER_FIELDS = ("mmu_id", "name", "email", "faculty", "role")
+BATCH_SIZE = 1000
+# Bound parameters per IN query; SQLite allows 32766 (999 before 3.32)
+LOOKUP_CHUNK = 900
+# Column sizes the values must fit (PostgreSQL rejects longer strings)
+FIELD_LENGTHS = {
+    field: User.__table__.c[column].type.length
+    for field, column in [
+        ("mmu_id", "mmu_id"),
+        ("name", "name"),
+        ("email", "email"),
+        ("faculty", "faculty"),
+        ("phone_number", "phone_number"),
+    ]
+}
+FIELD_LABELS = {"mmu_id": "MMU ID", "phone_number": "Phone number"}
+
+
+class ImportResult:
+    """Outcome of one import: a (line, mmu_id, status, message) row per record."""
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, line, mmu_id, status, message=""):
+        self.rows.append((line, mmu_id, status, message))
+
+    def count(self, status):
+        return sum(1 for row in self.rows if row[2] == status)
+
+    @property
+    def created(self):
+        return self.count("created")
+
+    def summary(self):
+        failed = self.count("invalid") + self.count("failed")
+        skipped = len(self.rows) - self.created - failed
+        text = (
+            f"{self.created} created, {skipped} skipped as existing or duplicate, "
+            f"{self.count('invalid')} invalid"
+        )
+        if self.count("failed"):
+            text += f", {self.count('failed')} failed to save"
+        return text
+
+
+# ==========================================
+# READING
+# ==========================================
+def read_records(source, name=""):
+    """
+    Records from a CSV or JSON file path or open text stream. CSV needs a
+    header row; JSON is a list of objects, or an object whose "users",
+    "faculties" and "research_areas" keys hold lists. Returns
+    {"users": [...], "faculties": [...], "research_areas": [...]}.
+    """
+    if isinstance(source, str):
+        name = source
+        with open(source, newline="", encoding="utf-8-sig") as f:
+            return read_records(f, name)
+    data = {"users": [], "faculties": [], "research_areas": []}
+    if os.path.splitext(name)[1].lower() == ".json":
+        loaded = json.load(source)
+        if isinstance(loaded, list):
+            loaded = {"users": loaded}
+        if not isinstance(loaded, dict):
+            raise ValueError("JSON data must be a list of records or an object of lists")
+        for key in data:
+            records = loaded.get(key, [])
+            if not isinstance(records, list):
+                raise ValueError(f'"{key}" must be a list')
+            data[key] = records
+        return data
+
+    rows = list(csv.DictReader(source))
+    fields = {field.strip().lower() for field in (rows[0].keys() if rows else [])}
+    if "mmu_id" in fields:
+        data["users"] = rows
+    elif "type" in fields and "name" in fields:
+        # System data CSV: type,name with type "faculty" or "research_area"
+        for row in rows:
+            kind = (row.get("type") or "").strip().lower().replace(" ", "_")
+            key = {"faculty": "faculties", "research_area": "research_areas"}.get(kind)
+            if key:
+                data[key].append(row["name"])
+    return data
+
+
+def read_upload(file_storage):
+    """
+    read_records() for an uploaded .csv or .json file (werkzeug FileStorage).
+    Raises UploadRejected when it is another type or cannot be parsed.
+    """
+    name = file_storage.filename or ""
+    ext = os.path.splitext(name)[1].lower()
+    if ext not in (".csv", ".json"):
+        raise UploadRejected(
+            f"Files of type '{ext}' are not accepted here; upload a .csv or .json file."
+        )
+    stream = io.TextIOWrapper(file_storage.stream, encoding="utf-8-sig", newline="")
+    try:
+        return read_records(stream, name)
+    except (UnicodeDecodeError, csv.Error, ValueError, TypeError, AttributeError) as e:
+        raise UploadRejected(f"The file could not be read ({e}).")
+
+
+# ==========================================
+# PASSWORD HASHING
+# ==========================================
+def _hash_password(args):
+    password, rounds = args
+    return bcrypt_lib.hashpw(password.encode("utf-8"), bcrypt_lib.gensalt(rounds)).decode("utf-8")
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    bcrypt hashes (same format as User.set_password) computed in parallel
+    worker threads; small lists are hashed in the calling thread.
+    """
+    rounds = current_app.config.get("BCRYPT_LOG_ROUNDS", 12)
+    jobs = [(password, rounds) for password in passwords]
+    workers = workers or os.cpu_count() or 1
+    if len(jobs) < 4 or workers == 1:
+        return [_hash_password(job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(_hash_password, jobs))
+
+
+# ==========================================
+# IMPORTING
+# ==========================================
+def _existing(column, values):
+    """The subset of `values` already present in `column`, in chunked IN queries."""
+    values, found = list(values), set()
+    for start in range(0, len(values), LOOKUP_CHUNK):
+        chunk = values[start : start + LOOKUP_CHUNK]
+        found.update(db.session.execute(select(column).where(column.in_(chunk))).scalars())
+    return found
+
+
+def _clean(record, role):
+    """A record as a dict of stripped strings (None when it is not a mapping)."""
+    if not isinstance(record, dict):
+        return None
+    row = {
+        str(key).strip().lower(): "" if value is None else str(value).strip()
+        for key, value in record.items()
+        if key
+    }
+    row["role"] = row.get("role") or row.get("user_role") or role
+    return row
+
+
+def _too_long(row):
+    """Message for the first field longer than its column, or None."""
+    for field, length in FIELD_LENGTHS.items():
+        if len(row.get(field) or "") > length:
+            label = FIELD_LABELS.get(field, field.capitalize())
+            return f"{label} is longer than {length} characters"
+    return None
+
+
+def validate_users(records, role=None, default_password=None, roles=None, faculties=None):
+    """
+    Checks every record and drops the ones that cannot be created. `roles`
+    and `faculties` optionally restrict the accepted values. Returns (rows to
+    create, ImportResult with the rejected records). Line numbers count the
+    CSV header as line 1.
+    """
+    roles = set(roles or ROLE_MODELS)
+    result, valid = ImportResult(), []
+    seen_ids, seen_emails = set(), set()
+    for line, record in enumerate(records, start=2):
+        row = _clean(record, role)
+        if row is None:
+            result.add(line, "", "invalid", "Not a user record")
+            continue
+        row["line"] = line
+        mmu_id = row.get("mmu_id") or ""
+        missing = [field for field in USER_FIELDS if not row.get(field)]
+        password = row.get("password") or default_password
+        if missing:
+            result.add(line, mmu_id, "invalid", f"Missing {', '.join(missing)}")
+        elif row["role"] not in roles:
+            result.add(line, mmu_id, "invalid", f"Role '{row['role']}' is not allowed")
+        elif faculties is not None and row["faculty"] not in faculties:
+            result.add(line, mmu_id, "invalid", f"Unknown faculty '{row['faculty']}'")
+        elif not password:
+            result.add(line, mmu_id, "invalid", "Missing password")
+        elif _too_long(row):
+            result.add(line, mmu_id, "invalid", _too_long(row))
+        elif "@" not in row["email"]:
+            result.add(line, mmu_id, "invalid", "Email not valid")
+        elif mmu_id in seen_ids or row["email"].lower() in seen_emails:
+            result.add(line, mmu_id, "duplicate", "Repeated earlier in this file")
+        else:
+            seen_ids.add(mmu_id)
+            seen_emails.add(row["email"].lower())
+            row["password"] = password
+            valid.append(row)
+
+    existing_ids = _existing(User.mmu_id, [row["mmu_id"] for row in valid])
+    # Emails are compared case-insensitively, as within the file
+    existing_emails = _existing(func.lower(User.email), [row["email"].lower() for row in valid])
+    rows = []
+    for row in valid:
+        if row["mmu_id"] in existing_ids:
+            result.add(row["line"], row["mmu_id"], "exists", "MMU ID already registered")
+        elif row["email"].lower() in existing_emails:
+            result.add(row["line"], row["mmu_id"], "exists", "Email already taken")
+        else:
+            rows.append(row)
+    return rows, result
+
+
+def _insert_users(batch, hashes):
+    """Stages the User and role rows of one batch (executemany INSERTs)."""
+    db.session.execute(
+        insert(User),
+        [
+            dict(
+                mmu_id=row["mmu_id"],
+                name=row["name"],
+                email=row["email"],
+                password=password,
+                faculty=row["faculty"],
+                user_role=row["role"],
+                phone_number=row.get("phone_number") or None,
+            )
+            for row, password in zip(batch, hashes)
+        ],
+    )
+    for role_name, model in ROLE_MODELS.items():
+        members = [dict(mmu_id=row["mmu_id"]) for row in batch if row["role"] == role_name]
+        if members:
+            db.session.execute(insert(model), members)
+    index_rows(db.session, User, [row["mmu_id"] for row in batch])
+
+
+def import_users(
+    records,
+    role=None,
+    default_password=None,
+    roles=None,
+    faculties=None,
+    batch_size=BATCH_SIZE,
+    workers=None,
+    progress=None,
+):
+    """
+    Creates the users in `records` (dicts with mmu_id, name, email, faculty,
+    role and optionally password/phone_number) plus their Admin / HOD /
+    Researcher / Reviewer rows. Existing MMU IDs and emails are skipped.
+    `role` applies to records without one; see validate_users() for `roles`
+    and `faculties`. Commits each batch; returns an ImportResult.
+    """
+    rows, result = validate_users(records, role, default_password, roles, faculties)
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        hashes = hash_passwords([row["password"] for row in batch], workers)
+        try:
+            _insert_users(batch, hashes)
+            db.session.commit()
+            saved = batch
+        except IntegrityError:
+            # Registered since validation (another admin, a second import):
+            # retry one row at a time to find and report the conflicting ones
+            db.session.rollback()
+            saved = []
+            for row, password in zip(batch, hashes):
+                try:
+                    _insert_users([row], [password])
+                    db.session.commit()
+                    saved.append(row)
+                except IntegrityError:
+                    db.session.rollback()
+                    result.add(
+                        row["line"], row["mmu_id"], "failed",
+                        "MMU ID or email was registered while the import ran",
+                    )
+        for row in saved:
+            result.add(row["line"], row["mmu_id"], "created")
+        if progress:
+            progress(start + len(batch), len(rows))
+    result.rows.sort(key=lambda row: row[0])
+    return result
+
+
+def import_names(model, names):
+    """Adds the Faculty / ResearchArea names not present yet. Returns how many were added."""
+    wanted = list(dict.fromkeys(str(name).strip() for name in names if name and str(name).strip()))
+    existing = _existing(model.name, wanted)
+    missing = [name for name in wanted if name not in existing]
+    if missing:
+        db.session.execute(insert(model), [dict(name=name) for name in missing])
+        db.session.commit()
+    return len(missing)
+
+
+def import_data(data, default_password=None, batch_size=BATCH_SIZE, workers=None, progress=None):
+    """Imports faculties, research areas and users from read_records() output."""
+    faculties = import_names(
+        Faculty, [f.get("name") if isinstance(f, dict) else f for f in data["faculties"]]
+    )
+    areas = import_names(
+        ResearchArea, [a.get("name") if isinstance(a, dict) else a for a in data["research_areas"]]
+    )
+    users = import_users(
+        data["users"],
+        default_password=default_password,
+        batch_size=batch_size,
+        workers=workers,
+        progress=progress,
+    )
+    return faculties, areas, users
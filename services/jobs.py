@@ -0,0 +1,251 @@
+import json
+import os
+import socket
+import threading
+import traceback
+from datetime import timedelta
+from flask import current_app, has_app_context
+from sqlalchemy import event, select, update, delete, func
+from models import db, Job, malaysia_now
+
+
+# ==========================================
+# BACKGROUND JOB QUEUE
+# ==========================================
+# Work that does not need to finish before the response (text extraction,
+# thumbnails, large notification fan-outs, deadline reminders) is stored as a
+# Job row in the caller's transaction, so it only exists if the request
+# commits. Workers claim rows with a conditional UPDATE, which is safe across
+# threads and processes sharing the database; no broker is needed.
+# Failed jobs are retried with exponential backoff up to max_attempts.
+#
+# Workers run as daemon threads inside the web process (JOB_WORKER_THREADS)
+# and/or as separate `flask --app main run-worker` processes. Handlers
+# registered with `every=` are periodic: housekeeping keeps one run scheduled.
+RETRY_BASE_SECONDS = 30
+POLL_SECONDS = 5
+CLAIM_BATCH = 10
+# A running job whose worker died is requeued after this long
+LOCK_TIMEOUT = timedelta(minutes=15)
+KEEP_FINISHED = timedelta(days=7)
+HOUSEKEEPING_SECONDS = 60
+
+HANDLERS = {}
+PERIODIC = {}
+ENQUEUED_KEY = "jobs_enqueued"
+
+
+def job_handler(kind, every=None):
+    """
+    Registers a function as the handler for jobs of `kind`. With `every`
+    (a timedelta) the job also runs on that schedule.
+    """
+
+    def register(fn):
+        HANDLERS[kind] = fn
+        if every:
+            PERIODIC[kind] = every
+        return fn
+
+    return register
+
+
+def enqueue(kind, run_at=None, delay=None, key=None, max_attempts=3, **payload):
+    """
+    Stages a job in the current transaction; workers see it once the caller
+    commits. `payload` must be JSON-serialisable and is passed to the handler
+    as keyword arguments. Schedule with `run_at` (a datetime) or `delay`
+    (a timedelta). With `key`, nothing is added while a queued or running job
+    has the same key. Returns the Job, or None when de-duplicated.
+    """
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown job kind '{kind}'")
+    if key:
+        staged = any(isinstance(o, Job) and o.key == key for o in db.session.new)
+        with db.session.no_autoflush:
+            if staged or Job.query.filter(
+                Job.key == key, Job.status.in_(["queued", "running"])
+            ).first():
+                return None
+    job = Job(
+        kind=kind,
+        payload=json.dumps(payload),
+        key=key,
+        max_attempts=max_attempts,
+        run_at=run_at or malaysia_now() + (delay or timedelta(0)),
+    )
+    db.session.add(job)
+    db.session.info[ENQUEUED_KEY] = True
+    return job
+
+
+@event.listens_for(db.session, "after_commit")
+def wake_after_commit(session):
+    if session.info.pop(ENQUEUED_KEY, None) and has_app_context():
+        start_workers(current_app._get_current_object())
+
+
+@event.listens_for(db.session, "after_soft_rollback")
+def forget_enqueued(session, previous_transaction):
+    session.info.pop(ENQUEUED_KEY, None)
+
+
+# ==========================================
+# CLAIMING AND RUNNING
+# ==========================================
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+
+
+def claim_next(worker):
+    """Marks the next due job as running for `worker` and returns it (or None)."""
+    now = malaysia_now()
+    due = db.session.execute(
+        select(Job.job_id)
+        .where(Job.status == "queued", Job.run_at <= now)
+        .order_by(Job.run_at, Job.job_id)
+        .limit(CLAIM_BATCH)
+    ).scalars().all()
+    for job_id in due:
+        # Only one worker's UPDATE can match while the row is still queued
+        claimed = db.session.execute(
+            update(Job)
+            .where(Job.job_id == job_id, Job.status == "queued")
+            .values(
+                status="running",
+                locked_by=worker,
+                locked_at=now,
+                attempts=Job.attempts + 1,
+            )
+        ).rowcount
+        db.session.commit()
+        if claimed:
+            return db.session.get(Job, job_id)
+    return None
+
+
+def run_job(job):
+    """
+    Runs a claimed job. The handler's changes and the job's "done" status are
+    committed together; on error they are rolled back and the job is retried
+    later or marked failed.
+    """
+    job_id, kind = job.job_id, job.kind
+    try:
+        handler = HANDLERS.get(kind)
+        if handler is None:
+            raise LookupError(f"No handler registered for '{kind}'")
+        # A request context lets handlers build links with url_for
+        with current_app.test_request_context():
+            handler(**json.loads(job.payload))
+        job.status, job.finished_at, job.last_error = "done", malaysia_now(), None
+        db.session.commit()
+        return True
+    except Exception:
+        db.session.rollback()
+        current_app.logger.exception("Job %s (%s) failed", job_id, kind)
+        job = db.session.get(Job, job_id)
+        job.last_error = traceback.format_exc(limit=5)[-4000:]
+        job.locked_by = job.locked_at = None
+        if job.attempts >= job.max_attempts:
+            job.status, job.finished_at = "failed", malaysia_now()
+        else:
+            job.status = "queued"
+            job.run_at = malaysia_now() + timedelta(
+                seconds=RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+            )
+        db.session.commit()
+        return False
+
+
+def schedule_periodic():
+    """Queues the next run of every periodic job that has none pending."""
+    for kind, every in PERIODIC.items():
+        key = f"periodic:{kind}"
+        last = db.session.execute(
+            select(func.max(Job.finished_at)).where(Job.key == key)
+        ).scalar()
+        enqueue(kind, run_at=last + every if last else None, key=key)
+
+
+def housekeeping():
+    """
+    Requeues jobs whose worker died, removes old finished jobs and schedules
+    periodic jobs.
+    """
+    now = malaysia_now()
+    stale = (Job.status == "running", Job.locked_at < now - LOCK_TIMEOUT)
+    db.session.execute(
+        update(Job)
+        .where(*stale, Job.attempts >= Job.max_attempts)
+        .values(status="failed", finished_at=now, last_error="Worker lock expired")
+    )
+    db.session.execute(
+        update(Job)
+        .where(*stale)
+        .values(status="queued", locked_by=None, locked_at=None)
+    )
+    db.session.execute(
+        delete(Job).where(Job.status == "done", Job.finished_at < now - KEEP_FINISHED)
+    )
+    schedule_periodic()
+    db.session.commit()
+
+
+def queue_depth():
+    """{status: number of jobs} in one query; "queued" includes jobs not yet due."""
+    return dict(
+        db.session.execute(select(Job.status, func.count()).group_by(Job.status)).all()
+    )
+
+
+# ==========================================
+# WORKERS
+# ==========================================
+_wakeup = threading.Event()
+_workers = []
+_workers_lock = threading.Lock()
+
+
+def work(app, burst=False, stop=None):
+    """
+    Worker loop: runs due jobs until `stop` is set. With `burst`, returns as
+    soon as no job is due. Returns the number of jobs run.
+    """
+    name, done, idle_since_housekeeping = worker_name(), 0, None
+    while not (stop and stop.is_set()):
+        with app.app_context():
+            if idle_since_housekeeping is None:
+                housekeeping()
+                idle_since_housekeeping = 0
+            job = claim_next(name)
+            if job is not None:
+                run_job(job)
+                done += 1
+                continue
+        if burst:
+            break
+        _wakeup.wait(POLL_SECONDS)
+        _wakeup.clear()
+        idle_since_housekeeping += POLL_SECONDS
+        if idle_since_housekeeping >= HOUSEKEEPING_SECONDS:
+            idle_since_housekeeping = None
+    return done
+
+
+def start_workers(app, wake=True):
+    """Makes sure the in-process worker threads are running and wakes them."""
+    count = app.config.get("JOB_WORKER_THREADS", 1)
+    with _workers_lock:
+        _workers[:] = [t for t in _workers if t.is_alive()]
+        while len(_workers) < count:
+            thread = threading.Thread(
+                target=work,
+                args=(app,),
+                name=f"job-worker-{len(_workers) + 1}",
+                daemon=True,
+            )
+            thread.start()
+            _workers.append(thread)
+    if wake:
+        _wakeup.set()
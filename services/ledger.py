@@ -0,0 +1,113 @@
+from sqlalchemy import event, func, update
+from models import db, Budget, Grant, Proposal, BudgetLedger
+from services.changes import track_old_values, pending_changes, contribution_delta
+
+# The ledger only ever has one row
+LEDGER_ID = 1
+
+# Ledger column -> (model, contribution of one row)
+LEDGER_SOURCES = {
+    "total_funds_in": (Budget, lambda get: get("amount")),
+    "total_grants_out": (Grant, lambda get: get("grant_amount")),
+    "total_approved_requested": (
+        Proposal,
+        lambda get: get("requested_budget") if get("status") == "Approved" else 0,
+    ),
+}
+
+track_old_values(
+    Budget.amount, Grant.grant_amount, Proposal.requested_budget, Proposal.status
+)
+
+
+# ==========================================
+# READ / REBUILD
+# ==========================================
+def compute_budget_totals(session=None):
+    """Recomputes every ledger column from the source tables (full scans)."""
+    session = session or db.session
+    return {
+        "total_funds_in": session.query(func.sum(Budget.amount)).scalar() or 0.0,
+        "total_grants_out": session.query(func.sum(Grant.grant_amount)).scalar()
+        or 0.0,
+        "total_approved_requested": session.query(
+            func.sum(Proposal.requested_budget)
+        )
+        .filter(Proposal.status == "Approved")
+        .scalar()
+        or 0.0,
+    }
+
+
+def rebuild_budget_ledger(session=None):
+    """
+    Rebuilds the ledger row from scratch. Caller is responsible for committing.
+    Returns (ledger, drift) where drift maps each column to (stored, actual)
+    for columns that did not match.
+    """
+    session = session or db.session
+    totals = compute_budget_totals(session)
+    ledger = session.get(BudgetLedger, LEDGER_ID)
+    drift = {}
+    if ledger is None:
+        ledger = BudgetLedger(ledger_id=LEDGER_ID)
+        session.add(ledger)
+    else:
+        for column, actual in totals.items():
+            stored = getattr(ledger, column)
+            if abs((stored or 0.0) - actual) > 0.005:
+                drift[column] = (stored, actual)
+    for column, actual in totals.items():
+        setattr(ledger, column, actual)
+    return ledger, drift
+
+
+def get_budget_ledger():
+    """
+    O(1) read of the system budget totals.
+    Seeds the ledger on first use (e.g. a fresh database).
+    """
+    ledger = db.session.get(BudgetLedger, LEDGER_ID)
+    if ledger is None:
+        ledger, _ = rebuild_budget_ledger()
+        db.session.commit()
+    return ledger
+
+
+# ==========================================
+# TRANSACTIONAL MAINTENANCE
+# ==========================================
+@event.listens_for(db.session, "before_flush")
+def apply_budget_deltas(session, flush_context, instances):
+    """
+    Folds every pending Budget/Grant/Proposal change into the ledger row within
+    the same transaction, so the totals commit (or roll back) with the data.
+    """
+    deltas = {}
+    for column, (model, value_of) in LEDGER_SOURCES.items():
+        delta = sum(
+            contribution_delta(obj, kind, value_of)
+            for obj, kind in pending_changes(session, model)
+        )
+        if delta:
+            deltas[column] = delta
+
+    if not deltas:
+        return
+
+    result = session.execute(
+        update(BudgetLedger)
+        .where(BudgetLedger.ledger_id == LEDGER_ID)
+        .values(
+            {
+                column: getattr(BudgetLedger, column) + delta
+                for column, delta in deltas.items()
+            }
+        )
+    )
+    if result.rowcount == 0:
+        # No ledger yet: seed it from the tables as they are before this flush,
+        # then apply this flush on top
+        ledger, _ = rebuild_budget_ledger(session)
+        for column, delta in deltas.items():
+            setattr(ledger, column, getattr(ledger, column) + delta)
@@ -0,0 +1,236 @@
+import math
+import threading
+import time
+from bisect import bisect_left
+from flask import g, request
+from services.jobs import queue_depth
+
+
+# ==========================================
+# METRICS REGISTRY
+# ==========================================
+# In-process counters, gauges and histograms, served in the Prometheus text
+# exposition format at /metrics. Recording a sample is a dict lookup on the
+# label values (a tuple, in the order the metric declares them) plus a few
+# additions under a lock, well under a microsecond, so the registry is always on.
+# Gauges that describe the system (connection pools, job queue) are computed
+# by callbacks when /metrics is scraped rather than kept up to date. Values
+# are per process: with several server processes, scrape each one.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f"{self.name}{_labels(self.label_names, labels)} {_number(value)}"
+            for labels, value in values
+        ]
+
+
+class Gauge(Metric):
+    """A value set directly, or read from `callback` (-> {labels: value}) on scrape."""
+
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=(), callback=None):
+        super().__init__(name, help_text, labels)
+        self.callback = callback
+
+    def set(self, labels, value):
+        with self._lock:
+            self._values[labels] = value
+
+    def samples(self):
+        if self.callback:
+            values = sorted(self.callback().items())
+        else:
+            with self._lock:
+                values = sorted(self._values.items())
+        return [
+            f"{self.name}{_labels(self.label_names, labels)} {_number(value)}"
+            for labels, value in values
+        ]
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets) + (math.inf,)
+
+    def observe(self, labels, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                # [count per bucket..., sum]
+                series = self._values[labels] = [0] * len(self.buckets) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self):
+        with self._lock:
+            values = sorted((labels, list(series)) for labels, series in self._values.items())
+        lines = []
+        for labels, series in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}"
+                )
+            names = _labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{names} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{names} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+
+    def register(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric '{metric.name}' is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help_text, labels=()):
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name, help_text, labels=(), callback=None):
+        return self.register(Gauge(name, help_text, labels, callback))
+
+    def histogram(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, help_text, labels, buckets))
+
+    def exposition(self):
+        """Every metric in the Prometheus text format (version 0.0.4)."""
+        lines = []
+        for metric in self.metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+REQUEST_LABELS = ("blueprint", "endpoint")
+request_latency = registry.histogram(
+    "rgms_request_duration_seconds", "Time to handle a request.", REQUEST_LABELS
+)
+requests_total = registry.counter(
+    "rgms_requests_total", "Requests handled.", REQUEST_LABELS + ("method", "status")
+)
+errors_total = registry.counter(
+    "rgms_request_errors_total",
+    "Requests that raised an exception or returned a 5xx status.",
+    REQUEST_LABELS,
+)
+
+
+# ==========================================
+# REQUEST TIMING AND SYSTEM GAUGES
+# ==========================================
+def _pool_usage(engines):
+    usage = {}
+    for name, engine in engines.items():
+        pool, database = engine.pool, name or "primary"
+        if hasattr(pool, "checkedout"):
+            usage[(database, "checked_out")] = pool.checkedout()
+            usage[(database, "idle")] = pool.checkedin()
+            usage[(database, "overflow")] = max(pool.overflow(), 0)
+            usage[(database, "size")] = pool.size()
+    return usage
+
+
+# Engines whose pools the gauge reports, {bind name: engine}, filled by init_metrics
+_engines = {}
+
+pool_connections = registry.gauge(
+    "rgms_db_pool_connections",
+    "Connections in each database pool, by state.",
+    ("database", "state"),
+    callback=lambda: _pool_usage(_engines),
+)
+job_counts = registry.gauge(
+    "rgms_jobs",
+    "Background jobs by status.",
+    ("status",),
+    callback=lambda: {(status,): count for status, count in queue_depth().items()},
+)
+
+
+def init_metrics(app, engines):
+    """
+    Times every request of `app` into the request metrics above and adds the
+    connection pools of `engines` ({bind name: engine}) to the pool gauge.
+    Every metric is registered once per process, so calling this again (a
+    second app, an app factory in tests) only wires up the new app.
+    """
+    _engines.update(engines)
+    if app.extensions.get("rgms_metrics"):
+        return
+    app.extensions["rgms_metrics"] = True
+
+    @app.before_request
+    def start_request_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def record_response(response):
+        g.response_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def record_request(exc):
+        started = g.pop("request_started", None)
+        if started is None:
+            return
+        labels = (request.blueprint or "app", request.endpoint or "<unmatched>")
+        status = 500 if exc is not None else g.pop("response_status", 500)
+        request_latency.observe(labels, time.perf_counter() - started)
+        requests_total.inc(labels + (request.method, str(status)))
+        if status >= 500:
+            errors_total.inc(labels)
@@ -0,0 +1,123 @@
+from collections import defaultdict
+from sqlalchemy import event, insert, update, case
+from models import db, User, Notification
+from services.changes import track_old_values, pending_changes, old_value
+from services.jobs import job_handler
+
+track_old_values(Notification.is_read, Notification.recipient_id)
+
+
+# ==========================================
+# UNREAD COUNTER MAINTENANCE
+# ==========================================
+def _unread_contribution(get):
+    # is_read is still None on new rows until the column default is applied
+    return (get("recipient_id"), 0 if get("is_read") else 1)
+
+
+@event.listens_for(db.session, "before_flush")
+def apply_unread_deltas(session, flush_context, instances):
+    """
+    Keeps User.unread_notifications in step with every Notification that is
+    added, marked read/unread, re-addressed or deleted in the coming flush.
+    """
+    deltas = defaultdict(int)
+    for notif, kind in pending_changes(session, Notification):
+        if kind != "deleted":
+            recipient, unread = _unread_contribution(lambda a: getattr(notif, a))
+            deltas[recipient] += unread
+        if kind != "new":
+            recipient, unread = _unread_contribution(lambda a: old_value(notif, a))
+            deltas[recipient] -= unread
+
+    bump_unread(session, deltas)
+
+
+def bump_unread(session, deltas):
+    """Applies {recipient_id: delta} to the unread counters in place."""
+    for recipient_id, delta in deltas.items():
+        if delta and recipient_id:
+            session.execute(
+                update(User)
+                .where(User.mmu_id == recipient_id)
+                .values(unread_notifications=User.unread_notifications + delta)
+            )
+
+
+# ==========================================
+# DEFERRED FAN-OUT
+# ==========================================
+# Notifications staged during a request are held on the session as plain rows
+# rather than added as objects, so they are neither split up by the autoflushes
+# of later queries in the route nor inserted one statement per row (the ORM
+# needs RETURNING to fetch each primary key). They join the caller's
+# transaction at commit time and are discarded on rollback.
+PENDING_KEY = "pending_notifications"
+
+
+def stage_notifications(rows):
+    db.session.info.setdefault(PENDING_KEY, []).extend(rows)
+
+
+@job_handler("deliver_notifications")
+def deliver_notifications(rows):
+    """Background delivery for fan-outs too large to insert inside the request."""
+    stage_notifications(rows)
+
+
+@event.listens_for(db.session, "before_commit")
+def insert_pending_notifications(session):
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    # Single executemany INSERT for the whole batch
+    session.execute(insert(Notification), pending)
+
+    deltas = defaultdict(int)
+    for row in pending:
+        if not row.get("is_read"):
+            deltas[row["recipient_id"]] += 1
+    bump_unread(session, deltas)
+
+
+@event.listens_for(db.session, "after_soft_rollback")
+def discard_pending_notifications(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
+
+
+def mark_all_read(user):
+    """Marks every unread notification for a user as read in one UPDATE."""
+    marked = Notification.query.filter_by(recipient_id=user.mmu_id, is_read=False).update(
+        {"is_read": True}, synchronize_session=False
+    )
+    # Bulk updates bypass the flush listener, so take off exactly the rows
+    # marked; a notification inserted meanwhile keeps its count
+    db.session.execute(
+        update(User)
+        .where(User.mmu_id == user.mmu_id)
+        .values(
+            unread_notifications=case(
+                (User.unread_notifications > marked, User.unread_notifications - marked),
+                else_=0,
+            )
+        )
+    )
+    return marked
+
+
+def recount_unread(session=None):
+    """Recomputes every user's unread counter from the Notification table."""
+    session = session or db.session
+    unread = (
+        session.query(db.func.count(Notification.id))
+        .filter(
+            Notification.recipient_id == User.mmu_id, Notification.is_read == False
+        )
+        .correlate(User)
+        .scalar_subquery()
+    )
+    return session.execute(
+        update(User)
+        .values(unread_notifications=unread)
+        .execution_options(synchronize_session=False)
+    ).rowcount
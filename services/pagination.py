@@ -0,0 +1,186 @@
+import base64
+import json
+from datetime import date, datetime
+from flask import current_app, request, abort
+from sqlalchemy import Column, and_, or_, inspect
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import UnaryExpression
+
+
+# ==========================================
+# SHARED LIST PAGINATION
+# ==========================================
+# Two modes behind one interface:
+# - offset (default): Flask-SQLAlchemy .paginate(), with page numbers and a total,
+#   at the cost of a COUNT(*) and an OFFSET that gets slower on deep pages.
+# - cursor (opt-in): keyset pagination on the list's sort order. No count, and
+#   every page is an index range scan. Enabled with the CURSOR_PAGINATION config
+#   flag, or per request by passing the cursor parameter (empty for page one).
+# Templates build their links with **pagination.next_args / **pagination.prev_args
+# so the same markup works for both modes.
+
+
+class CursorPagination:
+    """Page of results from keyset pagination (mirrors the parts of
+    Flask-SQLAlchemy's Pagination the templates use)."""
+
+    is_cursor = True
+    page = None
+    pages = None
+    total = None
+
+    def __init__(self, items, per_page, has_prev, has_next, prev_args, next_args):
+        self.items = items
+        self.per_page = per_page
+        self.has_prev = has_prev
+        self.has_next = has_next
+        self.prev_args = prev_args
+        self.next_args = next_args
+
+    def iter_pages(self, **kwargs):
+        # Page numbers are unknown without a count
+        return iter(())
+
+
+def _sort_keys(query, order):
+    """[(column, descending)] for the ORDER BY, ending in the primary key."""
+    keys = []
+    for expr in order:
+        if isinstance(expr, UnaryExpression):
+            keys.append((expr.element, expr.modifier == operators.desc_op))
+        else:
+            keys.append((expr, False))
+    # The primary key breaks ties so every row has a unique position
+    entity = query.column_descriptions[0]["entity"]
+    for pk in inspect(entity).primary_key:
+        if not any(col is pk for col, _ in keys):
+            keys.append((pk, keys[-1][1] if keys else False))
+    return keys
+
+
+def _order_by(keys, reverse=False):
+    return [col.desc() if desc != reverse else col.asc() for col, desc in keys]
+
+
+def _encode_cursor(direction, values):
+    raw = json.dumps(
+        {
+            "d": direction,
+            "v": [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values],
+        }
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+class InvalidCursor(ValueError):
+    """A cursor that was not produced by _encode_cursor for this list."""
+
+
+def _decode_cursor(token, keys):
+    """
+    Returns (direction, values), or None for page one (no or empty cursor).
+    Raises InvalidCursor when the token is malformed or its values do not fit
+    the sort columns.
+    """
+    if not token:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        if data["d"] not in ("n", "p"):
+            raise ValueError(f"unknown direction {data['d']!r}")
+        values = []
+        for (col, _), value in zip(keys, data["v"], strict=True):
+            python_type = _python_type(col)
+            if value is not None and python_type in (date, datetime):
+                value = python_type.fromisoformat(value)
+            elif value is not None and not _fits(value, python_type):
+                raise ValueError(f"{value!r} is not a {python_type.__name__}")
+            values.append(value)
+        return data["d"], values
+    except (ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursor(str(exc)) from exc
+
+
+def _python_type(col):
+    try:
+        return col.type.python_type
+    except NotImplementedError:
+        return None  # a custom type: values are passed through unchecked
+
+
+def _fits(value, python_type):
+    if python_type is None:
+        return True
+    if isinstance(value, bool):
+        return python_type is bool
+    if python_type is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, python_type)
+
+
+def _after(keys, values, reverse):
+    """Rows strictly after `values` in the sort order (before, if reverse)."""
+    clauses = []
+    for i, (col, desc) in enumerate(keys):
+        if desc != reverse:
+            beyond = col < values[i]
+        else:
+            beyond = col > values[i]
+        ties = [keys[j][0] == values[j] for j in range(i)]
+        clauses.append(and_(*ties, beyond))
+    return or_(*clauses)
+
+
+def _row_values(item, keys):
+    return [getattr(item, col.key) for col, _ in keys]
+
+
+def paginate_listing(query, order=(), per_page=8, page_param="page", cursor_param="cursor"):
+    """
+    Orders and paginates a list query, reading the page or cursor from the
+    request args. `order` is the list's sort order (e.g. [Proposal.title.asc()]);
+    the primary key is appended as a tiebreaker.
+    """
+    keys = _sort_keys(query, order)
+    token = request.args.get(cursor_param)
+    use_cursor = token is not None or current_app.config.get("CURSOR_PAGINATION")
+    # A cursor stores the last row's sort values, so computed sort keys
+    # (e.g. search relevance) page by offset instead
+    use_cursor = use_cursor and all(isinstance(col, Column) for col, _ in keys)
+
+    if not use_cursor:
+        page = request.args.get(page_param, 1, type=int)
+        pagination = query.order_by(*_order_by(keys)).paginate(
+            page=page, per_page=per_page, error_out=False
+        )
+        pagination.is_cursor = False
+        pagination.prev_args = {page_param: pagination.prev_num}
+        pagination.next_args = {page_param: pagination.next_num}
+        return pagination
+
+    try:
+        cursor = _decode_cursor(token, keys)
+    except InvalidCursor:
+        abort(400, "This page link is invalid. Please go back to the first page of the list.")
+    reverse = cursor is not None and cursor[0] == "p"
+    if cursor:
+        query = query.filter(_after(keys, cursor[1], reverse))
+
+    # One extra row tells us whether there is another page in that direction
+    rows = query.order_by(*_order_by(keys, reverse)).limit(per_page + 1).all()
+    more = len(rows) > per_page
+    items = rows[:per_page]
+    if reverse:
+        items.reverse()
+        has_prev, has_next = more, True
+    else:
+        has_prev, has_next = cursor is not None, more
+
+    prev_args = next_args = {}
+    if items and has_prev:
+        prev_args = {cursor_param: _encode_cursor("p", _row_values(items[0], keys))}
+    if items and has_next:
+        next_args = {cursor_param: _encode_cursor("n", _row_values(items[-1], keys))}
+    return CursorPagination(
+        items, per_page, bool(prev_args), bool(next_args), prev_args, next_args
+    )
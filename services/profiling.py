@@ -0,0 +1,177 @@
+import heapq
+import logging
+import os
+import re
+import threading
+import time
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+
+# ==========================================
+# SQL INSTRUMENTATION
+# ==========================================
+# Engine events time every statement and request hooks fold each request's
+# totals (queries, DB time, slowest statements) into per-endpoint aggregates
+# kept in memory by each process. Per statement this costs two perf_counter()
+# calls and a few additions, so it stays on in production. Statements slower
+# than SLOW_QUERY_MS also go to the slow-query log, with bound parameter values
+# and quoted literals redacted.
+SLOWEST_KEPT = 5
+STATEMENT_CHARS = 500
+STARTED_KEY = "query_started"
+
+slow_log = logging.getLogger("rgms.slow_queries")
+_literals = re.compile(r"'(?:[^']|'')*'")
+_whitespace = re.compile(r"\s+")
+
+
+def redact(statement):
+    """Statement text safe to log: quoted literals become '?', whitespace collapsed."""
+    statement = _whitespace.sub(" ", _literals.sub("'?'", statement)).strip()
+    if len(statement) > STATEMENT_CHARS:
+        statement = statement[:STATEMENT_CHARS] + "..."
+    return statement
+
+
+class RequestQueries:
+    """Statements run while handling one request."""
+
+    __slots__ = ("count", "seconds", "slowest")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.slowest = []  # min-heap of (seconds, raw statement)
+
+    def add(self, statement, seconds):
+        self.count += 1
+        self.seconds += seconds
+        if len(self.slowest) < SLOWEST_KEPT:
+            heapq.heappush(self.slowest, (seconds, statement))
+        elif seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (seconds, statement))
+
+
+class EndpointQueries:
+    """Totals of every request one endpoint has served since start (or reset)."""
+
+    __slots__ = ("requests", "queries", "seconds", "max_queries", "max_seconds", "slowest")
+
+    def __init__(self):
+        self.requests = self.queries = self.max_queries = 0
+        self.seconds = self.max_seconds = 0.0
+        self.slowest = {}  # redacted statement -> slowest seconds seen
+
+    def add(self, queries, slowest):
+        self.requests += 1
+        self.queries += queries.count
+        self.seconds += queries.seconds
+        self.max_queries = max(self.max_queries, queries.count)
+        self.max_seconds = max(self.max_seconds, queries.seconds)
+        for seconds, statement in slowest:
+            if seconds > self.slowest.get(statement, 0):
+                self.slowest[statement] = seconds
+        if len(self.slowest) > SLOWEST_KEPT:
+            self.slowest = dict(
+                sorted(self.slowest.items(), key=lambda item: -item[1])[:SLOWEST_KEPT]
+            )
+
+
+_lock = threading.Lock()
+_endpoints = {}
+
+
+def query_stats():
+    """Per-endpoint aggregates of this process, most total DB time first."""
+    with _lock:
+        rows = [
+            dict(
+                endpoint=endpoint,
+                requests=stats.requests,
+                queries=stats.queries,
+                avg_queries=stats.queries / stats.requests,
+                max_queries=stats.max_queries,
+                db_ms=stats.seconds * 1000,
+                avg_db_ms=stats.seconds * 1000 / stats.requests,
+                max_db_ms=stats.max_seconds * 1000,
+                slowest=sorted(
+                    ((seconds * 1000, statement) for statement, seconds in stats.slowest.items()),
+                    reverse=True,
+                ),
+            )
+            for endpoint, stats in _endpoints.items()
+        ]
+    return sorted(rows, key=lambda row: -row["db_ms"])
+
+
+def reset_query_stats():
+    with _lock:
+        _endpoints.clear()
+
+
+def _current_endpoint():
+    if not has_request_context():
+        return "-"
+    return request.endpoint or "background"
+
+
+def instrument_engine(engine, slow_seconds):
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info[STARTED_KEY].pop()
+        queries = g.get("sql_queries") if has_request_context() else None
+        if queries is not None:
+            queries.add(statement, seconds)
+        if seconds >= slow_seconds:
+            rows = len(parameters) if executemany else 1
+            slow_log.warning(
+                "%.1f ms %s %s [%d parameter set(s) redacted]",
+                seconds * 1000,
+                _current_endpoint(),
+                redact(statement),
+                rows,
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def on_error(context):
+        started = context.connection.info.get(STARTED_KEY) if context.connection else None
+        if started:
+            started.pop()
+
+    return engine
+
+
+def init_profiling(app, engines):
+    """Instruments `engines` and records per-endpoint totals for `app`'s requests."""
+    for engine in engines:
+        instrument_engine(engine, app.config["SLOW_QUERY_MS"] / 1000)
+
+    path = app.config.get("SLOW_QUERY_LOG")
+    if path and not slow_log.handlers:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handler = logging.FileHandler(path)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        slow_log.addHandler(handler)
+        slow_log.propagate = False
+
+    @app.before_request
+    def start_query_count():
+        g.sql_queries = RequestQueries()
+
+    @app.teardown_request
+    def record_query_count(exc):
+        queries = g.pop("sql_queries", None)
+        if queries is None:
+            return
+        endpoint = request.endpoint or "<unmatched>"
+        slowest = [(seconds, redact(statement)) for seconds, statement in queries.slowest]
+        with _lock:
+            stats = _endpoints.get(endpoint)
+            if stats is None:
+                stats = _endpoints[endpoint] = EndpointQueries()
+            stats.add(queries, slowest)
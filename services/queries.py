@@ -0,0 +1,37 @@
+from sqlalchemy.orm import joinedload
+from models import Researcher, Proposal, Grant, Notification
+
+
+# ==========================================
+# LIST PAGE EAGER LOADING
+# ==========================================
+# Relationships the list templates walk for every row. Loading them with the
+# page query avoids two to three lazy loads per row
+# (e.g. p.researcher.user_info.name, p.grant_award.grant_amount).
+LISTING_OPTIONS = {
+    Proposal: lambda: [
+        joinedload(Proposal.researcher).joinedload(Researcher.user_info),
+        joinedload(Proposal.grant_award),
+    ],
+    Grant: lambda: [
+        joinedload(Grant.proposal)
+        .joinedload(Proposal.researcher)
+        .joinedload(Researcher.user_info)
+    ],
+    Notification: lambda: [joinedload(Notification.sender)],
+}
+
+
+def listing_options(model):
+    """Loader options a list page of `model` rows needs (empty if none registered)."""
+    factory = LISTING_OPTIONS.get(model)
+    return factory() if factory else []
+
+
+def with_listing_options(query):
+    """
+    Applies the registered eager-load options for the query's primary entity.
+    New list views only need to wrap their query in this to get the same loading.
+    """
+    model = query.column_descriptions[0]["entity"]
+    return query.options(*listing_options(model))
@@ -0,0 +1,75 @@
+import time
+from functools import wraps
+from flask import current_app, g, has_request_context, request, session as cookie_session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import Select, event
+
+
+# ==========================================
+# READ-REPLICA ROUTING
+# ==========================================
+# Reporting pages can read from a replica (SQLALCHEMY_BINDS["replica"]: a
+# copied SQLite file or a PostgreSQL standby) so they do not compete with
+# writes on the primary. A query goes to the replica only when all of these hold:
+# - the route opted in with @read_replica or read_replica_blueprint(), and the
+#   request is a GET / HEAD
+# - it is a plain SELECT (flushes, UPDATEs and raw SQL always use the primary)
+# - this session has not written anything yet (read-your-own-writes)
+# - the user has not committed a write within REPLICA_LAG_SECONDS, so the page
+#   shown after a form post is not missing what was just saved
+# Without a replica bind everything stays on the primary.
+REPLICA_BIND = "replica"
+STICKY_KEY = "_db_primary_until"
+WROTE_KEY = "wrote_to_primary"
+
+
+class RoutingSession(Session):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None:
+            if self._flushing or (clause is not None and not isinstance(clause, Select)):
+                self.info[WROTE_KEY] = True
+            elif clause is not None and _replica_allowed(self):
+                replica = self._db.engines.get(REPLICA_BIND)
+                if replica is not None:
+                    return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+def _replica_allowed(db_session):
+    return (
+        has_request_context()
+        and g.get("use_replica", False)
+        and not db_session.info.get(WROTE_KEY)
+        and cookie_session.get(STICKY_KEY, 0) < time.time()
+    )
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def stick_to_primary(db_session):
+    """After a committed write, keep this user's reads on the primary for a while."""
+    if db_session.info.get(WROTE_KEY) and has_request_context():
+        lag = current_app.config.get("REPLICA_LAG_SECONDS", 0)
+        if lag and REPLICA_BIND in db_session._db.engines:
+            cookie_session[STICKY_KEY] = time.time() + lag
+
+
+def _use_replica():
+    if request.method in ("GET", "HEAD"):
+        g.use_replica = True
+
+
+def read_replica(view):
+    """Route decorator: serve this page's reads from the replica when possible."""
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        _use_replica()
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+def read_replica_blueprint(blueprint):
+    """Sends the reads of every GET route in `blueprint` to the replica."""
+    blueprint.before_request(_use_replica)
+    return blueprint
@@ -0,0 +1,296 @@
+import re
+from collections import defaultdict
+from sqlalchemy import event, text, select, table, column, literal_column, bindparam, func, or_
+from sqlalchemy.orm.attributes import get_history
+from models import db, User, Researcher, Proposal, GrantCycle, ProgressReport, DocumentText
+from services.changes import pending_changes
+
+
+# ==========================================
+# FULL-TEXT SEARCH INDEX (SQLite FTS5)
+# ==========================================
+# The list pages' search boxes used ilike('%q%'), which has to scan every row.
+# Each searchable model gets an FTS5 table instead, kept in step with the ORM
+# by the after_flush listener below. Queries are prefix matches on every word
+# typed ("mach lear" finds "Machine Learning") ranked with bm25.
+# On other databases, or before the index exists, search falls back to ilike
+# over the same fields.
+# Proposals also match on the extracted text of their current document and
+# progress reports (see services/extraction.py).
+
+
+class SearchIndex:
+    """An FTS5 table mirroring some text columns of one model."""
+
+    def __init__(self, model, name, key, columns, weights, source, fallback, watch):
+        self.model = model
+        self.name = name
+        self.key = key  # column of the FTS table holding the row's primary key
+        self.columns = columns
+        self.weights = weights  # bm25 weight per FTS column, key column included
+        self.source = source  # SELECT key, *columns ... (ends before WHERE)
+        self.fallback = fallback  # like pattern -> criterion, for non-FTS backends
+        self.watch = watch  # model attributes whose change means a reindex
+
+    @property
+    def pk(self):
+        return getattr(self.model, self.model.__mapper__.primary_key[0].key)
+
+    @property
+    def ddl(self):
+        if self.key == "rowid":
+            cols = ", ".join(self.columns)
+        else:
+            cols = ", ".join((f"{self.key} UNINDEXED",) + self.columns)
+        return (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.name} USING fts5("
+            f"{cols}, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+
+    def _fts(self):
+        return table(self.name, column(self.key))
+
+    def matching_keys(self, match):
+        fts = self._fts()
+        return select(fts.c[self.key]).where(
+            literal_column(self.name).op("MATCH")(match)
+        )
+
+    def rank(self, match):
+        """Correlated bm25 score of the outer query's row (lower is better)."""
+        fts = self._fts()
+        weights = ", ".join(str(w) for w in self.weights)
+        return (
+            select(literal_column(f"bm25({self.name}, {weights})"))
+            .where(literal_column(self.name).op("MATCH")(match), fts.c[self.key] == self.pk)
+            .scalar_subquery()
+        )
+
+    def refresh(self, conn, condition, ids):
+        """Re-copies the source rows selected by `condition` (uses :ids)."""
+        rows = conn.execute(
+            text(f"{self.source} WHERE {condition}").bindparams(
+                bindparam("ids", expanding=True)
+            ),
+            {"ids": list(ids)},
+        ).all()
+        # FTS5 has no upsert: drop the old copies, then insert the current text
+        self.remove(conn, [row[0] for row in rows])
+        if rows:
+            self._insert(conn, rows)
+
+    def remove(self, conn, keys):
+        if keys:
+            conn.execute(
+                text(f"DELETE FROM {self.name} WHERE {self.key} IN :keys").bindparams(
+                    bindparam("keys", expanding=True)
+                ),
+                {"keys": list(keys)},
+            )
+
+    def rebuild(self, conn):
+        conn.execute(text(f"DELETE FROM {self.name}"))
+        rows = conn.execute(text(self.source)).all()
+        if rows:
+            self._insert(conn, rows)
+        return len(rows)
+
+    def _insert(self, conn, rows):
+        names = (self.key,) + self.columns
+        conn.execute(
+            text(
+                f"INSERT INTO {self.name} ({', '.join(names)}) "
+                f"VALUES ({', '.join(':' + n for n in names)})"
+            ),
+            [dict(zip(names, row)) for row in rows],
+        )
+
+
+SEARCH_INDEXES = {
+    Proposal: SearchIndex(
+        Proposal,
+        "proposal_search",
+        key="rowid",
+        columns=("title", "research_area", "researcher_name"),
+        weights=(10.0, 3.0, 2.0),
+        source=(
+            'SELECT p.proposal_id, p.title, p.research_area, u.name FROM proposal p '
+            'LEFT JOIN researcher r ON r.researcher_id = p.researcher_id '
+            'LEFT JOIN "user" u ON u.mmu_id = r.mmu_id'
+        ),
+        fallback=lambda like: or_(
+            Proposal.title.ilike(like),
+            Proposal.research_area.ilike(like),
+            Proposal.researcher.has(Researcher.user_info.has(User.name.ilike(like))),
+        ),
+        watch=("title", "research_area", "researcher_id"),
+    ),
+    User: SearchIndex(
+        User,
+        "user_search",
+        key="mmu_id",
+        columns=("name", "email"),
+        weights=(0.0, 10.0, 2.0),
+        source='SELECT u.mmu_id, u.name, u.email FROM "user" u',
+        fallback=lambda like: or_(User.name.ilike(like), User.email.ilike(like)),
+        watch=("name", "email"),
+    ),
+    GrantCycle: SearchIndex(
+        GrantCycle,
+        "grant_cycle_search",
+        key="rowid",
+        columns=("cycle_name",),
+        weights=(1.0,),
+        source="SELECT c.cycle_id, c.cycle_name FROM grant_cycle c",
+        fallback=lambda like: GrantCycle.cycle_name.ilike(like),
+        watch=("cycle_name",),
+    ),
+    DocumentText: SearchIndex(
+        DocumentText,
+        "document_search",
+        key="rowid",
+        columns=("body",),
+        weights=(1.0,),
+        source="SELECT d.doc_id, d.text FROM document_text d",
+        fallback=lambda like: DocumentText.text.ilike(like),
+        watch=("text",),
+    ),
+}
+
+# Source row filters used when reindexing after a change
+KEY_CONDITIONS = {
+    Proposal: "p.proposal_id IN :ids",
+    User: "u.mmu_id IN :ids",
+    GrantCycle: "c.cycle_id IN :ids",
+    DocumentText: "d.doc_id IN :ids",
+}
+
+
+# ==========================================
+# QUERYING
+# ==========================================
+_available = {}
+
+
+def search_available(engine=None):
+    """True when the database is SQLite and the FTS tables exist."""
+    engine = engine or db.engine
+    if engine.url not in _available:
+        ready = False
+        if engine.dialect.name == "sqlite":
+            with engine.connect() as conn:
+                names = {
+                    row[0]
+                    for row in conn.execute(
+                        text("SELECT name FROM sqlite_master WHERE type = 'table'")
+                    )
+                }
+            ready = all(index.name in names for index in SEARCH_INDEXES.values())
+        _available[engine.url] = ready
+    return _available[engine.url]
+
+
+def match_expression(query_text):
+    """
+    Turns free text into an FTS5 query: every word must match as a prefix.
+    Words are quoted so FTS operators (AND, NEAR, *, -) typed by users are literal.
+    """
+    words = re.findall(r"\w+", query_text)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def _with_documents(documents):
+    """Proposals whose current file or a progress report file is in `documents`."""
+    files = select(DocumentText.filename).where(documents)
+    return or_(
+        Proposal.document_file.in_(files),
+        Proposal.proposal_id.in_(
+            select(ProgressReport.proposal_id).where(ProgressReport.document_file.in_(files))
+        ),
+    )
+
+
+def search_filter(model, query_text):
+    """Criterion restricting `model` rows to those matching the search text."""
+    index = SEARCH_INDEXES[model]
+    match = match_expression(query_text)
+    if match and search_available():
+        criterion = index.pk.in_(index.matching_keys(match))
+        documents = DocumentText.doc_id.in_(
+            SEARCH_INDEXES[DocumentText].matching_keys(match)
+        )
+    else:
+        like = f"%{query_text.strip()}%"
+        criterion = index.fallback(like)
+        documents = DocumentText.text.ilike(like)
+    if model is Proposal:
+        criterion = or_(criterion, _with_documents(documents))
+    return criterion
+
+
+def search_rank(model, query_text):
+    """ORDER BY terms putting the best matches first (empty when unranked)."""
+    match = match_expression(query_text)
+    if match and search_available():
+        # Rows matched only through their documents have no score; 0 sorts
+        # them after every field match (bm25 scores are negative)
+        return [func.coalesce(SEARCH_INDEXES[model].rank(match), 0).asc()]
+    return []
+
+
+# ==========================================
+# INDEX MAINTENANCE
+# ==========================================
+def _changed(obj, attrs):
+    return any(get_history(obj, attr).has_changes() for attr in attrs)
+
+
+@event.listens_for(db.session, "after_flush")
+def sync_search_index(session, flush_context):
+    """
+    Re-copies the indexed text of every row the flush inserted or changed, in
+    the same transaction. New rows have their primary keys by now; the
+    session's new/dirty/deleted collections still describe this flush.
+    """
+    if not search_available(session.get_bind()):
+        return
+
+    refresh = defaultdict(set)
+    remove = defaultdict(set)
+    renamed = set()
+    for model, index in SEARCH_INDEXES.items():
+        for obj, kind in pending_changes(session, model):
+            key = getattr(obj, index.pk.key)
+            if kind == "deleted":
+                remove[model].add(key)
+            elif kind == "new" or _changed(obj, index.watch):
+                refresh[model].add(key)
+                if model is User and kind == "dirty" and _changed(obj, ("name",)):
+                    renamed.add(key)
+
+    conn = session.connection()
+    for model, keys in remove.items():
+        SEARCH_INDEXES[model].remove(conn, keys)
+    for model, keys in refresh.items():
+        SEARCH_INDEXES[model].refresh(conn, KEY_CONDITIONS[model], keys)
+    if renamed:
+        # Proposals carry their researcher's name
+        SEARCH_INDEXES[Proposal].refresh(conn, "u.mmu_id IN :ids", renamed)
+
+
+def index_rows(session, model, keys):
+    """Indexes rows written with bulk INSERTs, which the flush listener never sees."""
+    if keys and model in SEARCH_INDEXES and search_available(session.get_bind()):
+        SEARCH_INDEXES[model].refresh(session.connection(), KEY_CONDITIONS[model], keys)
+
+
+def rebuild_search_index(session=None):
+    """Creates any missing FTS tables and re-copies every indexed row."""
+    session = session or db.session
+    conn = session.connection()
+    counts = {}
+    for model, index in SEARCH_INDEXES.items():
+        conn.execute(text(index.ddl))
+        counts[index.name] = index.rebuild(conn)
+    _available.clear()
+    return counts
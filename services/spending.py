@@ -0,0 +1,49 @@
+from sqlalchemy import func
+from models import db, ProgressReport
+
+
+# ==========================================
+# GRANT SPENDING SUMMARY
+# ==========================================
+def spent_by_proposal(proposal_ids):
+    """Total reported financial usage per proposal ID, in one GROUP BY query."""
+    if not proposal_ids:
+        return {}
+    rows = (
+        db.session.query(
+            ProgressReport.proposal_id, func.sum(ProgressReport.financial_usage)
+        )
+        .filter(ProgressReport.proposal_id.in_(proposal_ids))
+        .group_by(ProgressReport.proposal_id)
+        .all()
+    )
+    return {proposal_id: spent or 0.0 for proposal_id, spent in rows}
+
+
+def spending_summary(proposals):
+    """
+    Spent / balance / utilization for each proposal, keyed by proposal_id.
+    The budget limit is the allocated grant, or the requested budget while no
+    grant has been recorded. Pass proposals loaded with their grant_award
+    (see services.queries) to keep this at a single query.
+    """
+    spent = spent_by_proposal([p.proposal_id for p in proposals])
+    summary = {}
+    for p in proposals:
+        grant_amount = (
+            p.grant_award.grant_amount if p.grant_award else p.requested_budget
+        )
+        used = spent.get(p.proposal_id, 0.0)
+        summary[p.proposal_id] = {
+            "proposal": p,
+            "spent": used,
+            "grant_amount": grant_amount,
+            "balance": grant_amount - used,
+            "utilization": (used / grant_amount * 100) if grant_amount > 0 else 0,
+        }
+    return summary
+
+
+def proposal_spending(proposal):
+    """spending_summary() for a single proposal."""
+    return spending_summary([proposal])[proposal.proposal_id]
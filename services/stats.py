@@ -0,0 +1,339 @@
+from collections import Counter
+from sqlalchemy import event, func, select, insert, delete, and_, or_, inspect
+from sqlalchemy.orm import MANYTOONE
+from models import db, Proposal, Grant, GrantCycle, DashboardStat
+from services.changes import track_old_values, pending_changes, old_value
+from services.database import upsert
+
+track_old_values(
+    Proposal.status,
+    Proposal.review_score,
+    Proposal.researcher_id,
+    Proposal.cycle_id,
+    Proposal.assigned_hod_id,
+    Proposal.assigned_reviewer_id,
+    Grant.proposal_id,
+    GrantCycle.faculty,
+)
+
+
+# ==========================================
+# DASHBOARD STATISTICS
+# ==========================================
+# Dashboards read their cards from DashboardStat counters instead of running a
+# COUNT per card. Every proposal adds 1 to "status:<status>" (and to
+# "unscored" while it waits for a review score) in each scope it belongs to:
+# global, its cycle's faculty, its researcher, HOD and reviewer. Grants and
+# cycles are counted the same way. The before_flush listener below applies
+# the difference each flush makes, so counters commit with the data.
+GLOBAL = ""
+SEEDED_KEY = ("global", GLOBAL, "seeded")
+
+
+def _keys(owners, metrics):
+    return [
+        (scope, str(owner), metric)
+        for scope, owner in owners
+        if owner is not None
+        for metric in metrics
+    ]
+
+
+def proposal_counters(get, faculty_of):
+    status = get("status")
+    metrics = [f"status:{status}"]
+    if status == "Passed Screening" and get("review_score") is None:
+        metrics.append("unscored")
+    owners = [
+        ("global", GLOBAL),
+        ("faculty", faculty_of(get("cycle_id"))),
+        ("researcher", get("researcher_id")),
+        ("hod", get("assigned_hod_id")),
+        ("reviewer", get("assigned_reviewer_id")),
+    ]
+    return _keys(owners, metrics)
+
+
+def grant_counters(get, researcher_of):
+    owners = [("global", GLOBAL), ("researcher", researcher_of(get("proposal_id")))]
+    return _keys(owners, ["grants"])
+
+
+def cycle_counters(get):
+    return _keys([("global", GLOBAL), ("faculty", get("faculty"))], ["cycles"])
+
+
+# ==========================================
+# STATUS HISTOGRAM
+# ==========================================
+class StatusHistogram(Counter):
+    """{status: proposals}; statuses with no proposals read as 0."""
+
+    @classmethod
+    def from_counters(cls, counters):
+        """The "status:<status>" metrics of one dashboard_stats() scope."""
+        return cls(
+            {
+                metric[len("status:") :]: value
+                for metric, value in counters.items()
+                if metric.startswith("status:")
+            }
+        )
+
+    def count(self, *statuses):
+        """Proposals in any of `statuses`, or in any status when none are given."""
+        if not statuses:
+            return self.total()
+        return sum(self[status] for status in statuses)
+
+
+def status_histogram(*criteria, by=None, joins=(), session=None):
+    """
+    Proposals per status matching `criteria`, in one GROUP BY query, e.g.
+    status_histogram(Proposal.cycle_id == 3).count("Submitted", "Under Review").
+    `joins` are (target, onclause) pairs for criteria on other tables. With
+    `by` (a column) returns {value of by: StatusHistogram} instead.
+    """
+    session = session or db.session
+    columns = [Proposal.status] if by is None else [by, Proposal.status]
+    query = select(*columns, func.count()).select_from(Proposal)
+    for target, onclause in joins:
+        query = query.join(target, onclause)
+    query = query.where(*criteria).group_by(*columns)
+    if by is None:
+        return StatusHistogram(dict(session.execute(query).all()))
+    histograms = {}
+    for key, status, total in session.execute(query):
+        histograms.setdefault(key, StatusHistogram())[status] = total
+    return histograms
+
+
+# ==========================================
+# READ / REBUILD
+# ==========================================
+def compute_dashboard_stats(session=None):
+    """Recomputes every counter from the source tables with GROUP BY queries."""
+    session = session or db.session
+    counts = Counter()
+    owners = {
+        "global": None,
+        "faculty": GrantCycle.faculty,
+        "researcher": Proposal.researcher_id,
+        "hod": Proposal.assigned_hod_id,
+        "reviewer": Proposal.assigned_reviewer_id,
+    }
+    unscored = (Proposal.status == "Passed Screening", Proposal.review_score == None)
+    for scope, owner in owners.items():
+        joins = (
+            [(GrantCycle, GrantCycle.cycle_id == Proposal.cycle_id)]
+            if scope == "faculty"
+            else ()
+        )
+        histograms = status_histogram(by=owner, joins=joins, session=session)
+        waiting = status_histogram(*unscored, by=owner, joins=joins, session=session)
+        if owner is None:
+            histograms, waiting = {GLOBAL: histograms}, {GLOBAL: waiting}
+        for owner_id, histogram in histograms.items():
+            if owner_id is None:
+                continue
+            for status, total in histogram.items():
+                counts[(scope, str(owner_id), f"status:{status}")] += total
+            if owner_id in waiting:
+                counts[(scope, str(owner_id), "unscored")] += waiting[owner_id].count()
+
+    for researcher_id, total in session.execute(
+        select(Proposal.researcher_id, func.count(Grant.grant_id))
+        .select_from(Grant)
+        .outerjoin(Proposal, Proposal.proposal_id == Grant.proposal_id)
+        .group_by(Proposal.researcher_id)
+    ):
+        counts[("global", GLOBAL, "grants")] += total
+        if researcher_id is not None:
+            counts[("researcher", str(researcher_id), "grants")] += total
+
+    for faculty, total in session.execute(
+        select(GrantCycle.faculty, func.count()).group_by(GrantCycle.faculty)
+    ):
+        counts[("global", GLOBAL, "cycles")] += total
+        counts[("faculty", faculty, "cycles")] += total
+
+    counts[SEEDED_KEY] = 1
+    return counts
+
+
+def _is_key(key):
+    scope, scope_id, metric = key
+    return and_(
+        DashboardStat.scope == scope,
+        DashboardStat.scope_id == scope_id,
+        DashboardStat.metric == metric,
+    )
+
+
+def rebuild_dashboard_stats(session=None):
+    """
+    Replaces every counter with freshly computed values. Caller commits.
+    Returns (counters, {key: (stored, actual)} for counters that had drifted).
+    """
+    session = session or db.session
+    actual = compute_dashboard_stats(session)
+    stored = {
+        (scope, scope_id, metric): value
+        for scope, scope_id, metric, value in session.execute(
+            select(
+                DashboardStat.scope,
+                DashboardStat.scope_id,
+                DashboardStat.metric,
+                DashboardStat.value,
+            )
+        )
+    }
+    drift = {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in set(stored) | set(actual)
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
+    session.execute(delete(DashboardStat))
+    session.execute(
+        insert(DashboardStat),
+        [
+            dict(scope=scope, scope_id=scope_id, metric=metric, value=value)
+            for (scope, scope_id, metric), value in actual.items()
+            if value
+        ],
+    )
+    return actual, drift
+
+
+def dashboard_stats(scope, scope_id=GLOBAL):
+    """
+    Every counter of one scope in a single query, as {metric: value} (missing
+    metrics read as 0). Seeds the table on first use (e.g. a fresh database).
+    """
+    scope_id = str(scope_id)
+    rows = db.session.execute(
+        select(
+            DashboardStat.scope,
+            DashboardStat.scope_id,
+            DashboardStat.metric,
+            DashboardStat.value,
+        ).where(
+            or_(
+                and_(DashboardStat.scope == scope, DashboardStat.scope_id == scope_id),
+                _is_key(SEEDED_KEY),
+            )
+        )
+    ).all()
+    if not any(tuple(row[:3]) == SEEDED_KEY for row in rows):
+        counts, _ = rebuild_dashboard_stats()
+        db.session.commit()
+        rows = [(*key, value) for key, value in counts.items()]
+    return Counter(
+        {
+            metric: value
+            for row_scope, row_id, metric, value in rows
+            if (row_scope, row_id) == (scope, scope_id)
+        }
+    )
+
+
+# ==========================================
+# TRANSACTIONAL MAINTENANCE
+# ==========================================
+def _current_values(obj):
+    # Column defaults (e.g. status="Draft") are only applied by the INSERT, and
+    # a foreign key set through its relationship (proposal.cycle = cycle) only
+    # by the flush, so both are read from where they will come from
+    def get(attr):
+        value = getattr(obj, attr)
+        if value is None:
+            column = obj.__table__.columns.get(attr)
+            if column is not None and column.default is not None and column.default.is_scalar:
+                return column.default.arg
+            for relationship in inspect(obj).mapper.relationships:
+                if relationship.direction is not MANYTOONE:
+                    continue
+                for local, remote in relationship.local_remote_pairs:
+                    if local.key == attr:
+                        related = getattr(obj, relationship.key)
+                        return getattr(related, remote.key) if related is not None else None
+        return value
+
+    return get
+
+
+def _move_cycle_proposals(session, cycle, deltas):
+    """
+    Moves the stored proposals of a cycle whose faculty changes from the old
+    faculty's counters to the new one's. Pending proposal changes already use
+    the new faculty for both their old and new values (faculty_of reads the
+    modified cycle), so they stay consistent with this move.
+    """
+    old, new = old_value(cycle, "faculty"), cycle.faculty
+    # by review_score IS NULL: the unscored counts come from the same query
+    histograms = status_histogram(
+        Proposal.cycle_id == cycle.cycle_id, by=Proposal.review_score == None, session=session
+    )
+    for unscored, histogram in histograms.items():
+        for status, total in histogram.items():
+            metrics = [f"status:{status}"]
+            if unscored and status == "Passed Screening":
+                metrics.append("unscored")
+            for metric in metrics:
+                if old is not None:
+                    deltas[("faculty", old, metric)] -= total
+                if new is not None:
+                    deltas[("faculty", new, metric)] += total
+
+
+@event.listens_for(db.session, "before_flush")
+def apply_stat_deltas(session, flush_context, instances):
+    """Folds every pending Proposal / Grant / GrantCycle change into the counters."""
+    with session.no_autoflush:
+
+        def faculty_of(cycle_id):
+            cycle = session.get(GrantCycle, cycle_id) if cycle_id else None
+            return cycle.faculty if cycle else None
+
+        def researcher_of(proposal_id):
+            proposal = session.get(Proposal, proposal_id) if proposal_id else None
+            return proposal.researcher_id if proposal else None
+
+        sources = [
+            (Proposal, lambda get: proposal_counters(get, faculty_of)),
+            (Grant, lambda get: grant_counters(get, researcher_of)),
+            (GrantCycle, cycle_counters),
+        ]
+        deltas = Counter()
+        for model, counters in sources:
+            for obj, kind in pending_changes(session, model):
+                if kind != "deleted":
+                    for key in counters(_current_values(obj)):
+                        deltas[key] += 1
+                if kind != "new":
+                    for key in counters(lambda attr: old_value(obj, attr)):
+                        deltas[key] -= 1
+        for cycle, kind in pending_changes(session, GrantCycle):
+            if kind == "dirty" and old_value(cycle, "faculty") != cycle.faculty:
+                _move_cycle_proposals(session, cycle, deltas)
+
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        if not deltas:
+            return
+        seeded = session.execute(
+            select(DashboardStat.value).where(_is_key(SEEDED_KEY))
+        ).scalar()
+        if seeded is None:
+            # Seed from the tables as they are before this flush, then apply it
+            rebuild_dashboard_stats(session)
+
+    for (scope, scope_id, metric), delta in deltas.items():
+        # One statement, so concurrent writers cannot both insert a new counter
+        session.execute(
+            upsert(session, DashboardStat)
+            .values(scope=scope, scope_id=scope_id, metric=metric, value=delta)
+            .on_conflict_do_update(
+                index_elements=[DashboardStat.scope, DashboardStat.scope_id, DashboardStat.metric],
+                set_=dict(value=DashboardStat.value + delta),
+            )
+        )
@@ -0,0 +1,165 @@
+import os
+import re
+import time
+from collections import defaultdict
+from flask import current_app
+from sqlalchemy import event, select, union_all, func
+from models import db, Proposal, ProposalVersion, ProgressReport, DocumentBlob, DocumentText
+from services.changes import track_old_values, pending_changes, old_value
+from services.database import upsert
+from services.uploads import receive_upload, place_upload, TEMP_PREFIX
+
+DOCUMENT_MODELS = (Proposal, ProposalVersion, ProgressReport)
+track_old_values(*(model.document_file for model in DOCUMENT_MODELS))
+
+
+# ==========================================
+# CONTENT-ADDRESSED DOCUMENT STORE
+# ==========================================
+# Uploads are hashed while they stream to a temp file (services/uploads.py)
+# and stored as <sha256><ext>. Re-uploading the same bytes (a resubmission, a version
+# snapshot, a report reusing the proposal file) reuses the existing file
+# instead of writing another copy. DocumentBlob.ref_count follows the
+# document_file columns so unreferenced files can be collected.
+CONTENT_NAME = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _docs_folder():
+    return current_app.config["UPLOAD_FOLDER_DOCS"]
+
+
+def store_document(form_file):
+    """
+    Streams an uploaded file into the store and returns its filename.
+    Raises UploadRejected for a disallowed, oversized or mislabelled file.
+    """
+    folder = _docs_folder()
+    temp_path, digest, ext = receive_upload(
+        form_file, folder, current_app.config["ALLOWED_EXTENSIONS"]
+    )
+    filename = digest + ext
+    # Same name means same bytes, so an existing copy is kept
+    place_upload(temp_path, os.path.join(folder, filename), keep_existing=True)
+    return filename
+
+
+def content_hash_of(filename):
+    """The sha256 a content-addressed filename encodes (None for legacy names)."""
+    stem = os.path.splitext(filename)[0]
+    return stem if CONTENT_NAME.match(stem) else None
+
+
+# ==========================================
+# REFERENCE COUNTING
+# ==========================================
+@event.listens_for(db.session, "before_flush")
+def apply_blob_refs(session, flush_context, instances):
+    """
+    Adjusts DocumentBlob.ref_count for every document_file reference the coming
+    flush adds, changes or removes. Blob rows are created on first reference.
+    """
+    deltas = defaultdict(int)
+    for model in DOCUMENT_MODELS:
+        for obj, kind in pending_changes(session, model):
+            if kind != "deleted" and obj.document_file:
+                deltas[obj.document_file] += 1
+            if kind != "new":
+                previous = old_value(obj, "document_file")
+                if previous:
+                    deltas[previous] -= 1
+
+    for filename, delta in deltas.items():
+        if delta:
+            _bump_ref(session, filename, delta)
+
+
+def _bump_ref(session, filename, delta):
+    # One statement, so concurrent first references cannot both insert the row
+    path = os.path.join(_docs_folder(), filename)
+    session.execute(
+        upsert(session, DocumentBlob)
+        .values(
+            filename=filename,
+            content_hash=content_hash_of(filename),
+            size=os.path.getsize(path) if os.path.exists(path) else None,
+            ref_count=max(delta, 0),
+        )
+        .on_conflict_do_update(
+            index_elements=[DocumentBlob.filename],
+            set_=dict(ref_count=DocumentBlob.ref_count + delta),
+        )
+    )
+
+
+def actual_reference_counts(session=None):
+    """{filename: references} computed from the document_file columns."""
+    session = session or db.session
+    refs = union_all(
+        *(
+            select(model.document_file.label("filename")).where(
+                model.document_file != None
+            )
+            for model in DOCUMENT_MODELS
+        )
+    ).subquery()
+    rows = session.execute(
+        select(refs.c.filename, func.count()).group_by(refs.c.filename)
+    )
+    return dict(rows.all())
+
+
+def collect_garbage(grace_seconds=24 * 3600, dry_run=False, session=None):
+    """
+    Re-syncs every blob's ref_count from the referencing tables, then deletes
+    files (and their blob / extracted text rows) nothing references.
+    Files modified within the grace period are kept, since an upload is on
+    disk slightly before the row that references it is committed.
+    Returns (removed filenames, bytes freed, ref counts corrected).
+    """
+    session = session or db.session
+    folder = _docs_folder()
+    actual = actual_reference_counts(session)
+    blobs = {blob.filename: blob for blob in DocumentBlob.query}
+
+    corrected = 0
+    for filename, count in actual.items():
+        blob = blobs.get(filename)
+        if blob is None:
+            path = os.path.join(folder, filename)
+            blob = DocumentBlob(
+                filename=filename,
+                content_hash=content_hash_of(filename),
+                size=os.path.getsize(path) if os.path.exists(path) else None,
+                ref_count=0,
+            )
+            session.add(blob)
+            blobs[filename] = blob
+        if blob.ref_count != count:
+            blob.ref_count = count
+            corrected += 1
+    for filename, blob in blobs.items():
+        if filename not in actual and blob.ref_count != 0:
+            blob.ref_count = 0
+            corrected += 1
+
+    cutoff = time.time() - grace_seconds
+    removed, freed = [], 0
+    for filename in sorted(os.listdir(folder)):
+        path = os.path.join(folder, filename)
+        if filename in actual or not os.path.isfile(path):
+            continue
+        if filename.startswith(".") and not filename.startswith(TEMP_PREFIX):
+            continue
+        stat = os.stat(path)
+        if stat.st_mtime > cutoff:
+            continue
+        removed.append(filename)
+        freed += stat.st_size
+        if not dry_run:
+            os.remove(path)
+
+    if removed and not dry_run:
+        for model in (DocumentBlob, DocumentText):
+            for row in model.query.filter(model.filename.in_(removed)):
+                session.delete(row)
+    return removed, freed, corrected
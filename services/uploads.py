@@ -0,0 +1,195 @@
+import hashlib
+import os
+import tempfile
+from flask import Request, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+
+
+# ==========================================
+# STREAMING UPLOAD INTAKE
+# ==========================================
+# The form parser streams every document or picture part straight into a
+# temp file next to its destination (UploadRequest below), hashing and
+# counting the bytes as they arrive, so memory use does not grow with file
+# size and an oversized part is refused with a 413 as soon as it passes its
+# per-type cap, before the rest of the body is read. receive_upload() then
+# only checks that the first bytes match the format the extension claims,
+# and the caller moves the finished temp file into place with an atomic
+# rename. Temp files nobody claimed are deleted when the request closes.
+# Oversized request bodies are already refused by MAX_CONTENT_LENGTH.
+CHUNK_BYTES = 64 * 1024
+TEMP_PREFIX = ".upload-"
+# (extensions config key, folder config key): where each kind of file is spooled
+SPOOL_FOLDERS = (
+    ("ALLOWED_EXTENSIONS", "UPLOAD_FOLDER_DOCS"),
+    ("IMAGE_EXTENSIONS", "UPLOAD_FOLDER"),
+)
+
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+SIGNATURES = {
+    "pdf": (b"%PDF-",),
+    "docx": (b"PK\x03\x04",),
+    "doc": (OLE_SIGNATURE,),
+    "jpg": (b"\xff\xd8\xff",),
+    "jpeg": (b"\xff\xd8\xff",),
+    "png": (b"\x89PNG\r\n\x1a\n",),
+    "gif": (b"GIF87a", b"GIF89a"),
+    "webp": (b"RIFF",),
+}
+HEADER_BYTES = 16
+# mkstemp creates files readable only by the owner; stored files are public
+FILE_MODE = 0o644
+
+
+class UploadRejected(ValueError):
+    """An upload failed validation; the message is safe to show the user."""
+
+
+class UploadTooLarge(RequestEntityTooLarge):
+    """A file part passed its per-type size limit while the form was parsed."""
+
+    def __init__(self, ext, limit):
+        super().__init__(_too_large_message(ext, limit))
+
+
+def _too_large_message(ext, limit):
+    return f"File is too large: .{ext} uploads are limited to {limit // (1024 * 1024)} MB."
+
+
+def _extension(filename):
+    return os.path.splitext(filename or "")[1].lower().lstrip(".")
+
+
+def _matches_signature(ext, head):
+    if ext == "webp":
+        return head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+    return head.startswith(SIGNATURES[ext])
+
+
+class UploadSpool:
+    """
+    The file object the form parser writes one upload part into: a temp file
+    in `folder` whose bytes are hashed, counted and checked against `limit`
+    as they are written. Reads and seeks go to the temp file.
+    """
+
+    def __init__(self, folder, ext, limit):
+        self.folder, self.ext, self.limit = folder, ext, limit
+        fd, self.path = tempfile.mkstemp(dir=folder, prefix=TEMP_PREFIX)
+        os.chmod(self.path, FILE_MODE)
+        self.file = os.fdopen(fd, "w+b")
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.head = b""
+        self.claimed = False
+
+    def write(self, data):
+        self.size += len(data)
+        if self.size > self.limit:
+            self.close()
+            raise UploadTooLarge(self.ext, self.limit)
+        if len(self.head) < HEADER_BYTES:
+            self.head += data[: HEADER_BYTES - len(self.head)]
+        self.digest.update(data)
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+    def claim(self):
+        """Hands the finished temp file to the caller, who must rename or remove it."""
+        self.file.close()
+        self.claimed = True
+        return self.path
+
+    def close(self):
+        self.file.close()
+        if not self.claimed:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+class UploadRequest(Request):
+    """Flask request class that spools document and picture parts with UploadSpool."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        ext = _extension(filename)
+        config = current_app.config
+        limit = config["UPLOAD_SIZE_LIMITS"].get(ext)
+        for extensions, folder in SPOOL_FOLDERS:
+            if limit is not None and ext in config[extensions]:
+                if content_length and content_length > limit:
+                    raise UploadTooLarge(ext, limit)
+                spool = UploadSpool(config[folder], ext, limit)
+                self.__dict__.setdefault("upload_spools", []).append(spool)
+                return spool
+        # Anything else (e.g. a CSV import) is buffered as usual
+        return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+
+    def close(self):
+        super().close()
+        # Parts that failed half-way never reached request.files
+        for spool in self.__dict__.get("upload_spools", ()):
+            spool.close()
+
+
+def receive_upload(form_file, folder, allowed):
+    """
+    Takes over the temp file `form_file` was streamed into inside `folder`
+    (copying it there in chunks when it came from elsewhere, e.g. a FileStorage
+    built in code). `allowed` is the set of accepted extensions (without the
+    dot). Returns (temp_path, sha256 hex digest, ".ext"); the caller must
+    rename or remove the temp file. Raises UploadRejected on a bad type or size.
+    """
+    ext = _extension(form_file.filename)
+    if ext not in allowed or ext not in SIGNATURES:
+        raise UploadRejected(f"Files of type '.{ext}' are not accepted here.")
+    spool = form_file.stream
+    if isinstance(spool, UploadSpool) and spool.folder == folder and not spool.claimed:
+        head, digest = spool.head, spool.digest
+    else:
+        spool = _copy_upload(form_file, folder, ext)
+        head, digest = spool.head, spool.digest
+    if not _matches_signature(ext, head):
+        spool.close()
+        raise UploadRejected(
+            f"File content does not look like a .{ext} file. Please re-save and upload again."
+        )
+    return spool.claim(), digest.hexdigest(), "." + ext
+
+
+def _copy_upload(form_file, folder, ext):
+    limit = current_app.config["UPLOAD_SIZE_LIMITS"][ext]
+    # Reject early when the client declared the part size
+    if form_file.content_length and form_file.content_length > limit:
+        raise UploadRejected(_too_large_message(ext, limit))
+    spool = UploadSpool(folder, ext, limit)
+    try:
+        for chunk in iter(lambda: form_file.stream.read(CHUNK_BYTES), b""):
+            spool.write(chunk)
+    except UploadTooLarge as e:
+        raise UploadRejected(e.description)
+    except BaseException:
+        spool.close()
+        raise
+    return spool
+
+
+def place_upload(temp_path, path, keep_existing=False):
+    """
+    Atomically moves a received upload to `path`. With keep_existing, an
+    existing file at `path` (same content, by construction) is kept instead,
+    and its mtime refreshed so garbage collection's grace period covers the
+    new reference as it would a freshly written file.
+    """
+    if keep_existing:
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # not there, or just collected: store this copy
+        else:
+            os.remove(temp_path)
+            return
+    os.replace(temp_path, path)
@@ -0,0 +1,127 @@
+from datetime import date, timedelta
+from models import (
+    db,
+    User,
+    Admin,
+    Researcher,
+    Reviewer,
+    HOD,
+    Faculty,
+    GrantCycle,
+    Proposal,
+    Notification,
+    Budget,
+    Grant,
+)
+
+# List pages and the data behind them, shared by the query count and query
+# plan tests.
+
+# Each unit is one researcher with a proposal in each of these statuses, all
+# assigned to the same reviewer and HOD, so every list page gains rows
+UNIT_STATUSES = ["Under Review", "Passed Screening", "Pending HOD Approval", "Approved"]
+
+LIST_PAGES = {
+    "Admin": [
+        "/admin/dashboard",
+        "/admin/proposals/cycle/{cycle_id}",
+        "/admin/budget",
+        "/notifications",
+    ],
+    "HOD": [
+        "/hod/proposals",
+        "/hod/grant_allocation",
+        "/hod/grant_budget",
+        "/hod/assigned_research",
+    ],
+    "Reviewer": [
+        "/reviewer/proposals",
+        "/reviewer/evaluation_list",
+    ],
+}
+
+
+class ListingWorld:
+    """
+    A faculty of its own with admin, HOD and reviewer accounts and an open
+    grant cycle, so each test counts only the rows it added.
+    """
+
+    created = 0
+
+    def __init__(self):
+        ListingWorld.created += 1
+        self.prefix = f"QC{ListingWorld.created:03d}"
+        self.faculty = f"{self.prefix} Faculty"
+        self.units = 0
+        self.actors = {role: f"{self.prefix}{role[0]}" for role in LIST_PAGES}
+        admin = Admin(mmu_id=self.actors["Admin"])
+        hod = HOD(mmu_id=self.actors["HOD"])
+        reviewer = Reviewer(mmu_id=self.actors["Reviewer"])
+        db.session.add(Faculty(name=self.faculty))
+        db.session.add_all(self._user(mmu_id, role) for role, mmu_id in self.actors.items())
+        db.session.add_all([admin, hod, reviewer])
+        db.session.flush()
+        cycle = GrantCycle(
+            cycle_name=f"{self.prefix} cycle",
+            faculty=self.faculty,
+            start_date=date.today() - timedelta(days=10),
+            end_date=date.today() + timedelta(days=50),
+            admin_id=admin.admin_id,
+        )
+        db.session.add_all(
+            [cycle, Budget(amount=100000, description="Allocation", admin_id=admin.mmu_id)]
+        )
+        db.session.commit()
+        self.cycle_id, self.hod_id, self.reviewer_id = (
+            cycle.cycle_id,
+            hod.hod_id,
+            reviewer.reviewer_id,
+        )
+
+    def _user(self, mmu_id, role):
+        # Sessions are set directly, so the password hash is never checked
+        return User(
+            mmu_id=mmu_id,
+            name=f"{role} {mmu_id}",
+            email=f"{mmu_id.lower()}@qc.mmu.edu.my",
+            password="-",
+            faculty=self.faculty,
+            user_role=role,
+        )
+
+    def add_unit(self):
+        """One more researcher, with a proposal per UNIT_STATUSES and a notification."""
+        self.units += 1
+        mmu_id = f"{self.prefix}R{self.units}"
+        researcher = Researcher(mmu_id=mmu_id)
+        db.session.add_all([self._user(mmu_id, "Researcher"), researcher])
+        for status in UNIT_STATUSES:
+            proposal = Proposal(
+                title=f"Query count study {mmu_id} {status}",
+                requested_budget=1000,
+                status=status,
+                submission_date=date.today(),
+                researcher=researcher,
+                cycle_id=self.cycle_id,
+                assigned_reviewer_id=self.reviewer_id,
+                assigned_hod_id=self.hod_id,
+            )
+            db.session.add(proposal)
+            if status == "Approved":
+                db.session.add(Grant(grant_amount=1000, proposal=proposal))
+        db.session.add(
+            Notification(
+                recipient_id=self.actors["Admin"],
+                sender_id=mmu_id,
+                message=f"Proposal from {mmu_id} submitted.",
+            )
+        )
+        db.session.commit()
+
+
+def log_in(client, role, user_id):
+    with client.session_transaction() as cookie:
+        cookie.clear()
+        cookie["user_id"] = user_id
+        cookie["role"] = role
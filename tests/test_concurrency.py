@@ -0,0 +1,30 @@
+from models import db
+from services.database import stress_test
+
+
+def test_production_profile_has_no_lock_errors(app):
+    """
+    A short `flask --app main stress-database`: three processes, each with
+    two writer and two reader threads, against a copy of the test database.
+    """
+    path = app.config["SQLALCHEMY_DATABASE_URI"].removeprefix("sqlite:///")
+    summary = stress_test(
+        path, app.config["SQLITE_PRAGMAS"], processes=3, writers=2, readers=2, seconds=2
+    )
+
+    assert set(summary) == {"writer", "reader"}
+    for role, result in summary.items():
+        assert result["errors"] == 0, f"{role}s hit {result['errors']} lock errors"
+        # Every thread finished some work: nobody was starved by the others
+        assert result["slowest_thread"] > 0, f"a {role} thread made no progress"
+
+
+def test_connections_get_the_production_pragmas(app):
+    with app.app_context(), db.engine.connect() as conn:
+        settings = {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in ("journal_mode", "busy_timeout", "synchronous")
+        }
+    assert settings["journal_mode"] == "wal"
+    assert settings["busy_timeout"] == app.config["SQLITE_PRAGMAS"]["busy_timeout"]
+    assert settings["synchronous"] == 1  # NORMAL
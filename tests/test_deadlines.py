@@ -0,0 +1,53 @@
+from datetime import date, timedelta
+from models import db, User, Admin, Researcher, GrantCycle, Proposal, Deadline, Notification
+from services.deadlines import sweep_deadlines
+
+# Far from the real date, so only this test's deadlines fall in the window
+TODAY = date(2031, 3, 10)
+
+
+def _approved_proposals(due_dates):
+    admin, researcher = Admin(mmu_id="DL1A"), Researcher(mmu_id="DL1R")
+    db.session.add_all(
+        [
+            User(mmu_id="DL1R", name="Researcher", email="dl1r@dl.mmu.edu.my",
+                 password="-", faculty="DL Faculty", user_role="Researcher"),
+            admin,
+            researcher,
+        ]
+    )
+    db.session.flush()
+    cycle = GrantCycle(cycle_name="DL cycle", faculty="DL Faculty", start_date=TODAY,
+                       end_date=TODAY, admin_id=admin.admin_id)
+    db.session.add(cycle)
+    db.session.flush()
+    for n, due_date in enumerate(due_dates):
+        proposal = Proposal(title=f"Deadline study {n}", requested_budget=500, status="Approved",
+                            researcher_id=researcher.researcher_id, cycle_id=cycle.cycle_id)
+        db.session.add(proposal)
+        db.session.flush()
+        db.session.add(Deadline(proposal_id=proposal.proposal_id,
+                                deadline_type="Final Submission", due_date=due_date))
+    db.session.commit()
+
+
+def test_sweep_sends_each_reminder_once(app, db_session):
+    _approved_proposals(
+        [
+            TODAY - timedelta(days=90),  # long overdue before the sweep existed
+            TODAY - timedelta(days=2),
+            TODAY + timedelta(days=3),
+        ]
+    )
+    with app.test_request_context():
+        assert sweep_deadlines(TODAY) == 2
+        db_session.commit()
+        # Later runs the same day find everything already sent
+        assert sweep_deadlines(TODAY) == 0
+        # The next day only the upcoming deadline gets its daily reminder
+        assert sweep_deadlines(TODAY + timedelta(days=1)) == 1
+        db_session.commit()
+
+    messages = [n.message for n in Notification.query.filter_by(recipient_id="DL1R")]
+    assert len(messages) == 3
+    assert not any("Deadline study 0" in m for m in messages)
@@ -0,0 +1,59 @@
+import pytest
+from models import db, User, Researcher
+import services.imports
+from services.imports import import_users, hash_passwords
+
+
+@pytest.fixture
+def importing(app, db_session, monkeypatch):
+    monkeypatch.setitem(app.config, "BCRYPT_LOG_ROUNDS", 4)
+    return db_session
+
+
+def _record(mmu_id, **fields):
+    record = dict(mmu_id=mmu_id, name=f"User {mmu_id}", email=f"{mmu_id.lower()}@im.mmu.edu.my",
+                  faculty="IM Faculty", role="Researcher", password="secret")
+    return {**record, **fields}
+
+
+def test_values_longer_than_their_columns_are_invalid(importing):
+    result = import_users(
+        [
+            _record("IM1OK"),
+            _record("IM2", name="n" * 151),
+            _record("IM3", phone_number="0" * 21),
+            _record("IM4" + "x" * 13),
+        ]
+    )
+    assert [(row[1][:4], row[2], row[3]) for row in result.rows] == [
+        ("IM1O", "created", ""),
+        ("IM2", "invalid", "Name is longer than 150 characters"),
+        ("IM3", "invalid", "Phone number is longer than 20 characters"),
+        ("IM4x", "invalid", "MMU ID is longer than 15 characters"),
+    ]
+    assert db.session.get(User, "IM1OK") is not None
+
+
+def test_conflict_after_validation_fails_only_the_conflicting_rows(importing, monkeypatch):
+    import_users([_record("IM5TAKEN")])
+    # As if the account was registered between validation and the INSERT
+    monkeypatch.setattr(services.imports, "_existing", lambda column, values: set())
+
+    result = import_users([_record("IM6"), _record("IM5TAKEN"), _record("IM7")], batch_size=3)
+    assert [(row[1], row[2]) for row in result.rows] == [
+        ("IM6", "created"),
+        ("IM5TAKEN", "failed"),
+        ("IM7", "created"),
+    ]
+    assert "1 failed to save" in result.summary()
+    assert Researcher.query.filter(Researcher.mmu_id.in_(["IM6", "IM7"])).count() == 2
+
+
+def test_hashes_in_threads_match_bcrypt(app, monkeypatch):
+    import bcrypt
+
+    monkeypatch.setitem(app.config, "BCRYPT_LOG_ROUNDS", 4)
+    passwords = [f"secret{n}" for n in range(6)]
+    with app.app_context():
+        hashes = hash_passwords(passwords, workers=3)
+    assert all(bcrypt.checkpw(p.encode(), h.encode()) for p, h in zip(passwords, hashes))
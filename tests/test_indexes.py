@@ -0,0 +1,96 @@
+import re
+import pytest
+from sqlalchemy import event, inspect
+from models import db
+from listing import ListingWorld, log_in
+
+# (role, page, indexes the statements behind the page must use). The plans
+# are taken from the SQL the routes really send, so a change to a route's
+# query (or to an index) that drops back to a table scan fails here.
+PAGE_INDEXES = [
+    ("Admin", "/admin/dashboard", ["ix_grant_cycle_open_end_date", "ix_grant_proposal"]),
+    (
+        "Admin",
+        "/admin/proposals?faculty={faculty}",
+        ["ix_grant_cycle_faculty_start_date", "ix_proposal_cycle_status"],
+    ),
+    ("Admin", "/admin/proposals/cycle/{cycle_id}", ["ix_proposal_cycle_status"]),
+    ("Admin", "/admin/budget", ["ix_budget_created_at", "ix_grant_award_date"]),
+    ("Admin", "/notifications", ["ix_notification_recipient_read_time"]),
+    ("HOD", "/hod/proposals", ["ix_hod_mmu_id", "ix_proposal_hod_status"]),
+    ("HOD", "/hod/grant_allocation", ["ix_proposal_hod_status"]),
+    ("HOD", "/hod/assigned_research", ["ix_proposal_hod_status"]),
+    ("Reviewer", "/reviewer/proposals", ["ix_reviewer_mmu_id", "ix_proposal_reviewer_status"]),
+    ("Reviewer", "/reviewer/evaluation_list", ["ix_proposal_reviewer_status"]),
+    (
+        "Researcher",
+        "/researcher/my_proposals",
+        ["ix_researcher_mmu_id", "ix_proposal_researcher_status"],
+    ),
+    ("Researcher", "/researcher/apply", ["ix_grant_cycle_open_end_date"]),
+]
+
+# Short lookup lists read whole into the forms' drop-downs
+SCANNED_TABLES = {"faculty_list", "research_area_list"}
+TABLE_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+def page_plans(client, url):
+    """EXPLAIN QUERY PLAN detail lines of every SELECT run while rendering `url`."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        assert client.get(url).status_code == 200
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    with db.engine.connect() as conn:
+        return [
+            row[-1]
+            for statement, parameters in statements
+            for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        ]
+
+
+@pytest.fixture(scope="module")
+def world(app):
+    with app.app_context():
+        world = ListingWorld()
+        world.add_unit()
+        world.actors["Researcher"] = f"{world.prefix}R1"
+        yield world
+        db.session.remove()
+
+
+@pytest.mark.parametrize(
+    "role, route, indexes", PAGE_INDEXES, ids=[f"{role}:{route}" for role, route, _ in PAGE_INDEXES]
+)
+def test_list_page_uses_indexes(app, world, role, route, indexes):
+    client = app.test_client()
+    log_in(client, role, world.actors[role])
+    with app.app_context():
+        plan = page_plans(client, route.format(faculty=world.faculty, cycle_id=world.cycle_id))
+
+    for index in indexes:
+        assert any(f"INDEX {index}" in line for line in plan), (index, plan)
+    # SCAN ... USING INDEX walks an index in ORDER BY order; a bare SCAN
+    # reads the whole table
+    scanned = {m.group(1) for m in map(TABLE_SCAN.match, plan) if m} - SCANNED_TABLES
+    assert not scanned, plan
+
+
+def test_migrations_create_every_model_index(app):
+    """The test database is built by `flask db upgrade` alone (see conftest)."""
+    with app.app_context():
+        inspector = inspect(db.engine)
+        for table in db.metadata.sorted_tables:
+            if not table.indexes:
+                continue
+            created = {index["name"] for index in inspector.get_indexes(table.name)}
+            declared = {index.name for index in table.indexes}
+            assert declared <= created, (table.name, declared - created)
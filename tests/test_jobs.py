@@ -0,0 +1,109 @@
+import threading
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import select, update
+from models import db, Job, malaysia_now
+from services.jobs import enqueue, claim_next, run_job, job_handler, RETRY_BASE_SECONDS
+
+LONG_AGO = datetime(2000, 1, 1, tzinfo=timezone(timedelta(hours=8)))
+LATER = datetime(2999, 1, 1, tzinfo=timezone(timedelta(hours=8)))
+
+
+@job_handler("test_noop")
+def noop_job():
+    pass
+
+
+@job_handler("test_failing")
+def failing_job():
+    raise RuntimeError("handler failed")
+
+
+@pytest.fixture
+def queue(app):
+    """Jobs other tests left queued are held back, so only this test's jobs are due."""
+    with app.app_context():
+        held = db.session.execute(
+            select(Job.job_id, Job.run_at).where(Job.status == "queued")
+        ).all()
+        db.session.execute(update(Job).where(Job.status == "queued").values(run_at=LATER))
+        db.session.commit()
+        yield db.session
+        db.session.rollback()
+        for job_id, run_at in held:
+            db.session.execute(update(Job).where(Job.job_id == job_id).values(run_at=run_at))
+        db.session.commit()
+        db.session.remove()
+
+
+def test_only_one_worker_claims_a_job(app, queue):
+    job = enqueue("test_noop", run_at=LONG_AGO)
+    queue.commit()
+    job_id = job.job_id
+
+    start, claims = threading.Barrier(4), []
+
+    def worker(n):
+        with app.app_context():
+            start.wait()
+            job = claim_next(f"worker-{n}")
+            claims.append(job and (job.job_id, job.locked_by))
+            db.session.remove()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    winners = [claim for claim in claims if claim]
+    assert len(claims) == 4 and len(winners) == 1
+    queue.expire_all()
+    job = queue.get(Job, job_id)
+    assert (job.job_id, job.locked_by) == winners[0]
+    assert (job.status, job.attempts) == ("running", 1)
+
+
+def test_failed_job_backs_off_then_fails(queue):
+    job = enqueue("test_failing", run_at=LONG_AGO, max_attempts=2)
+    queue.commit()
+    job_id = job.job_id
+
+    before = malaysia_now()
+    assert run_job(claim_next("worker")) is False
+    job = queue.get(Job, job_id)
+    assert (job.status, job.attempts, job.locked_by) == ("queued", 1, None)
+    assert "handler failed" in job.last_error
+    # SQLite hands timestamps back as naive Malaysia time
+    retry_in = job.run_at.replace(tzinfo=before.tzinfo) - before
+    assert timedelta(seconds=RETRY_BASE_SECONDS) <= retry_in < timedelta(seconds=RETRY_BASE_SECONDS + 5)
+    # Not due yet
+    assert claim_next("worker") is None
+
+    job.run_at = LONG_AGO
+    queue.commit()
+    assert run_job(claim_next("worker")) is False
+    job = queue.get(Job, job_id)
+    assert (job.status, job.attempts) == ("failed", 2)
+    assert job.finished_at is not None
+
+
+def test_pending_jobs_are_deduplicated_by_key(queue):
+    first = enqueue("test_noop", key="test:dedupe")
+    assert first is not None
+    # Staged in the same transaction, then queued, then running
+    assert enqueue("test_noop", key="test:dedupe") is None
+    queue.commit()
+    assert enqueue("test_noop", key="test:dedupe") is None
+    first.status = "running"
+    queue.commit()
+    assert enqueue("test_noop", key="test:dedupe") is None
+
+    # Once finished, the key is free again
+    first.status = "done"
+    queue.commit()
+    again = enqueue("test_noop", key="test:dedupe")
+    assert again is not None and again.job_id != first.job_id
+    queue.commit()
+    again.status = "done"
+    queue.commit()
@@ -0,0 +1,68 @@
+from datetime import date
+from pytest import approx
+from models import db, User, Admin, Researcher, GrantCycle, Proposal, Budget, Grant
+from services.ledger import rebuild_budget_ledger, get_budget_ledger
+
+
+def assert_no_drift(session):
+    ledger, drift = rebuild_budget_ledger(session)
+    session.rollback()  # keep the maintained values for the next step
+    assert drift == {}
+    return ledger
+
+
+def test_orm_changes_keep_the_ledger_exact(db_session):
+    # Start from exact totals, whatever earlier tests' fixtures left behind
+    rebuild_budget_ledger(db_session)
+    db_session.commit()
+    start = dict(
+        funds=get_budget_ledger().total_funds_in,
+        grants=get_budget_ledger().total_grants_out,
+        approved=get_budget_ledger().total_approved_requested,
+    )
+
+    admin, researcher = Admin(mmu_id="LG1A"), Researcher(mmu_id="LG1R")
+    db_session.add_all(
+        [
+            User(mmu_id="LG1A", name="Admin", email="lg1a@lg.mmu.edu.my", password="-",
+                 faculty="LG Faculty", user_role="Admin"),
+            admin,
+            researcher,
+        ]
+    )
+    db_session.flush()
+    cycle = GrantCycle(cycle_name="LG cycle", faculty="LG Faculty", start_date=date.today(),
+                       end_date=date.today(), admin_id=admin.admin_id)
+    db_session.add(cycle)
+    db_session.flush()
+    proposal = Proposal(title="Ledger study", requested_budget=4000, status="Pending HOD Approval",
+                        researcher_id=researcher.researcher_id, cycle_id=cycle.cycle_id)
+    budget = Budget(amount=10000.50, description="Allocation", admin_id="LG1A")
+    db_session.add_all([proposal, budget])
+    db_session.commit()
+    assert_no_drift(db_session)
+
+    # Approve with a grant, then edit every amount
+    proposal.status = "Approved"
+    grant = Grant(grant_amount=2500, proposal_id=proposal.proposal_id)
+    db_session.add(grant)
+    db_session.commit()
+    assert_no_drift(db_session)
+    budget.amount = 12000.25
+    grant.grant_amount = 3000.75
+    proposal.requested_budget = 3500
+    db_session.commit()
+    ledger = assert_no_drift(db_session)
+    assert ledger.total_funds_in == approx(start["funds"] + 12000.25)
+    assert ledger.total_grants_out == approx(start["grants"] + 3000.75)
+    assert ledger.total_approved_requested == approx(start["approved"] + 3500)
+
+    # Delete the rows again
+    db_session.delete(grant)
+    db_session.delete(budget)
+    proposal.status = "Rejected"
+    db_session.commit()
+    ledger = assert_no_drift(db_session)
+    assert ledger.total_funds_in == approx(start["funds"])
+    assert ledger.total_grants_out == approx(start["grants"])
+    assert ledger.total_approved_requested == approx(start["approved"])
@@ -0,0 +1,38 @@
+import os
+import shutil
+import pytest
+
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    with client.session_transaction() as cookie:
+        cookie["user_id"] = "MEDIA0001"
+        cookie["role"] = "Researcher"
+    return client
+
+
+@pytest.fixture
+def uploaded_picture(app):
+    """A picture under an upload-style random name (a copy of default.jpg)."""
+    folder = app.config["UPLOAD_FOLDER"]
+    name = "0123456789abcdef.jpg"
+    shutil.copyfile(os.path.join(folder, "default.jpg"), os.path.join(folder, name))
+    yield name
+    os.remove(os.path.join(folder, name))
+
+
+@pytest.mark.parametrize("url", ["/media/pictures/default.jpg", "/media/avatar/64/default.jpg"])
+def test_default_picture_is_revalidated(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.cache_control.no_cache
+    assert not response.cache_control.immutable
+    assert not response.cache_control.max_age
+
+
+def test_uploaded_picture_is_immutable(client, uploaded_picture):
+    response = client.get(f"/media/pictures/{uploaded_picture}")
+    assert response.status_code == 200
+    assert response.cache_control.immutable
+    assert response.cache_control.max_age == 365 * 24 * 3600
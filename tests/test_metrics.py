@@ -0,0 +1,19 @@
+from flask import Flask
+from models import db
+from services.metrics import init_metrics, registry
+
+
+def test_init_metrics_can_run_for_several_apps(app):
+    second = Flask("second")
+    with app.app_context():
+        engines = dict(db.engines)
+        init_metrics(second, engines)
+        init_metrics(second, engines)
+        second.add_url_rule("/ping", "ping", lambda: "pong")
+
+        assert second.test_client().get("/ping").data == b"pong"
+        exposition = registry.exposition()
+    # Each metric is declared once and the second app's requests are counted
+    assert exposition.count("# TYPE rgms_db_pool_connections gauge") == 1
+    assert 'rgms_requests_total{blueprint="app",endpoint="ping",method="GET",status="200"} 1' in exposition
+    assert 'rgms_db_pool_connections{database="primary",state="size"}' in exposition
@@ -0,0 +1,50 @@
+from sqlalchemy import update
+from models import db, User, Notification
+from services.notifications import mark_all_read, recount_unread
+
+
+def _recipient(mmu_id):
+    user = User(
+        mmu_id=mmu_id,
+        name="Notification Tester",
+        email=f"{mmu_id.lower()}@nt.mmu.edu.my",
+        password="-",
+        faculty="NT",
+        user_role="Researcher",
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+def test_mark_all_read_keeps_counts_of_notifications_it_did_not_mark(db_session):
+    user = _recipient("NT0001")
+    db.session.add_all(Notification(recipient_id=user.mmu_id, message=f"n{i}") for i in range(2))
+    db.session.commit()
+    # Stands in for a notification committed by another request after the
+    # bulk UPDATE ran: counted, but not marked read by this call
+    db.session.execute(
+        update(User)
+        .where(User.mmu_id == user.mmu_id)
+        .values(unread_notifications=User.unread_notifications + 1)
+    )
+
+    assert mark_all_read(user) == 2
+    db.session.commit()
+    assert db.session.get(User, user.mmu_id).unread_notifications == 1
+
+
+def test_mark_all_read_never_goes_negative(db_session):
+    user = _recipient("NT0002")
+    db.session.add(Notification(recipient_id=user.mmu_id, message="n"))
+    db.session.commit()
+    db.session.execute(
+        update(User).where(User.mmu_id == user.mmu_id).values(unread_notifications=0)
+    )
+
+    mark_all_read(user)
+    db.session.commit()
+    assert db.session.get(User, user.mmu_id).unread_notifications == 0
+    recount_unread()
+    db.session.commit()
+    assert db.session.get(User, user.mmu_id).unread_notifications == 0
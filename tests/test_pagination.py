@@ -0,0 +1,83 @@
+import base64
+import json
+import pytest
+from werkzeug.exceptions import BadRequest
+from models import db, User, Budget
+from services.pagination import paginate_listing, CursorPagination
+
+AMOUNTS = [300, 100, 200, 100, 300, 100, 200]
+
+
+@pytest.fixture(scope="module")
+def budgets(app):
+    """Budget rows with repeated amounts, so pages split runs of equal sort values."""
+    with app.app_context():
+        db.session.add(User(mmu_id="PG1A", name="Admin", email="pg1a@pg.mmu.edu.my",
+                            password="-", faculty="PG Faculty", user_role="Admin"))
+        rows = [Budget(amount=amount, description=f"PG {n}", admin_id="PG1A")
+                for n, amount in enumerate(AMOUNTS)]
+        db.session.add_all(rows)
+        db.session.commit()
+        # Highest amount first; equal amounts newest (highest id) first
+        expected = sorted(rows, key=lambda b: (-b.amount, -b.budget_id))
+        ids = [b.budget_id for b in expected]
+        db.session.remove()
+    return ids
+
+
+def page(app, **args):
+    with app.test_request_context("/", query_string=args):
+        pagination = paginate_listing(
+            Budget.query.filter(Budget.description.like("PG %")),
+            [Budget.amount.desc()],
+            per_page=3,
+        )
+        assert isinstance(pagination, CursorPagination)
+        return pagination, [b.budget_id for b in pagination.items]
+
+
+def _token(data):
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+def test_pages_through_ties_on_the_sort_column(app, budgets):
+    seen, args = [], {"cursor": ""}
+    while True:
+        pagination, ids = page(app, **args)
+        seen.extend(ids)
+        if not pagination.has_next:
+            break
+        args = pagination.next_args
+    assert seen == budgets
+
+
+def test_previous_page_from_page_two(app, budgets):
+    first, first_ids = page(app, cursor="")
+    assert not first.has_prev
+    second, second_ids = page(app, **first.next_args)
+    assert second_ids == budgets[3:6]
+    assert second.has_prev and second.has_next
+
+    back, back_ids = page(app, **second.prev_args)
+    assert back_ids == first_ids
+    assert not back.has_prev
+    # And forward again from the page we came back to
+    assert page(app, **back.next_args)[1] == second_ids
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "not-a-cursor!",
+        _token({"d": "n"}),
+        _token({"d": "x", "v": [100, 1]}),
+        _token({"d": "n", "v": [100]}),
+        _token({"d": "n", "v": [100, 1, 2]}),
+        _token({"d": "n", "v": ["100; DROP TABLE budget", 1]}),
+        _token({"d": "n", "v": [100, "1"]}),
+        _token(["n", [100, 1]]),
+    ],
+)
+def test_tampered_cursor_is_rejected(app, budgets, token):
+    with pytest.raises(BadRequest):
+        page(app, cursor=token)
@@ -0,0 +1,33 @@
+import pytest
+from models import db
+from services.profiling import query_stats, reset_query_stats
+from listing import LIST_PAGES, ListingWorld, log_in
+
+
+def page_queries(client, role, user_id, url):
+    """Statements run while rendering `url` as `user_id` (after one warm-up request)."""
+    log_in(client, role, user_id)
+    assert client.get(url).status_code == 200
+    reset_query_stats()
+    assert client.get(url).status_code == 200
+    return sum(row["queries"] for row in query_stats())
+
+
+@pytest.mark.parametrize(
+    "role, route",
+    [(role, route) for role, routes in LIST_PAGES.items() for route in routes],
+)
+def test_list_page_query_count_is_constant(app, role, route):
+    client = app.test_client()
+    with app.app_context():
+        world = ListingWorld()
+        url = route.format(cycle_id=world.cycle_id)
+        user_id = world.actors[role]
+        # One proposal per status, then two: both fit on the first page (8 rows)
+        world.add_unit()
+        with_n = page_queries(client, role, user_id, url)
+        world.add_unit()
+        with_2n = page_queries(client, role, user_id, url)
+        db.session.remove()
+    # More rows must not mean more statements (no lazy load per row)
+    assert with_2n == with_n
@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+from models import db, User, Admin, Researcher, GrantCycle, Proposal
+from services.stats import rebuild_dashboard_stats, dashboard_stats, StatusHistogram
+
+
+def _cycle_with_proposals(prefix, faculty):
+    admin, researcher = Admin(mmu_id=f"{prefix}A"), Researcher(mmu_id=f"{prefix}R")
+    db.session.add_all(
+        [
+            User(mmu_id=f"{prefix}A", name="Admin", email=f"{prefix}a@st.mmu.edu.my",
+                 password="-", faculty=faculty, user_role="Admin"),
+            User(mmu_id=f"{prefix}R", name="Researcher", email=f"{prefix}r@st.mmu.edu.my",
+                 password="-", faculty=faculty, user_role="Researcher"),
+            admin,
+            researcher,
+        ]
+    )
+    db.session.flush()
+    cycle = GrantCycle(
+        cycle_name=f"{prefix} cycle",
+        faculty=faculty,
+        start_date=date.today(),
+        end_date=date.today() + timedelta(days=30),
+        admin_id=admin.admin_id,
+    )
+    db.session.add(cycle)
+    db.session.flush()
+    for status, score in [("Submitted", None), ("Passed Screening", None),
+                          ("Passed Screening", 80), ("Approved", 90)]:
+        db.session.add(
+            Proposal(title=f"{prefix} {status}", requested_budget=500, status=status,
+                     review_score=score, researcher=researcher, cycle=cycle)
+        )
+    db.session.commit()
+    return cycle
+
+
+def test_moving_a_cycle_to_another_faculty_moves_its_proposal_counts(db_session):
+    # Start from exact counters, whatever earlier tests' fixtures left behind
+    rebuild_dashboard_stats(db_session)
+    db_session.commit()
+    cycle = _cycle_with_proposals("ST1", "ST1 Before")
+    assert StatusHistogram.from_counters(dashboard_stats("faculty", "ST1 Before")).count() == 4
+
+    cycle.faculty = "ST1 After"
+    # A proposal change in the same flush as the move
+    db_session.add(
+        Proposal(title="ST1 late", requested_budget=500, status="Passed Screening",
+                 researcher_id=cycle.proposals[0].researcher_id, cycle=cycle)
+    )
+    cycle.proposals[0].status = "Under Review"
+    db_session.commit()
+
+    before, after = dashboard_stats("faculty", "ST1 Before"), dashboard_stats("faculty", "ST1 After")
+    assert not any(before.values())
+    assert after["status:Passed Screening"] == 3
+    assert after["unscored"] == 2
+    assert after["cycles"] == 1
+    _, drift = rebuild_dashboard_stats(db_session)
+    assert drift == {}
@@ -0,0 +1,34 @@
+import io
+import os
+import time
+import pytest
+from werkzeug.datastructures import FileStorage
+from services.storage import store_document, collect_garbage
+
+PDF = b"%PDF-1.4\n" + b"x" * 1000
+
+
+@pytest.fixture
+def docs_folder(app, tmp_path, monkeypatch):
+    monkeypatch.setitem(app.config, "UPLOAD_FOLDER_DOCS", str(tmp_path))
+    with app.test_request_context():
+        yield tmp_path
+
+
+def _store(content):
+    return store_document(FileStorage(io.BytesIO(content), filename="proposal.pdf"))
+
+
+def test_reused_file_is_inside_the_grace_period_again(docs_folder, db_session):
+    filename = _store(PDF)
+    path = docs_folder / filename
+    week_ago = time.time() - 7 * 24 * 3600
+    os.utime(path, (week_ago, week_ago))
+    # Unreferenced and old: the collector would take it
+    assert collect_garbage(dry_run=True)[0] == [filename]
+
+    # The same bytes uploaded again (the row referencing it is not committed yet)
+    assert _store(PDF) == filename
+    assert collect_garbage(dry_run=True)[0] == []
+    assert path.stat().st_mtime > week_ago
+    assert [p.name for p in docs_folder.iterdir()] == [filename]
@@ -0,0 +1,64 @@
+import io
+import pytest
+from flask import request
+from services.storage import store_document
+from services.uploads import UploadSpool, UploadRejected, receive_upload
+
+PDF = b"%PDF-1.4\n" + b"x" * 1000
+
+
+@pytest.fixture
+def folders(app, tmp_path, monkeypatch):
+    docs, pictures = tmp_path / "docs", tmp_path / "pictures"
+    docs.mkdir()
+    pictures.mkdir()
+    monkeypatch.setitem(app.config, "UPLOAD_FOLDER_DOCS", str(docs))
+    monkeypatch.setitem(app.config, "UPLOAD_FOLDER", str(pictures))
+    limits = dict(app.config["UPLOAD_SIZE_LIMITS"], jpg=4 * 1024)
+    monkeypatch.setitem(app.config, "UPLOAD_SIZE_LIMITS", limits)
+    return docs, pictures
+
+
+def test_oversized_part_is_refused_while_parsing(app, folders):
+    _, pictures = folders
+    client = app.test_client()
+    with client.session_transaction() as cookie:
+        cookie["user_id"] = "UP0001"
+        cookie["role"] = "Researcher"
+    response = client.post(
+        "/researcher/profile",
+        data={
+            "name": "Uploader",
+            "profile_pic": (io.BytesIO(b"\xff\xd8\xff" + b"x" * 64 * 1024), "me.jpg"),
+        },
+        headers={"Accept": "application/json"},
+    )
+    assert response.status_code == 413
+    assert "limited to" in response.json["error"]
+    assert list(pictures.iterdir()) == []
+
+
+def test_document_is_hashed_while_parsing_and_moved_into_place(app, folders):
+    docs, _ = folders
+    data = {"proposal_file": (io.BytesIO(PDF), "proposal.pdf")}
+    with app.test_request_context("/", method="POST", data=data):
+        upload = request.files["proposal_file"]
+        assert isinstance(upload.stream, UploadSpool)
+        assert upload.stream.size == len(PDF)
+        filename = store_document(upload)
+    assert [p.name for p in docs.iterdir()] == [filename]
+    assert (docs / filename).read_bytes() == PDF
+
+
+def test_unclaimed_and_rejected_spools_are_removed(app, folders):
+    docs, _ = folders
+    data = {
+        "unused": (io.BytesIO(PDF), "unused.pdf"),
+        "fake": (io.BytesIO(b"not a pdf"), "fake.pdf"),
+    }
+    with app.test_request_context("/", method="POST", data=data):
+        with pytest.raises(UploadRejected):
+            receive_upload(request.files["fake"], str(docs), {"pdf"})
+        assert len(list(docs.iterdir())) == 1  # "unused", still open
+        request.close()
+    assert list(docs.iterdir()) == []
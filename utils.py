@@ -3,7 +3,12 @@ import secrets
 import json
 from datetime import datetime, timedelta, timezone
 from flask import current_app, flash, url_for
-from models import db, Notification, Researcher, Proposal, Deadline
+from models import db
+from services.notifications import stage_notifications
+from services.jobs import enqueue
+from services.storage import store_document
+from services.uploads import receive_upload, UploadRejected
+from services.images import store_picture
 
 # ==========================================
 # TIMEZONE HELPERS (Malaysia UTC+8)
@@ -21,60 +26,54 @@ def allowed_file(filename):
     return "." in filename and filename.rsplit(".", 1)[1].lower() in current_app.config["ALLOWED_EXTENSIONS"]
 
 def save_document(form_file):
-    random_hex = secrets.token_hex(8)
-    _, f_ext = os.path.splitext(form_file.filename)
-    doc_fn = random_hex + f_ext
-    doc_path = os.path.join(current_app.config["UPLOAD_FOLDER_DOCS"], doc_fn)
-    form_file.save(doc_path)
+    # Stored under its content hash, so identical uploads share one file
+    doc_fn = store_document(form_file)
+    # Text is pulled out in the background for content search
+    enqueue("extract_document", key=f"extract:{doc_fn}", filename=doc_fn)
     return doc_fn
 
 def save_picture(form_picture):
-    random_hex = secrets.token_hex(8)
-    _, f_ext = os.path.splitext(form_picture.filename)
-    picture_fn = random_hex + f_ext
-    picture_path = os.path.join(current_app.config["UPLOAD_FOLDER"], picture_fn)
-    form_picture.save(picture_path)
+    folder = current_app.config["UPLOAD_FOLDER"]
+    temp_path, _, f_ext = receive_upload(
+        form_picture, folder, current_app.config["IMAGE_EXTENSIONS"]
+    )
+    # Downscaled and re-encoded when Pillow is installed (may change the extension)
+    picture_fn = store_picture(temp_path, folder, secrets.token_hex(8), f_ext)
+    # Avatar thumbnails are built in the background instead of on first view
+    enqueue("build_avatars", filename=picture_fn)
     return picture_fn
 
 # ==========================================
 # NOTIFICATION HELPER
 # ==========================================
-def send_notification(recipient_id, message, link=None, sender_id=None):
-    # Timestamp handles itself via Models default
-    notif = Notification(recipient_id=recipient_id, sender_id=sender_id, message=message, link=link)
-    db.session.add(notif)
-    db.session.commit()
+# Fan-outs larger than this are delivered by a background job
+NOTIFY_INLINE_LIMIT = 25
 
-def check_deadlines_and_notify(user):
+def send_notification(recipient_id, message, link=None, sender_id=None):
     """
-    Checks if the Final Submission Deadline is approaching for Researchers.
-    Uses Malaysia Time for date comparisons.
+    Stages a notification in the current transaction.
+    It is written by the caller's db.session.commit(), so a route that fails
+    and rolls back never leaves an orphan notification behind.
     """
-    if user.user_role == "Researcher":
-        researcher = Researcher.query.filter_by(mmu_id=user.mmu_id).first()
-        if not researcher: return
-
-        # Check Active Proposals with a Final Deadline Set
-        active_proposals = Proposal.query.filter_by(researcher_id=researcher.researcher_id, status="Approved").all()
+    notify_many([recipient_id], message, link, sender_id)
 
-        for prop in active_proposals:
-            deadline = Deadline.query.filter_by(proposal_id=prop.proposal_id, deadline_type="Final Submission").first()
-            
-            if deadline and deadline.due_date:
-                days_left = (deadline.due_date - get_myt_date()).days
-                msg = None
-                
-                if days_left < 0:
-                    msg = f"URGENT: Final submission for '{prop.title}' is OVERDUE (Due: {deadline.due_date})."
-                elif 0 <= days_left <= 7: # Notify 1 week before
-                    msg = f"Reminder: Final submission for '{prop.title}' is due in {days_left} days."
-                
-                if msg:
-                    # Avoid duplicate notifications
-                    if not Notification.query.filter_by(recipient_id=user.mmu_id, message=msg).first():
-                        # We need to import 'researcher_bp' endpoint names carefully or just use string
-                        # Using string endpoint name 'researcher.researcher_submit_form' assuming blueprint name is 'researcher'
-                        send_notification(user.mmu_id, msg, url_for('researcher.researcher_submit_form', cycle_id=prop.cycle_id, proposal_id=prop.proposal_id), "System")
+def notify_many(recipient_ids, message, link=None, sender_id=None):
+    """
+    Stages the same notification for several recipients (duplicates ignored).
+    Everything staged during a request is flushed together at commit time,
+    which the ORM batches into a single multi-row INSERT. Large fan-outs are
+    queued as one job instead, committed (or discarded) with the caller.
+    """
+    # Timestamp handles itself via Models default
+    rows = [
+        dict(recipient_id=recipient_id, sender_id=sender_id, message=message, link=link)
+        for recipient_id in dict.fromkeys(recipient_ids)
+        if recipient_id
+    ]
+    if len(rows) > NOTIFY_INLINE_LIMIT:
+        enqueue("deliver_notifications", rows=rows)
+    else:
+        stage_notifications(rows)
 
 # ==========================================
 # PROFILE HELPER
@@ -87,7 +86,11 @@ def update_user_profile(user, form, files):
     if "profile_pic" in files:
         file = files["profile_pic"]
         if file.filename != "":
-            picture_file = save_picture(file)
+            try:
+                picture_file = save_picture(file)
+            except UploadRejected as e:
+                flash(f"Error: {e}", "error")
+                return False
             user.profile_image = picture_file
 
     new_password = form["new_password"]